@@ -1,14 +1,36 @@
 import time
-import pandas as pd
 import sys
 import os
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+import json
+import math
+import argparse
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import WebDriverException
+from selenium.common.exceptions import WebDriverException, TimeoutException
+
+from pool_navigateurs import PoolNavigateurs, NB_NAVIGATEURS_DEFAUT
+from moteur_http import MoteurHTTP, URL_FICHE, TAILLE_PAGE
+from cache_http import CacheHTTP
+from journal import Journal, nct_depuis_url, SEPARATEUR_MALADIES
+from index_nct import IndexNCT
+from extraction import (
+    analyser_page,
+    analyser_carte,
+    carte_complete,
+    TITRE_INCONNU,
+    STATUT_INCONNU,
+    SPONSOR_INCONNU,
+)
+from recuperation_async import limiteur_pour, MAX_EN_VOL
+from metriques import Metriques
+from attentes import attendre_cartes, attendre_fiche
+from profil_navigateur import PROFILS, PROFIL_DEFAUT
+from gestion_driver import GestionnaireDrivers
+from archive_pages import ArchivePages
+from frontiere import Frontiere, chemin_journal, DOSSIER_FRONTIERE
+
+HOTE = "clinicaltrials.gov"
 
 # ==========================================
 # 🔧 CONFIGURATION DU PROJET
@@ -23,189 +45,738 @@ LISTE_MALADIES = [
 
 NB_PAGES_PAR_MALADIE = 30
 NOM_FICHIER_SORTIE = "data/scraping/FINAL_DATASET_CANCER.csv"
+NOM_FICHIER_PARQUET = "data/scraping/FINAL_DATASET_CANCER.parquet"
+NOM_JOURNAL = "data/scraping/journal_scraping.jsonl"
+NOM_INDEX = "data/scraping/index_nct.json"
+# Mode incrémental : journal et index à part, le run complet n'est jamais touché
+NOM_JOURNAL_INCREMENT = "data/scraping/journal_increment.jsonl"
+NOM_INDEX_INCREMENT = "data/scraping/index_increment.json"
+# Date de dernière mise à jour la plus récente déjà intégrée, par maladie
+NOM_ETAT_INCREMENTAL = "data/scraping/etat_incremental.json"
+# Rapport de performance du run (temps par phase, pages/s, erreurs)
+NOM_RAPPORT = "data/scraping/rapport_run.json"
+# Mode frontière : études prises par lots, attente quand les tâches restantes sont chez d'autres workers
+LOT_ETUDES = 50
+ATTENTE_FRONTIERE = 15
+
+# Les deux lectures d'une même page de liste sont mises en cache séparément
+VUE_LIENS = {"_vue": "liens"}
+VUE_CARTES = {"_vue": "cartes"}
+
+# Lien, titre et texte de chaque carte de la liste (un seul appel au navigateur)
+JS_CARTES = """
+return Array.from(document.querySelectorAll('.usa-card__container')).map(carte => {
+    const lien = carte.querySelector("a[href*='/study/']");
+    return lien ? {href: lien.href, titre: lien.innerText, texte: carte.innerText} : null;
+}).filter(Boolean);
+"""
 
 # ==========================================
 # 🧠 LE ROBOT BLINDÉ
 # ==========================================
 class UltimateScraper:
-    def __init__(self):
+    def __init__(self, nb_workers=1, moteur="selenium", reprise=False, mode_cartes=False, avec_cache=True, fichier_prometheus=None, profil=PROFIL_DEFAUT, archive=None, frontiere=None, incremental=False):
         print("🤖 Initialisation du robot...")
-        self.setup_driver()
-        self.all_data = []
+        # Temps par phase et compteurs, écrits dans NOM_RAPPORT à l'arrêt
+        self.metriques = Metriques()
+        self.fichier_prometheus = fichier_prometheus
+        # nb_workers > 1 : les fiches sont visitées par un pool de navigateurs
+        self.nb_workers = nb_workers
+        # "selenium" : pages rendues dans Chrome / "http" : JSON de l'API, sans navigateur
+        self.moteur = moteur
+        # "leger" : Chrome headless sans images ni traceurs / "complet" : Chrome d'origine
+        self.profil = profil
+        # Mode cartes : champs lus dans la liste, fiche ouverte seulement s'il en manque
+        self.mode_cartes = mode_cartes
+        # Cache disque : un relancement dans le TTL ne recharge aucune page
+        self.cache = CacheHTTP() if avec_cache else None
+        # Archive brute des fiches ("texte" ou "html") pour `archive_pages.py reparse`
+        self.mode_archive = archive
+        self.archive = ArchivePages() if archive else None
+        if moteur == "http":
+            self.moteur_http = MoteurHTTP(
+                max_en_vol=max(MAX_EN_VOL, nb_workers),
+                cache=self.cache,
+                metriques=self.metriques,
+                archive=self.archive,
+            )
+        else:
+            # Navigateurs de rechange déjà démarrés, watchdog sur chaque page.
+            # Plusieurs fenêtres en parallèle : on les cache (le profil léger est toujours headless)
+            self.drivers = GestionnaireDrivers(
+                profil=profil, headless=nb_workers > 1, metriques=self.metriques
+            )
+            # Navigateur principal (listes, mode séquentiel) démarré à la première page
+            self.driver = None
+
+        # Frontière partagée (frontiere.Frontiere) : un journal par worker, jamais réinitialisé
+        self.frontiere = frontiere
+        nom_index = NOM_INDEX_INCREMENT if incremental else NOM_INDEX
+        if frontiere:
+            nom_journal, reprise = chemin_journal(frontiere.dossier, frontiere.proprietaire), True
+        elif incremental:
+            nom_journal = NOM_JOURNAL_INCREMENT
+        else:
+            nom_journal = NOM_JOURNAL
+
+        # Chaque essai est écrit dans le journal dès sa récupération
+        self.journal = Journal(nom_journal, reprise=reprise)
+        self.deja_faits = self.journal.ids_traites() if reprise else set()
+        # Toutes les études vues dans les listes, chacune visitée une seule fois
+        self.index = IndexNCT(nom_index, reprise=reprise)
+        if reprise:
+            print(f"♻️ Reprise : {len(self.deja_faits)} essais déjà dans le journal.")
+        self.nb_enregistres = 0
 
     def setup_driver(self):
-        """Configure et lance Chrome (utilisé au début et pour redémarrer)"""
-        self.options = webdriver.ChromeOptions()
-        # self.options.add_argument("--headless") # Décommente pour mode sans fenêtre
-        self.options.add_argument("--window-size=1920,1080")
-        # Anti-detection basique
-        self.options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-        
+        """Prend un Chrome prêt à l'emploi (au début et pour redémarrer)"""
         try:
-            self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=self.options)
+            self.driver = self.creer_driver()
         except Exception as e:
+            self.driver = None
             print(f"❌ Erreur au lancement du driver: {e}")
 
-    def verifier_et_reparer_driver(self):
-        """Vérifie si Chrome est vivant. Si non, le relance."""
+    def creer_driver(self):
+        """Fournit un Chrome déjà démarré (un par worker en mode pool)"""
+        return self.drivers.prendre()
+
+    def reparer_driver(self):
+        """Le navigateur a échoué : on le remplace par un navigateur de rechange"""
+        print("\n🚑 ALERTE : Le navigateur ne répond plus ! Redémarrage d'urgence...")
         try:
-            # On essaie une commande simple pour voir si ça répond
-            self.driver.current_url
-        except:
-            print("\n🚑 ALERTE : Le navigateur ne répond plus ! Redémarrage d'urgence...")
+            self.driver = self.drivers.remplacer(self.driver) if self.driver else self.creer_driver()
+        except Exception as e:
+            self.driver = None
+            print(f"❌ Erreur au lancement du driver: {e}")
+            return
+        print("✅ Navigateur relancé. On reprend.")
+
+    def liberer_driver(self):
+        """Ferme le navigateur principal, relancé par avec_driver au besoin"""
+        if self.driver is not None:
             try:
                 self.driver.quit()
-            except:
+            except Exception:
                 pass
-            # On relance
+            self.driver = None
+
+    def avec_driver(self, action):
+        """Exécute action(driver) sous watchdog.
+
+        Pas de vérification avant chaque page : le navigateur n'est relancé
+        (une fois, puis on réessaie) que si l'action elle-même a échoué.
+        Un simple timeout d'attente n'est pas un plantage et remonte tel quel.
+        Toute autre erreur relance le navigateur, comme dans le pool : un
+        chromedriver mort lève des erreurs urllib3 (MaxRetryError,
+        ProtocolError), pas des WebDriverException.
+        """
+        if self.driver is None:
             self.setup_driver()
-            print("✅ Navigateur relancé. On reprend.")
-
-    def recuperer_urls_dune_page(self, maladie, page_num):
-        # Vérification santé avant d'agir
-        self.verifier_et_reparer_driver()
-        
-        url = f"https://clinicaltrials.gov/search?cond={maladie.replace(' ', '%20')}&viewType=Card&page={page_num}"
-        
         try:
-            self.driver.get(url)
-            urls_page = []
-            
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".usa-card__container"))
-            )
-            time.sleep(2)
-            
-            elements = self.driver.find_elements(By.XPATH, "//a[contains(@href, '/study/')]")
-            for el in elements:
-                href = el.get_attribute('href')
-                if href and "/study/" in href and "#" not in href:
-                    if href not in urls_page:
-                        urls_page.append(href)
-            
-            print(f"   PAGE {page_num}: {len(urls_page)} liens trouvés.")
-            return urls_page
-            
+            return self.drivers.surveiller(self.driver, action)
+        except TimeoutException:
+            raise
         except Exception:
-            # Si ça plante sur une page liste, on retourne vide et on continue
-            return []
-
-    def aspirer_details_fiche(self, url, maladie):
-        # Vérification santé avant d'agir
-        self.verifier_et_reparer_driver()
-        
-        info = {
+            self.reparer_driver()
+            return self.drivers.surveiller(self.driver, action)
+
+    def url_liste(self, maladie, page_num):
+        return f"https://clinicaltrials.gov/search?cond={maladie.replace(' ', '%20')}&viewType=Card&page={page_num}"
+
+    def charger_page_liste(self, url):
+        """Ouvre une page de résultats (vue Card) et attend que toutes les cartes soient là"""
+        def charger(driver):
+            with self.metriques.mesurer("limitation"):
+                limiteur_pour(HOTE).attendre()
+            with self.metriques.mesurer("navigation"):
+                driver.get(url)
+
+            # Plus de pause fixe : on attend que le nombre de cartes soit stable
+            with self.metriques.mesurer("attente"):
+                attendre_cartes(driver, metriques=self.metriques)
+
+        self.avec_driver(charger)
+        self.metriques.incrementer("pages_liste")
+
+    def recuperer_urls_dune_page(self, maladie, page_num, lever=False):
+        """Liens des études d'une page de liste ; en cas d'erreur : [] (ou l'exception si lever)"""
+        url = self.url_liste(maladie, page_num)
+        urls_page = self.cache.lire_json(url, VUE_LIENS) if self.cache else None
+
+        if urls_page is None:
+            try:
+                self.charger_page_liste(url)
+                urls_page = []
+                
+                with self.metriques.mesurer("analyse"):
+                    elements = self.driver.find_elements(By.XPATH, "//a[contains(@href, '/study/')]")
+                    for el in elements:
+                        href = el.get_attribute('href')
+                        if href and "/study/" in href and "#" not in href:
+                            if href not in urls_page:
+                                urls_page.append(href)
+                
+            except Exception:
+                # Si ça plante sur une page liste, on retourne vide et on continue
+                self.metriques.incrementer("erreurs")
+                if lever:
+                    raise
+                return []
+
+            if self.cache and urls_page:
+                self.cache.ecrire_json(url, urls_page, VUE_LIENS)
+        else:
+            self.metriques.incrementer("cache_hits")
+
+        print(f"   PAGE {page_num}: {len(urls_page)} liens trouvés.")
+        return urls_page
+
+    def recuperer_cartes_dune_page(self, maladie, page_num):
+        """Lit toutes les cartes de la page en un seul aller-retour JavaScript"""
+        url = self.url_liste(maladie, page_num)
+        brutes = self.cache.lire_json(url, VUE_CARTES) if self.cache else None
+
+        if brutes is None:
+            try:
+                self.charger_page_liste(url)
+                with self.metriques.mesurer("analyse"):
+                    brutes = self.driver.execute_script(JS_CARTES)
+            except Exception:
+                # Si ça plante sur une page liste, on retourne vide et on continue
+                self.metriques.incrementer("erreurs")
+                return []
+
+            if self.cache and brutes:
+                self.cache.ecrire_json(url, brutes, VUE_CARTES)
+        else:
+            self.metriques.incrementer("cache_hits")
+
+        cartes = []
+        vues = set()
+        with self.metriques.mesurer("analyse"):
+            for brute in brutes:
+                href = brute["href"]
+                if "#" in href or href in vues:
+                    continue
+                vues.add(href)
+                carte = analyser_carte(href, brute["titre"], brute["texte"])
+                carte["URL"] = href
+                cartes.append(carte)
+
+        print(f"   PAGE {page_num}: {len(cartes)} cartes lues.")
+        return cartes
+
+    def aspirer_details_fiche(self, url, maladie, en_echec=None):
+        try:
+            return self.avec_driver(lambda driver: self.lire_fiche(driver, url, maladie))
+        except Exception as e:
+            print(f"      ❌ Erreur fiche (passé): {e}")
+            self.metriques.incrementer("erreurs")
+            return (en_echec or self.fiche_vide)(url, maladie)
+
+    def fiche_vide(self, url, maladie):
+        return {
             "Maladie": maladie,
-            "Titre": "Titre Inconnu",
-            "Statut": "Inconnu",
-            "Sponsor": "Non spécifié",
+            "Titre": TITRE_INCONNU,
+            "Statut": STATUT_INCONNU,
+            "Sponsor": SPONSOR_INCONNU,
             "URL": url
         }
 
-        try:
-            self.driver.get(url)
-            
-            # Attente chargement
-            WebDriverWait(self.driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            time.sleep(0.5)
-
-            # 1. TITRE
-            titre_page = self.driver.title
-            if "-" in titre_page:
-                info["Titre"] = titre_page.rsplit('-', 1)[0].strip()
-            else:
-                info["Titre"] = titre_page
-
-            # 2. SCANNER LE TEXTE
-            texte_brut = self.driver.find_element(By.TAG_NAME, "body").text
-            lignes = texte_brut.split('\n')
-
-            # Recherche du STATUT
-            if "Recruiting" in texte_brut: info["Statut"] = "Recruiting"
-            elif "Completed" in texte_brut: info["Statut"] = "Completed"
-            elif "Active, not recruiting" in texte_brut: info["Statut"] = "Active"
-            elif "Terminated" in texte_brut: info["Statut"] = "Terminated"
-            elif "Withdrawn" in texte_brut: info["Statut"] = "Withdrawn"
-
-            # Recherche du SPONSOR
-            for i, ligne in enumerate(lignes):
-                ligne = ligne.strip()
-                if ligne.startswith("Lead Sponsor") or ligne.startswith("Responsible Party") or ligne.startswith("Sponsor"):
-                    if ":" in ligne:
-                        try:
-                            candidat = ligne.split(":", 1)[1].strip()
-                            if len(candidat) > 2:
-                                info["Sponsor"] = candidat
-                                break
-                        except: pass
-                    elif i + 1 < len(lignes):
-                        candidat_next = lignes[i+1].strip()
-                        if len(candidat_next) > 2 and "NCT" not in candidat_next:
-                            info["Sponsor"] = candidat_next
-                            break
-                            
-            print(f"      ✅ Sponsor: {info['Sponsor']}")
+    def lire_fiche(self, driver, url, maladie):
+        """Lit une fiche avec le driver donné.
 
-        except Exception as e:
-            print(f"      ❌ Erreur fiche (passé): {e}")
+        Un timeout garde les valeurs par défaut ; toute autre erreur du
+        navigateur remonte pour que l'appelant puisse le redémarrer.
+        """
+        info = self.fiche_vide(url, maladie)
+
+        # Clé de cache sans les paramètres de recherche (rank, page...) qui varient d'un run à l'autre
+        cle = URL_FICHE.format(nct_id=nct_depuis_url(url))
+        page = self.cache.lire_json(cle) if self.cache else None
+
+        if page is None:
+            # Débit partagé par tous les navigateurs du pool
+            with self.metriques.mesurer("limitation"):
+                limiteur_pour(HOTE).attendre()
+            with self.metriques.mesurer("navigation"):
+                driver.get(url)
+
+            # Attente chargement : sponsor et statut affichés (repli borné sinon)
+            try:
+                with self.metriques.mesurer("attente"):
+                    attendre_fiche(driver, metriques=self.metriques)
+            except TimeoutException as e:
+                print(f"      ❌ Erreur fiche (passé): {e}")
+                self.metriques.incrementer("timeouts")
+                return info
+
+            with self.metriques.mesurer("lecture"):
+                page = {
+                    "titre": driver.title,
+                    "texte": driver.find_element(By.TAG_NAME, "body").text,
+                }
+            self.metriques.incrementer("fiches")
+            if self.cache:
+                self.cache.ecrire_json(cle, page)
+            if self.archive:
+                brute = {**page, "html": driver.page_source} if self.mode_archive == "html" else page
+                self.archive.ajouter(url, maladie, brute)
+        else:
+            self.metriques.incrementer("cache_hits")
+            if self.archive and not self.archive.contient(nct_depuis_url(url)):
+                self.archive.ajouter(url, maladie, page)
 
+        with self.metriques.mesurer("analyse"):
+            info.update(analyser_page(page))
+
+        print(f"      ✅ Sponsor: {info['Sponsor']}")
         return info
 
+    def enregistrer(self, donnees):
+        """Point d'écriture unique (appelé par le thread écrivain en mode pool)"""
+        # Toutes les maladies sous lesquelles l'étude apparaît
+        donnees["Maladies"] = (self.frontiere or self.index).maladies(nct_depuis_url(donnees["URL"]))
+
+        # SÉCURITÉ : chaque essai est ajouté au journal, rien n'est réécrit
+        with self.metriques.mesurer("sauvegarde"):
+            self.journal.ecrire(donnees)
+        self.nb_enregistres += 1
+
+    def enregistrer_cartes_completes(self, taches):
+        """Enregistre les études dont la carte suffit ; renvoie celles à visiter"""
+        a_visiter = []
+        for lien, maladie in taches:
+            carte = self.index.carte(nct_depuis_url(lien))
+            if carte_complete(carte):
+                self.enregistrer({**self.fiche_vide(lien, maladie), **carte})
+            else:
+                a_visiter.append((lien, maladie))
+
+        print(f"\n🃏 {len(taches) - len(a_visiter)} études complètes depuis les cartes.")
+        return a_visiter
+
+    def recuperer_liens(self, maladie):
+        if self.moteur == "http":
+            return self.moteur_http.lister_etudes(maladie, NB_PAGES_PAR_MALADIE)
+
+        liens_a_visiter = []
+        for page in range(1, NB_PAGES_PAR_MALADIE + 1):
+            liens = self.recuperer_urls_dune_page(maladie, page)
+            liens_a_visiter.extend(liens)
+        return liens_a_visiter
+
+    def recuperer_cartes(self, maladie):
+        """Mode cartes : liens + champs visibles dans la liste de résultats"""
+        if self.moteur == "http":
+            return self.moteur_http.lister_cartes(maladie, NB_PAGES_PAR_MALADIE)
+
+        cartes = []
+        for page in range(1, NB_PAGES_PAR_MALADIE + 1):
+            cartes.extend(self.recuperer_cartes_dune_page(maladie, page))
+        return cartes
+
+    def visiter_fiches(self, taches, ecrire=None, en_echec=None):
+        """Visite les fiches (lien, maladie), en séquentiel ou avec le pool de navigateurs.
+
+        ecrire(info) reçoit chaque résultat (par défaut : enregistrer) et
+        en_echec(lien, maladie) fournit celui d'une fiche illisible (par
+        défaut : fiche_vide ; None pour ne rien écrire).
+        """
+        ecrire = ecrire or self.enregistrer
+        en_echec = en_echec or self.fiche_vide
+        if self.moteur == "http":
+            # Pas de navigateur : requêtes asyncio concurrentes, au débit autorisé
+            self.moteur_http.lire_fiches(taches, ecrire, en_echec)
+            return
+
+        if self.nb_workers <= 1:
+            for lien, maladie in taches:
+                ecrire(self.aspirer_details_fiche(lien, maladie, en_echec))
+            return
+
+        # Le navigateur des listes resterait inactif pendant le pool : on le ferme
+        self.liberer_driver()
+        pool = PoolNavigateurs(
+            creer_driver=self.creer_driver,
+            # Le watchdog transforme un navigateur bloqué en échec : le pool le redémarre
+            traiter=lambda driver, tache: self.drivers.surveiller(
+                driver, lambda d: self.lire_fiche(d, *tache)
+            ),
+            ecrire=ecrire,
+            nb_workers=self.nb_workers,
+            en_echec=lambda tache: en_echec(*tache),
+        )
+        for tache in taches:
+            pool.ajouter(tache)
+
+        print(f"   🏭 Pool de {pool.nb_workers} navigateurs lancé.")
+        try:
+            pool.executer()
+        finally:
+            self.metriques.incrementer("redemarrages", pool.nb_redemarrages)
+        if pool.nb_redemarrages:
+            print(f"   🚑 {pool.nb_redemarrages} redémarrage(s) de navigateur.")
+
     def lancer_mission(self):
         try:
             # Si un fichier existe déjà, on prévient (pour ne pas écraser bêtement si tu relances)
             if os.path.exists(NOM_FICHIER_SORTIE):
                 print(f"⚠️ Attention : Le fichier {NOM_FICHIER_SORTIE} existe déjà.")
             
-            compteur_total = 0
-            
+            # ÉTAPE 1 : Récupérer les liens de toutes les maladies (index dédoublonné)
             for maladie in LISTE_MALADIES:
                 print(f"\n🔬 TRAITEMENT DE : {maladie}")
                 print("="*40)
-                
-                # ÉTAPE 1 : Récupérer les liens
-                liens_a_visiter = []
-                for page in range(1, NB_PAGES_PAR_MALADIE + 1):
-                    liens = self.recuperer_urls_dune_page(maladie, page)
-                    liens_a_visiter.extend(liens)
-                
-                print(f"   👉 Total à analyser : {len(liens_a_visiter)} liens.")
-                
-                # ÉTAPE 2 : Visiter chaque lien
-                for index, lien in enumerate(liens_a_visiter):
-                    donnees = self.aspirer_details_fiche(lien, maladie)
-                    self.all_data.append(donnees)
-                    compteur_total += 1
-                    
-                    # SÉCURITÉ : Sauvegarde tous les 10 essais !
-                    if compteur_total % 10 == 0:
-                        self.sauvegarder()
-                
-                # Sauvegarde aussi à la fin de chaque maladie
-                self.sauvegarder()
+
+                if self.index.est_listee(maladie):
+                    print("   ♻️ Liste déjà récupérée (reprise).")
+                    continue
+
+                if self.mode_cartes:
+                    cartes = self.recuperer_cartes(maladie)
+                    liens = [carte.pop("URL") for carte in cartes]
+                else:
+                    liens = self.recuperer_liens(maladie)
+                    cartes = [None] * len(liens)
+                nouveaux = sum(
+                    self.index.ajouter(lien, maladie, carte)
+                    for lien, carte in zip(liens, cartes)
+                )
+                self.index.marquer_listee(maladie)
+                print(f"   👉 {len(liens)} liens, dont {nouveaux} études pas encore vues.")
+
+            # ÉTAPE 2 : Visiter chaque étude une seule fois
+            taches = self.index.taches(self.deja_faits)
+            if self.deja_faits:
+                print(f"\n♻️ {len(self.index) - len(taches)} études déjà faites, ignorées.")
+            if self.mode_cartes:
+                taches = self.enregistrer_cartes_completes(taches)
+            print(f"\n👉 Total à analyser : {len(taches)} études uniques.")
+            self.visiter_fiches(taches)
+
+            # Le CSV final est reconstruit une seule fois, à partir du journal
+            self.sauvegarder()
 
         except KeyboardInterrupt:
             print("\n🛑 Arrêt manuel demandé. Sauvegarde en cours...")
             self.sauvegarder()
             
         finally:
-            if hasattr(self, 'driver'):
-                self.driver.quit()
-            print("\n👋 Robot arrêté.")
+            self.arreter()
+
+    def lancer_increment(self):
+        """Ne visite que les études nouvelles ou modifiées depuis le dernier run"""
+        etat = {}
+        if os.path.exists(NOM_ETAT_INCREMENTAL):
+            with open(NOM_ETAT_INCREMENTAL, encoding="utf-8") as f:
+                etat = json.load(f)
+        nouvel_etat = dict(etat)
+
+        # Les dates de mise à jour viennent de l'API, quel que soit le moteur des fiches.
+        # Pas de cache ici : la liste doit refléter l'état actuel du registre.
+        listeur = MoteurHTTP()
+        try:
+            for maladie in LISTE_MALADIES:
+                depuis = etat.get(maladie)
+                print(f"\n🔬 MISES À JOUR DE : {maladie} (depuis {depuis or 'le début'})")
+                print("="*40)
+
+                try:
+                    etudes = listeur.lister_mises_a_jour(
+                        maladie, depuis, None if depuis else NB_PAGES_PAR_MALADIE
+                    )
+                except Exception as e:
+                    # Liste incomplète : repère inchangé, la maladie sera relistée au prochain run
+                    print(f"   ❌ Liste interrompue ({e}) : {maladie} ignorée, repère conservé.")
+                    continue
+                for lien, _ in etudes:
+                    self.index.ajouter(lien, maladie)
+                dates = [date for _, date in etudes if date]
+                if dates:
+                    nouvel_etat[maladie] = max(dates)
+                print(f"   👉 {len(etudes)} études nouvelles ou modifiées.")
+            # Pour --incremental --resume : seules ces études seront reprises
+            self.index.sauvegarder()
+
+            taches = self.index.taches(self.deja_faits)
+            print(f"\n👉 Total à analyser : {len(taches)} études uniques.")
+
+            # Une fiche illisible n'est pas journalisée : la fusion garderait sinon
+            # une ligne vide à la place de la ligne connue. Ses maladies gardent leur repère.
+            incompletes = set()
+
+            def en_echec(lien, maladie):
+                incompletes.update(self.index.maladies(nct_depuis_url(lien)).split(SEPARATEUR_MALADIES))
+                return None
+
+            def ecrire(info):
+                if info is None:
+                    return
+                # Timeout Selenium : fiche_vide renvoyée sans erreur
+                if info == self.fiche_vide(info["URL"], info["Maladie"]):
+                    en_echec(info["URL"], info["Maladie"])
+                    return
+                self.enregistrer(info)
+
+            self.visiter_fiches(taches, ecrire, en_echec)
+            for maladie in incompletes:
+                if maladie in etat:
+                    nouvel_etat[maladie] = etat[maladie]
+                else:
+                    nouvel_etat.pop(maladie, None)
+            if incompletes:
+                print(f"⚠️ Fiches illisibles : repère conservé pour {', '.join(sorted(incompletes))}.")
+
+            # Fusion dans le jeu existant, puis seulement on avance les repères
+            with self.metriques.mesurer("compaction"):
+                nb_lignes = self.journal.fusionner(NOM_FICHIER_SORTIE, NOM_FICHIER_PARQUET)
+            print(f"💾 Sauvegarde ({nb_lignes} lignes)...")
+            with open(NOM_ETAT_INCREMENTAL, "w", encoding="utf-8") as f:
+                json.dump(nouvel_etat, f, ensure_ascii=False, indent=2)
+
+        except KeyboardInterrupt:
+            print("\n🛑 Arrêt manuel demandé. Rien n'est fusionné : relancer avec --incremental --resume.")
+
+        finally:
+            listeur.fermer()
+            self.arreter()
+
+    def lancer_frontiere(self, conditions, nb_pages_max):
+        """Vide la frontière partagée avec les autres workers (processus ou machines).
+
+        Priorité aux études déjà trouvées, puis aux pages de liste, puis aux
+        nouvelles conditions. Le CSV final se construit avec
+        `python scripts/frontiere.py compacter` une fois la frontière vide.
+        """
+        frontiere = self.frontiere
+        # Nombre de résultats d'une condition : lu dans l'API quel que soit le moteur
+        self.compteur = getattr(self, "moteur_http", None) or MoteurHTTP()
+        ajoutees = sum(frontiere.ajouter_condition(maladie) for maladie in conditions)
+        print(f"🧭 Frontière {frontiere.dossier} : {ajoutees} nouvelles conditions, worker {frontiere.proprietaire}")
+        try:
+            while True:
+                etudes = frontiere.prendre("etude", LOT_ETUDES)
+                if etudes:
+                    self.traiter_etudes_frontiere(etudes)
+                    continue
+                listes = frontiere.prendre("page") or frontiere.prendre("condition")
+                if listes:
+                    self.traiter_liste_frontiere(listes[0], nb_pages_max)
+                    continue
+                restantes = frontiere.restantes()
+                if not restantes:
+                    break
+                print(f"   ⏳ {restantes} tâches en cours chez d'autres workers ou en attente de réessai...")
+                time.sleep(ATTENTE_FRONTIERE)
+            print("\n✅ Frontière vide. CSV final : python scripts/frontiere.py compacter")
+
+        except KeyboardInterrupt:
+            print("\n🛑 Arrêt manuel : les tâches prises seront reprises à l'expiration de leur bail.")
+
+        finally:
+            if self.compteur is not getattr(self, "moteur_http", None):
+                self.compteur.fermer()
+            self.arreter()
+
+    def traiter_liste_frontiere(self, tache, nb_pages_max):
+        """Condition ou page de liste -> tâches d'études (et page suivante)"""
+        frontiere = self.frontiere
+        print(f"\n🔬 {tache.maladie}" + (f" - page {tache.page}" if tache.page else ""))
+        try:
+            if tache.genre == "condition" and self.moteur == "http":
+                # L'API pagine elle-même : toute la condition en une tâche.
+                # Une page en erreur fait échouer la tâche, qui sera retentée.
+                # Bail prolongé à chaque page : la liste peut durer plus que DUREE_BAIL.
+                liens = self.moteur_http.lister_etudes(
+                    tache.maladie, nb_pages_max, lever=True,
+                    apres_page=lambda: frontiere.prolonger([tache.cle]),
+                )
+            elif tache.genre == "condition":
+                # Seulement les pages qui existent : une page au-delà de la dernière
+                # n'a pas de cartes et finirait en échec après ses tentatives
+                nb_pages = math.ceil(self.compteur.compter_etudes(tache.maladie) / TAILLE_PAGE)
+                if nb_pages_max is not None:
+                    nb_pages = min(nb_pages, nb_pages_max)
+                for page in range(1, nb_pages + 1):
+                    frontiere.ajouter_page(tache.maladie, page)
+                print(f"   📄 {nb_pages} pages de liste ajoutées.")
+                liens = []
+            else:
+                liens = self.recuperer_urls_dune_page(tache.maladie, tache.page, lever=True)
+            nouveaux = sum(frontiere.ajouter_etude(lien, tache.maladie) for lien in liens)
+            frontiere.terminer(tache.cle)
+            if liens:
+                print(f"   👉 {len(liens)} liens, dont {nouveaux} études pas encore vues.")
+        except Exception as e:
+            print(f"   ❌ {tache.cle} rendue à la frontière : {e}")
+            frontiere.echouer(tache.cle, e)
+
+    def traiter_etudes_frontiere(self, etudes):
+        """Lit un lot d'études ; chacune est marquée faite dès son écriture"""
+        frontiere = self.frontiere
+        print(f"\n👉 Lot de {len(etudes)} études.")
+        # Le lot peut durer plus que DUREE_BAIL : bail des études restantes prolongé à chaque fiche
+        en_attente = {tache.cle for tache in etudes}
+
+        def avancer(nct_id):
+            en_attente.discard(nct_id)
+            frontiere.prolonger(list(en_attente))
+
+        def ecrire(info):
+            if info is None:
+                return
+            nct_id = nct_depuis_url(info["URL"])
+            # Timeout Selenium : fiche_vide renvoyée sans erreur, l'étude sera retentée
+            if info == self.fiche_vide(info["URL"], info["Maladie"]):
+                frontiere.echouer(nct_id, "Fiche vide (timeout)")
+            else:
+                self.enregistrer(info)
+                frontiere.terminer(nct_id)
+            avancer(nct_id)
+
+        def en_echec(lien, maladie):
+            frontiere.echouer(nct_depuis_url(lien), "Fiche illisible")
+            avancer(nct_depuis_url(lien))
+            return None
+
+        self.visiter_fiches([(tache.url, tache.maladie) for tache in etudes], ecrire, en_echec)
+
+    def arreter(self):
+        self.journal.fermer()
+        if self.frontiere:
+            self.frontiere.fermer()
+        if getattr(self, 'driver', None):
+            self.driver.quit()
+        if hasattr(self, 'drivers'):
+            self.drivers.fermer()
+        if hasattr(self, 'moteur_http'):
+            self.moteur_http.fermer()
+        if self.cache:
+            self.cache.fermer()
+        if self.archive:
+            self.archive.fermer()
+        self.ecrire_rapport()
+        print("\n👋 Robot arrêté.")
+
+    def ecrire_rapport(self):
+        """Rapport JSON du run (et fichier texte Prometheus si demandé)"""
+        self.metriques.afficher()
+        os.makedirs(os.path.dirname(NOM_RAPPORT), exist_ok=True)
+        self.metriques.ecrire_json(NOM_RAPPORT)
+        print(f"📊 Rapport de performance : {NOM_RAPPORT}")
+        if self.fichier_prometheus:
+            self.metriques.ecrire_prometheus(self.fichier_prometheus)
 
     def sauvegarder(self):
-        if self.all_data:
-            df = pd.DataFrame(self.all_data)
-            cols = ["Maladie", "Sponsor", "Statut", "Titre", "URL"]
-            cols_finales = [c for c in cols if c in df.columns]
-            df = df[cols_finales]
-            
-            df.to_csv(NOM_FICHIER_SORTIE, index=False, encoding='utf-8-sig')
-            print(f"💾 Sauvegarde auto ({len(df)} lignes)...")
+        """Compacte le journal en CSV + Parquet"""
+        with self.metriques.mesurer("compaction"):
+            nb_lignes = self.journal.compacter(NOM_FICHIER_SORTIE, NOM_FICHIER_PARQUET)
+        if nb_lignes:
+            print(f"💾 Sauvegarde ({nb_lignes} lignes, dont {self.nb_enregistres} ce run)...")
 
 # ==========================================
 # 🚀 LANCEMENT
 # ==========================================
 if __name__ == "__main__":
-    bot = UltimateScraper()
-    bot.lancer_mission()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Scraping ClinicalTrials.gov")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="?",
+        default=1,
+        const=NB_NAVIGATEURS_DEFAUT,
+        help=f"Mode pool : N navigateurs en parallèle pour les fiches (sans valeur : {NB_NAVIGATEURS_DEFAUT} = nb de cœurs)",
+    )
+    parser.add_argument(
+        "--moteur",
+        choices=["selenium", "http"],
+        default="selenium",
+        help="selenium : pages rendues dans Chrome / http : JSON de l'API ClinicalTrials.gov, sans navigateur",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Reprend un run interrompu : ignore les essais déjà présents dans le journal",
+    )
+    parser.add_argument(
+        "--cartes",
+        action="store_true",
+        help="Mode rapide : lit les champs dans les cartes de la liste, n'ouvre une fiche que s'il en manque",
+    )
+    parser.add_argument(
+        "--sans-cache",
+        action="store_true",
+        help="Ignore le cache disque (data/cache_http) et recharge toutes les pages",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Ne récupère que les études nouvelles ou modifiées depuis le dernier run et les fusionne dans le CSV",
+    )
+    parser.add_argument(
+        "--profil",
+        choices=PROFILS,
+        default=PROFIL_DEFAUT,
+        help="complet (défaut) : Chrome avec fenêtre, comme avant / leger : Chrome headless, chargement eager, sans images, polices ni traceurs",
+    )
+    parser.add_argument(
+        "--archive",
+        nargs="?",
+        choices=["texte", "html"],
+        const="texte",
+        default=None,
+        help="Archive brute des fiches (data/archive_pages, zstd) pour les ré-extraire sans réseau ; 'html' garde aussi le code source",
+    )
+    parser.add_argument(
+        "--frontiere",
+        nargs="?",
+        const=DOSSIER_FRONTIERE,
+        metavar="DOSSIER",
+        help=f"Frontière partagée (défaut : {DOSSIER_FRONTIERE}) : plusieurs processus ou machines la vident ensemble",
+    )
+    parser.add_argument(
+        "--conditions",
+        metavar="FICHIER",
+        help="Avec --frontiere : conditions à ajouter, une par ligne (défaut : LISTE_MALADIES)",
+    )
+    parser.add_argument(
+        "--pages-max",
+        type=int,
+        default=NB_PAGES_PAR_MALADIE,
+        help=f"Avec --frontiere : pages de liste max par condition, 0 = toutes (défaut : {NB_PAGES_PAR_MALADIE})",
+    )
+    parser.add_argument(
+        "--worker-id",
+        help="Avec --frontiere : identifiant du worker (défaut : machine-pid)",
+    )
+    parser.add_argument(
+        "--prometheus",
+        metavar="FICHIER",
+        help=f"Écrit aussi les métriques du run au format texte Prometheus (en plus de {NOM_RAPPORT})",
+    )
+    args = parser.parse_args()
+
+    bot = UltimateScraper(
+        nb_workers=args.workers,
+        moteur=args.moteur,
+        reprise=args.resume,
+        mode_cartes=args.cartes,
+        # En incrémental, une fiche modifiée ne doit pas être servie depuis le cache
+        avec_cache=not (args.sans_cache or args.incremental),
+        fichier_prometheus=args.prometheus,
+        profil=args.profil,
+        archive=args.archive,
+        incremental=args.incremental,
+        frontiere=Frontiere(args.frontiere, proprietaire=args.worker_id) if args.frontiere else None,
+    )
+    if args.frontiere:
+        conditions = LISTE_MALADIES
+        if args.conditions:
+            with open(args.conditions, encoding="utf-8") as f:
+                conditions = [ligne.strip() for ligne in f if ligne.strip()]
+        bot.lancer_frontiere(conditions, args.pages_max or None)
+    elif args.incremental:
+        bot.lancer_increment()
+    else:
+        bot.lancer_mission()
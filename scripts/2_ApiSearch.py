@@ -1,55 +1,113 @@
-import requests
+import sys
+import asyncio
+import argparse
+import datetime
 import pandas as pd
-import time
 
-LISTE_MALADIES = [
-    "Lung Cancer", 
-    "Breast Cancer", 
-    "Pancreatic Cancer", 
-    "Leukemia", 
-    "Prostate Cancer"
-]
+from cache_http import CacheHTTP
+from pubmed import ClientPubMed, MemoComptes, compter_fenetres, fenetre_annee, terme_maladie, LISTE_MALADIES
 
 ANNEE = 2024
-resultats_api = []
 
-print("🌍 Interrogation de l'API PubMed (NCBI)...")
+# Mode série (--series) : une ligne par (maladie, année)
+FICHIER_SERIE = "data/publications_by_year.csv"
 
-for maladie in LISTE_MALADIES:
+
+async def compter_publications(client, maladie):
     # On construit la requête : Cherche "Lung Cancer" ET "2024"
     term = f'"{maladie}"[Title/Abstract] AND {ANNEE}[Date - Publication]'
-    
-    # URL de l'API publique (E-utilities)
-    url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
-    params = {
-        "db": "pubmed",
-        "term": term,
-        "retmode": "json"
-    }
-    
+
     try:
-        reponse = requests.get(url, params=params)
-        data = reponse.json()
-        
-        # Le nombre total est dans 'count'
-        nb_articles = data['esearchresult']['count']
+        nb_articles = await client.compter(term)
         print(f"   > {maladie} : {nb_articles} articles scientifiques trouvés.")
-        
-        resultats_api.append({
+
+        return {
             "Maladie": maladie,
             "Nb_Publications_2024": nb_articles,
             "Source_API": "PubMed NCBI"
-        })
-        
+        }
+
     except Exception as e:
+        # Pas de 0 par défaut : une maladie en échec ne doit pas ressembler à une maladie sans publication
         print(f"   ❌ Erreur pour {maladie}: {e}")
-        resultats_api.append({"Maladie": maladie, "Nb_Publications_2024": 0})
-    
-    time.sleep(1) # Petite pause pour respecter l'API
+        return {"Maladie": maladie, "Erreur": f"{type(e).__name__}: {e}"}
+
+
+async def interroger_pubmed():
+    # Quota NCBI appliqué par le client (3 req/s, 10 avec NCBI_API_KEY) : plus besoin de pause fixe.
+    # Un relancement dans le TTL du cache ne fait aucun appel réseau.
+    cache = CacheHTTP()
+    client = ClientPubMed(cache=cache)
+    try:
+        return await asyncio.gather(
+            *(compter_publications(client, maladie) for maladie in LISTE_MALADIES)
+        )
+    finally:
+        client.fermer()
+        cache.fermer()
+
+
+def serie_publications(annees):
+    """Table longue (Maladie, Annee, Nb_Publications) : toutes les paires lancées en parallèle.
+
+    Les nombres déjà connus viennent du mémo (data/cache_pubmed.sqlite) :
+    un relancement ne redemande que l'année en cours, après son TTL.
+    """
+    requetes = {
+        (terme_maladie(maladie), *fenetre_annee(annee)): (maladie, annee)
+        for maladie in LISTE_MALADIES
+        for annee in annees
+    }
+    memo = MemoComptes()
+    client = ClientPubMed()
+    try:
+        debut = datetime.datetime.now()
+        resultats = asyncio.run(compter_fenetres(client, list(requetes), memo))
+        duree = (datetime.datetime.now() - debut).total_seconds()
+    finally:
+        client.fermer()
+        memo.fermer()
+
+    lignes, echecs = [], []
+    for requete, (maladie, annee) in requetes.items():
+        nombre = resultats[requete]
+        if isinstance(nombre, Exception):
+            print(f"   ❌ {maladie} {annee} : {nombre}")
+            echecs.append(f"{maladie} {annee}")
+        else:
+            lignes.append({"Maladie": maladie, "Annee": annee, "Nb_Publications": nombre})
+    print(f"   {len(requetes)} paires (maladie, année) en {duree:.1f}s")
+    return lignes, echecs
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Nombre de publications PubMed par cancer")
+    parser.add_argument(
+        "--series",
+        metavar="DEBUT-FIN",
+        help=f"Série annuelle (ex: 2005-2024) écrite en format long dans {FICHIER_SERIE}",
+    )
+    args = parser.parse_args()
+
+    print("🌍 Interrogation de l'API PubMed (NCBI)...")
+
+    if args.series:
+        premiere, derniere = (int(a) for a in args.series.split("-"))
+        lignes, echecs = serie_publications(range(premiere, derniere + 1))
+        nom_fichier = FICHIER_SERIE
+        resultats_api = lignes
+    else:
+        resultats_api = asyncio.run(interroger_pubmed())
+        echecs = [r["Maladie"] for r in resultats_api if "Erreur" in r]
+        nom_fichier = "DATA_API_PUBMED.csv"
+
+    if echecs:
+        # L'ancien fichier est conservé ; les réponses déjà obtenues sont en cache
+        print(f"\n❌ Sans réponse valide, fichier non écrit : {', '.join(echecs)}")
+        sys.exit(1)
 
-# Sauvegarde
-df = pd.DataFrame(resultats_api)
-nom_fichier = "DATA_API_PUBMED.csv"
-df.to_csv(nom_fichier, index=False)
+    # Sauvegarde
+    df = pd.DataFrame(resultats_api)
+    df.to_csv(nom_fichier, index=False)
 
-print(f"\n✅ Fichier API généré : {nom_fichier}")
\ No newline at end of file
+    print(f"\n✅ Fichier API généré : {nom_fichier}")
@@ -10,6 +10,8 @@ load_dotenv()
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from sorties_typees import lire_sortie
+
 class Logger:
     HEADER = "\033[95m"
     BLUE = "\033[94m"
@@ -45,6 +47,7 @@ FILES_MAP = {
     "clinical_trials_geography_percentage.csv": "geography_percentage",
     "google_trends_comparison.csv": "google_trends",
     "nci_budget_2023.csv": "nci_budget",
+    "publications_by_year.csv": "publications_by_year",
     "trials_count_by_cancer.csv": "trials_count"
 }
 
@@ -78,9 +81,15 @@ def push_to_supabase():
         Logger.info(f"Traitement de {filename} -> {table_name}")
         
         try:
-            df = pd.read_csv(file_path)
+            # Parquet typé écrit par 3_Nettoyage.py s'il est à jour, sinon le CSV
+            df = lire_sortie(file_path)
             df.columns = df.columns.str.lower()
-            df = df.where(pd.notnull(df), None)
+            # Entiers avec des vides (ex. enrollment) : relus en float (450.0), refusés par une colonne integer
+            for col in df.select_dtypes("float").columns:
+                valeurs = df[col].dropna()
+                if len(valeurs) and (valeurs % 1 == 0).all():
+                    df[col] = df[col].astype("Int64")
+            df = df.astype(object).where(pd.notnull(df), None)
             records = df.to_dict(orient='records')
             total_records = len(records)
             
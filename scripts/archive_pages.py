@@ -0,0 +1,236 @@
+"""
+Archive brute des fiches (texte rendu, HTML ou JSON de l'API), compressée
+en zstd, pour pouvoir ré-extraire les champs sans rescraper :
+
+    python scripts/1_Scrapping.py --archive            # archive pendant le scraping
+    python scripts/archive_pages.py reparse --workers 8  # régénère le CSV hors ligne
+    python scripts/archive_pages.py stats
+
+Fichier de données en ajout seul (une trame zstd par page) + index SQLite
+(NCT -> position et empreinte de la dernière version). Une page identique à
+sa dernière version n'est pas réécrite.
+"""
+
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import argparse
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from journal import Journal, nct_depuis_url
+from index_nct import IndexNCT
+
+# ==========================================
+# 🔧 CONFIGURATION
+# ==========================================
+DOSSIER_ARCHIVE = "data/archive_pages"
+NIVEAU_ZSTD = 10
+TAILLE_LOT = 200  # pages par tâche envoyée au pool de processus
+
+SORTIE_CSV = "data/scraping/FINAL_DATASET_CANCER.csv"
+SORTIE_PARQUET = "data/scraping/FINAL_DATASET_CANCER.parquet"
+NOM_INDEX = "data/scraping/index_nct.json"
+
+
+def _verifier_zstd():
+    if zstandard is None:
+        raise ImportError("Le module zstandard est requis pour l'archive : pip install zstandard")
+
+
+# ==========================================
+# 🗜️ ARCHIVE
+# ==========================================
+class ArchivePages:
+    """Pages brutes par NCT : pages.zst (ajout seul) + index.sqlite.
+
+    genre "page" : {"titre", "texte"[, "html"]} lus par Selenium
+    genre "api"  : JSON de l'étude renvoyé par l'API (moteur http)
+    """
+
+    def __init__(self, dossier=DOSSIER_ARCHIVE, niveau=NIVEAU_ZSTD):
+        _verifier_zstd()
+        self.dossier = dossier
+        os.makedirs(dossier, exist_ok=True)
+        self.chemin_donnees = os.path.join(dossier, "pages.zst")
+
+        self._compresseur = zstandard.ZstdCompressor(level=niveau)
+        self._fichier = open(self.chemin_donnees, "ab")
+        self._verrou = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(dossier, "index.sqlite"), check_same_thread=False)
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS pages (
+                nct TEXT PRIMARY KEY,
+                url TEXT,
+                maladie TEXT,
+                genre TEXT,
+                decalage INTEGER,
+                taille INTEGER,
+                archive_le REAL,
+                empreinte TEXT
+            )"""
+        )
+        # Index créé avant la colonne empreinte : la prochaine version de chaque page sera écrite
+        colonnes = [ligne[1] for ligne in self._db.execute("PRAGMA table_info(pages)")]
+        if "empreinte" not in colonnes:
+            self._db.execute("ALTER TABLE pages ADD COLUMN empreinte TEXT")
+        self._db.commit()
+
+    def ajouter(self, url, maladie, contenu, genre="page"):
+        """Ajoute une version de la page ; l'index pointe vers la plus récente.
+
+        Renvoie False sans rien écrire si la page n'a pas changé depuis la
+        dernière version archivée (relancement servi par le cache par ex.).
+        """
+        brut = json.dumps(contenu, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        empreinte = hashlib.blake2b(brut, digest_size=16).hexdigest()
+        nct_id = nct_depuis_url(url)
+        with self._verrou:
+            ligne = self._db.execute("SELECT empreinte FROM pages WHERE nct = ?", (nct_id,)).fetchone()
+            if ligne and ligne[0] == empreinte:
+                return False
+            trame = self._compresseur.compress(brut)
+            decalage = self._fichier.seek(0, os.SEEK_END)
+            self._fichier.write(trame)
+            self._fichier.flush()
+            # Index écrit après les données : un crash laisse au pire une trame orpheline
+            self._db.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (nct_id, url, maladie, genre, decalage, len(trame), time.time(), empreinte),
+            )
+            self._db.commit()
+        return True
+
+    def contient(self, nct_id):
+        with self._verrou:
+            return self._db.execute("SELECT 1 FROM pages WHERE nct = ?", (nct_id,)).fetchone() is not None
+
+    def entrees(self):
+        """(nct, url, maladie, genre, decalage, taille) de chaque page, dans l'ordre d'archivage"""
+        with self._verrou:
+            return self._db.execute(
+                "SELECT nct, url, maladie, genre, decalage, taille FROM pages ORDER BY decalage"
+            ).fetchall()
+
+    def lire(self, nct_id):
+        with self._verrou:
+            ligne = self._db.execute(
+                "SELECT decalage, taille FROM pages WHERE nct = ?", (nct_id,)
+            ).fetchone()
+        if ligne is None:
+            return None
+        with open(self.chemin_donnees, "rb") as f:
+            return _lire_trame(f, zstandard.ZstdDecompressor(), *ligne)
+
+    def fermer(self):
+        with self._verrou:
+            self._fichier.close()
+            self._db.close()
+
+
+def _lire_trame(f, decompresseur, decalage, taille):
+    f.seek(decalage)
+    return json.loads(decompresseur.decompress(f.read(taille)))
+
+
+# ==========================================
+# ♻️ RÉ-EXTRACTION HORS LIGNE
+# ==========================================
+def reanalyser(url, maladie, genre, contenu):
+    """Même conversion que pendant le scraping, à partir de la page archivée"""
+    if genre == "api":
+        from moteur_http import convertir_etude
+
+        return convertir_etude(contenu, url, maladie)
+
+    from extraction import analyser_page
+
+    return {"Maladie": maladie, **analyser_page(contenu), "URL": url}
+
+
+def _reanalyser_lot(chemin_donnees, lot):
+    """Exécuté dans un processus du pool : un lot de pages -> lignes du dataset"""
+    decompresseur = zstandard.ZstdDecompressor()
+    lignes = []
+    with open(chemin_donnees, "rb") as f:
+        for _, url, maladie, genre, decalage, taille in lot:
+            contenu = _lire_trame(f, decompresseur, decalage, taille)
+            lignes.append(reanalyser(url, maladie, genre, contenu))
+    return lignes
+
+
+def reparse(dossier=DOSSIER_ARCHIVE, nb_workers=None, chemin_csv=SORTIE_CSV, chemin_parquet=SORTIE_PARQUET):
+    """Ré-extrait les pages archivées avec un pool de processus (sans réseau).
+
+    Les lignes obtenues remplacent celles des mêmes études dans le dataset
+    existant ; les études absentes de l'archive (complétées depuis les
+    cartes avec --cartes par ex.) gardent leur ligne.
+    """
+    archive = ArchivePages(dossier)
+    entrees = archive.entrees()
+    archive.fermer()
+    if not entrees:
+        print("⚠️ Archive vide : rien à ré-extraire.")
+        return 0
+
+    # Maladies de chaque étude : celles de l'index du dernier scraping s'il existe
+    index = IndexNCT(NOM_INDEX, reprise=True)
+    archivees = {entree[0] for entree in entrees}
+    absentes = sum(nct_id not in archivees for nct_id in index.etudes)
+    if absentes:
+        print(f"⚠️ {absentes} études de l'index ne sont pas archivées : leur ligne actuelle est conservée.")
+    lots = [entrees[i:i + TAILLE_LOT] for i in range(0, len(entrees), TAILLE_LOT)]
+    debut = time.perf_counter()
+    print(f"♻️ Ré-extraction de {len(entrees)} pages ({len(lots)} lots)...")
+
+    journal = Journal(os.path.join(dossier, "journal_reparse.jsonl"))
+    with ProcessPoolExecutor(max_workers=nb_workers) as pool:
+        for lignes in pool.map(_reanalyser_lot, [archive.chemin_donnees] * len(lots), lots):
+            for ligne in lignes:
+                nct_id = nct_depuis_url(ligne["URL"])
+                ligne["Maladies"] = index.maladies(nct_id) or ligne["Maladie"]
+                journal.ecrire(ligne)
+    journal.fermer()
+
+    nb_lignes = journal.fusionner(chemin_csv, chemin_parquet)
+    print(f"💾 {chemin_csv} mis à jour : {nb_lignes} lignes en {time.perf_counter() - debut:.1f}s.")
+    return nb_lignes
+
+
+def afficher_stats(dossier=DOSSIER_ARCHIVE):
+    archive = ArchivePages(dossier)
+    entrees = archive.entrees()
+    archive.fermer()
+    taille = os.path.getsize(archive.chemin_donnees)
+    utile = sum(e[5] for e in entrees)
+    print(f"🗜️ {len(entrees)} études archivées, {taille / 1024 / 1024:.1f} Mo sur disque")
+    print(f"   dont {utile / 1024 / 1024:.1f} Mo pour les versions les plus récentes")
+
+
+# ==========================================
+# 🚀 LANCEMENT
+# ==========================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Archive brute des fiches ClinicalTrials.gov")
+    parser.add_argument("--dossier", default=DOSSIER_ARCHIVE)
+    sous_commandes = parser.add_subparsers(dest="commande", required=True)
+
+    p = sous_commandes.add_parser("reparse", help="Ré-extrait les pages archivées dans le dataset, sans réseau")
+    p.add_argument("--workers", type=int, default=None, help="Processus (défaut : nb de cœurs)")
+    p.add_argument("--sortie", default=SORTIE_CSV, help="CSV à mettre à jour")
+    p.add_argument("--parquet", default=SORTIE_PARQUET)
+
+    sous_commandes.add_parser("stats", help="Taille et nombre d'études archivées")
+
+    args = parser.parse_args()
+    if args.commande == "reparse":
+        reparse(args.dossier, args.workers, args.sortie, args.parquet)
+    else:
+        afficher_stats(args.dossier)
@@ -0,0 +1,106 @@
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+# ==========================================
+# 🔧 CONFIGURATION DES ATTENTES
+# ==========================================
+SELECTEUR_CARTE = ".usa-card__container"
+DELAI_LISTE = 10  # secondes, au-delà : repli
+DELAI_FICHE = 5  # une fiche sans marqueur coûte ce délai : on le garde court
+INTERVALLE = 0.2  # fréquence de vérification
+NB_LECTURES_STABLES = 3  # lectures identiques du nombre de cartes (≈ 0,4 s sans changement)
+
+# Une fiche est prête quand le bloc sponsor ET le statut sont affichés
+MARQUEURS_SPONSOR = ["Sponsor", "Responsible Party"]
+MARQUEURS_STATUT = [
+    "Recruiting",
+    "Not yet recruiting",
+    "Active, not recruiting",
+    "Enrolling by invitation",
+    "Completed",
+    "Terminated",
+    "Withdrawn",
+    "Suspended",
+    "Unknown",
+    "Available",
+    "No longer available",
+    "Temporarily not available",
+    "Approved for marketing",
+]
+
+JS_NB_ELEMENTS = "return document.querySelectorAll(arguments[0]).length;"
+JS_TEXTE_CONTIENT = """
+const texte = document.body ? document.body.innerText : '';
+return arguments[0].some(m => texte.includes(m)) && arguments[1].some(m => texte.includes(m));
+"""
+
+
+# ==========================================
+# ⏳ CONDITIONS DE PAGE PRÊTE
+# ==========================================
+class NombreStable:
+    """Condition WebDriverWait : au moins un élément, et leur nombre ne bouge plus.
+
+    Les cartes arrivent par vagues : on attend que le compte soit identique
+    sur nb_lectures vérifications consécutives. Renvoie le nombre d'éléments.
+    """
+
+    def __init__(self, selecteur, nb_lectures=NB_LECTURES_STABLES):
+        self.selecteur = selecteur
+        self.nb_lectures = nb_lectures
+        self.dernier = None
+        self.identiques = 0
+        self.nombre = 0
+
+    def __call__(self, driver):
+        self.nombre = driver.execute_script(JS_NB_ELEMENTS, self.selecteur)
+        if self.nombre and self.nombre == self.dernier:
+            self.identiques += 1
+        else:
+            self.identiques = 1
+        self.dernier = self.nombre
+        return self.nombre if self.nombre and self.identiques >= self.nb_lectures else False
+
+
+def texte_contient(marqueurs_a, marqueurs_b):
+    """Condition : le texte de la page contient un marqueur de chaque liste"""
+    return lambda driver: driver.execute_script(JS_TEXTE_CONTIENT, marqueurs_a, marqueurs_b)
+
+
+def attendre_cartes(driver, delai=DELAI_LISTE, metriques=None):
+    """Attend que la liste de cartes soit complète ; renvoie le nombre de cartes.
+
+    Repli si le nombre ne se stabilise pas avant `delai` : on garde les cartes
+    déjà là. Sans aucune carte, TimeoutException remonte comme avant.
+    """
+    condition = NombreStable(SELECTEUR_CARTE)
+    try:
+        return WebDriverWait(driver, delai, poll_frequency=INTERVALLE).until(condition)
+    except TimeoutException:
+        if not condition.nombre:
+            raise
+        if metriques:
+            metriques.incrementer("replis")
+        return condition.nombre
+
+
+def attendre_fiche(driver, delai=DELAI_FICHE, metriques=None):
+    """Attend que le sponsor et le statut d'une fiche soient affichés.
+
+    Repli après `delai` (fiche sans sponsor ou statut inconnu) : la page est
+    lue telle quelle si elle a un <body>, sinon TimeoutException remonte.
+    Renvoie True si la fiche était prête, False en cas de repli.
+    """
+    try:
+        WebDriverWait(driver, delai, poll_frequency=INTERVALLE).until(
+            texte_contient(MARQUEURS_SPONSOR, MARQUEURS_STATUT)
+        )
+        return True
+    except TimeoutException:
+        # Même garde-fou que l'ancienne attente : la page doit au moins avoir un body
+        WebDriverWait(driver, 0).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        if metriques:
+            metriques.incrementer("replis")
+        return False
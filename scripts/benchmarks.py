@@ -0,0 +1,586 @@
+"""
+Mesures de performance du pipeline, une sous-commande par optimisation :
+
+    python scripts/benchmarks.py attentes --fiches 30 --pages 5
+    python scripts/benchmarks.py profils --fiches 30
+    python scripts/benchmarks.py extraction --pages 2000
+    python scripts/benchmarks.py memoire --essais 100000
+    python scripts/benchmarks.py regions --sponsors 1000000 --distincts 20000
+    python scripts/benchmarks.py colonnes --lignes 10000 100000 1000000
+    python scripts/benchmarks.py sorties --lignes 10000 100000 1000000
+
+Chaque mesure compare la nouvelle stratégie à l'ancienne sur les mêmes
+pages et vérifie que les données extraites sont identiques.
+"""
+
+import os
+import re
+import json
+import time
+import argparse
+import tempfile
+import tracemalloc
+import statistics
+
+import pandas as pd
+
+from extraction import extraire_fiche, extraire_statut_sponsor, chercher_statut, chercher_sponsor
+from recuperation_async import limiteur_pour
+
+HOTE = "clinicaltrials.gov"
+# Jeu produit par le scraper actuel : valeurs de référence des fiches
+DATASET_REFERENCE = "data/scraping/FINAL_DATASET_CANCER.csv"
+
+
+def resume_temps(durees):
+    """Moyenne et p95 (secondes) d'une liste de durées"""
+    if not durees:
+        return "-"
+    p95 = sorted(durees)[max(0, int(len(durees) * 0.95) - 1)]
+    return f"moy {statistics.mean(durees):.2f}s / p95 {p95:.2f}s"
+
+
+def creer_driver(profil="complet", journal_reseau=False):
+    """Chrome headless du profil demandé (profil_navigateur.py)"""
+    from gestion_driver import lancer_chrome
+
+    return lancer_chrome(profil, headless=True, journal_reseau=journal_reseau)
+
+
+def echantillon_reference(nb):
+    """nb fiches tirées du jeu de référence (toujours les mêmes)"""
+    reference = pd.read_csv(DATASET_REFERENCE, encoding="utf-8-sig")
+    return reference.sample(min(nb, len(reference)), random_state=0)
+
+
+# ==========================================
+# ⏳ ATTENTES : PAUSES FIXES vs CONDITIONS
+# ==========================================
+def bench_attentes(args):
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from attentes import attendre_cartes, attendre_fiche, SELECTEUR_CARTE
+
+    def liste_fixe(driver):
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, SELECTEUR_CARTE))
+        )
+        time.sleep(2)
+
+    def fiche_fixe(driver):
+        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+        time.sleep(0.5)
+
+    strategies = {
+        "pauses fixes": (liste_fixe, fiche_fixe),
+        "conditions": (attendre_cartes, attendre_fiche),
+    }
+
+    reference = echantillon_reference(args.fiches)
+    listes = [
+        f"https://clinicaltrials.gov/search?cond={args.maladie.replace(' ', '%20')}&viewType=Card&page={p}"
+        for p in range(1, args.pages + 1)
+    ]
+
+    temps = {nom: {"liste": [], "fiche": []} for nom in strategies}
+    cartes = {nom: [] for nom in strategies}
+    concordance = {nom: 0 for nom in strategies}
+
+    driver = creer_driver()
+    try:
+        for i, url in enumerate(listes):
+            # On alterne l'ordre pour ne pas avantager la stratégie qui passe en second (cache navigateur)
+            for nom in sorted(strategies, reverse=i % 2 == 1):
+                limiteur_pour(HOTE).attendre()
+                debut = time.perf_counter()
+                driver.get(url)
+                strategies[nom][0](driver)
+                cartes[nom].append(len(driver.find_elements(By.CSS_SELECTOR, SELECTEUR_CARTE)))
+                temps[nom]["liste"].append(time.perf_counter() - debut)
+
+        for i, ligne in enumerate(reference.itertuples(index=False)):
+            for nom in sorted(strategies, reverse=i % 2 == 1):
+                limiteur_pour(HOTE).attendre()
+                debut = time.perf_counter()
+                driver.get(ligne.URL)
+                strategies[nom][1](driver)
+                texte = driver.find_element(By.TAG_NAME, "body").text
+                temps[nom]["fiche"].append(time.perf_counter() - debut)
+                if extraire_statut_sponsor(texte) == (ligne.Statut, ligne.Sponsor):
+                    concordance[nom] += 1
+    finally:
+        driver.quit()
+
+    print(f"\n⏳ {len(listes)} pages de liste, {len(reference)} fiches ({DATASET_REFERENCE})")
+    for nom in strategies:
+        print(f"\n   {nom}")
+        print(f"      liste : {resume_temps(temps[nom]['liste'])}, {sum(cartes[nom])} cartes")
+        print(f"      fiche : {resume_temps(temps[nom]['fiche'])}")
+        print(f"      statut + sponsor identiques au jeu de référence : {concordance[nom]}/{len(reference)}")
+
+    gain_liste = statistics.mean(temps["pauses fixes"]["liste"]) - statistics.mean(temps["conditions"]["liste"])
+    gain_fiche = statistics.mean(temps["pauses fixes"]["fiche"]) - statistics.mean(temps["conditions"]["fiche"])
+    print(
+        f"\n   Gain estimé sur un run complet (150 listes, 1700 fiches) : "
+        f"{(150 * gain_liste + 1700 * gain_fiche) / 60:.1f} min"
+    )
+
+
+# ==========================================
+# 🪶 PROFIL NAVIGATEUR : COMPLET vs LÉGER
+# ==========================================
+def bench_profils(args):
+    from selenium.webdriver.common.by import By
+    from attentes import attendre_fiche
+    from profil_navigateur import octets_transferes, PROFILS
+
+    reference = echantillon_reference(args.fiches)
+    resultats = {}
+
+    for profil in PROFILS:
+        temps, octets, concordance = [], [], 0
+        driver = creer_driver(profil, journal_reseau=True)
+        try:
+            for ligne in reference.itertuples(index=False):
+                limiteur_pour(HOTE).attendre()
+                octets_transferes(driver)  # vide le journal réseau de la page précédente
+                debut = time.perf_counter()
+                driver.get(ligne.URL)
+                attendre_fiche(driver)
+                temps.append(time.perf_counter() - debut)
+                texte = driver.find_element(By.TAG_NAME, "body").text
+                # Les requêtes encore en cours après "prête" comptent aussi
+                time.sleep(1)
+                octets.append(octets_transferes(driver))
+                if extraire_statut_sponsor(texte) == (ligne.Statut, ligne.Sponsor):
+                    concordance += 1
+        finally:
+            driver.quit()
+        resultats[profil] = (temps, octets, concordance)
+
+    print(f"\n🪶 {len(reference)} fiches ({DATASET_REFERENCE})")
+    for profil, (temps, octets, concordance) in resultats.items():
+        print(f"\n   {profil}")
+        print(f"      page prête : {resume_temps(temps)}")
+        print(f"      transfert  : {statistics.mean(octets) / 1024:.0f} Ko/page")
+        print(f"      statut + sponsor identiques au jeu de référence : {concordance}/{len(reference)}")
+
+
+# ==========================================
+# 🔎 EXTRACTION : VERSION D'ORIGINE vs extraire_statut_sponsor / extraire_fiche
+# ==========================================
+PARAGRAPHE = (
+    "This study evaluates the efficacy and safety of the investigational treatment "
+    "in participants with advanced disease. Participants will be followed for survival, "
+    "response rate and adverse events according to the protocol.\n"
+)
+
+
+def page_synthetique(ligne, i):
+    """Texte de fiche reconstitué depuis une ligne du jeu (quand le cache est vide)"""
+    nct_id = f"NCT{i:08d}"
+    return (
+        f"{ligne.Titre}\nClinicalTrials.gov ID {nct_id}\n"
+        + PARAGRAPHE * 10
+        + f"Overall Status\n{ligne.Statut}\n"
+        + "Study Start (Actual)\n2021-03-15\nStudy Completion (Estimated)\nDecember 31, 2026\n"
+        + "Enrollment (Estimated)\n1,450\nPhase\nPhase 2\n"
+        + f"Conditions\n{ligne.Maladie}\nKeywords\n"
+        + "Intervention / Treatment\nDrug: Pembrolizumab\nProcedure: Biopsy\n"
+        + PARAGRAPHE * 20
+        + f"Sponsor\n{ligne.Sponsor}\n"
+        + PARAGRAPHE * 5
+        + "Contacts and Locations\n"
+        + "Mayo Clinic\nRochester, Minnesota, 55905, United States\n" * 10
+        + "Institut Curie\nParis, 75005, France\n" * 5
+        + "Participation Criteria\n"
+        + PARAGRAPHE * 5
+    )
+
+
+def corpus_fiches(nb):
+    """Textes de fiches : pages du cache disque d'abord, puis pages synthétiques"""
+    from cache_http import CacheHTTP
+
+    textes = []
+    cache = CacheHTTP()
+    try:
+        urls = [
+            url for (url,) in cache._db.execute(
+                "SELECT url FROM entrees WHERE url LIKE '%/study/NCT%' LIMIT ?", (nb,)
+            )
+        ]
+        for url in urls:
+            page = cache.lire_json(url)
+            if page and "texte" in page:
+                textes.append(page["texte"])
+    finally:
+        cache.fermer()
+
+    nb_cache = len(textes)
+    if len(textes) < nb:
+        reference = pd.read_csv(DATASET_REFERENCE, encoding="utf-8-sig")
+        for i, ligne in enumerate(reference.itertuples(index=False)):
+            if len(textes) >= nb:
+                break
+            textes.append(page_synthetique(ligne, i))
+    return textes, nb_cache
+
+
+DORIGINE = "d'origine"
+
+
+def bench_extraction(args):
+    textes, nb_cache = corpus_fiches(args.pages)
+
+    def ancienne(texte):
+        return chercher_statut(texte), chercher_sponsor(texte.split("\n"))
+
+    def nouvelle(texte):
+        champs = extraire_fiche(texte)
+        return champs["Statut"], champs["Sponsor"]
+
+    temps = {}
+    fonctions = [
+        (DORIGINE, ancienne),
+        ("statut_sponsor", extraire_statut_sponsor),  # cartes de liste
+        ("extraire_fiche", nouvelle),  # fiches : tous les champs
+    ]
+    for nom, fonction in fonctions:
+        meilleur = float("inf")
+        for _ in range(args.repetitions):
+            debut = time.perf_counter()
+            for texte in textes:
+                fonction(texte)
+            meilleur = min(meilleur, time.perf_counter() - debut)
+        temps[nom] = meilleur
+
+    identiques = sum(ancienne(t) == nouvelle(t) == extraire_statut_sponsor(t) for t in textes)
+    taille = statistics.mean(len(t) for t in textes) / 1024
+    print(f"\n🔎 {len(textes)} fiches ({nb_cache} du cache, {taille:.1f} Ko de texte en moyenne)")
+    for nom, duree in temps.items():
+        print(f"   {nom:<16} {duree * 1e6 / len(textes):8.1f} µs/fiche")
+    print(f"   statut + sponsor identiques : {identiques}/{len(textes)}")
+    print(
+        f"   statut_sponsor : {temps['statut_sponsor'] / temps[DORIGINE]:.1f}x le temps d'origine "
+        f"/ extraire_fiche : {temps['extraire_fiche'] / temps[DORIGINE]:.1f}x, "
+        "mais lit aussi NCT, phase, effectif, dates, conditions, interventions et pays"
+    )
+
+
+# ==========================================
+# 🧱 MÉMOIRE : DICTS vs ENREGISTREMENTS COMPACTS
+# ==========================================
+def lignes_journal(nb):
+    """nb lignes JSONL d'essais distincts, valeurs reprises du jeu de référence"""
+    reference = pd.read_csv(DATASET_REFERENCE, encoding="utf-8-sig").fillna("")
+    modeles = reference.to_dict(orient="records")
+    lignes = []
+    for i in range(nb):
+        donnees = dict(modeles[i % len(modeles)])
+        donnees["URL"] = f"https://clinicaltrials.gov/study/NCT{i:08d}"
+        donnees["Maladies"] = donnees["Maladie"]
+        lignes.append(json.dumps(donnees, ensure_ascii=False))
+    return lignes
+
+
+def mesurer_memoire(fonction):
+    """(résultat, Mo encore alloués, pic en Mo) pendant fonction()"""
+    tracemalloc.start()
+    debut = time.perf_counter()
+    resultat = fonction()
+    duree = time.perf_counter() - debut
+    actuel, pic = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultat, actuel / 1024 / 1024, pic / 1024 / 1024, duree
+
+
+def bench_memoire(args):
+    from journal import TamponEssais, nct_depuis_url
+
+    lignes = lignes_journal(args.essais)
+
+    def dicts():
+        return [json.loads(ligne) for ligne in lignes]
+
+    def compacts():
+        tampon = TamponEssais()
+        for ligne in lignes:
+            tampon.ajouter(json.loads(ligne))
+        return tampon
+
+    def dataframe_dicts():
+        df = pd.DataFrame(dicts())
+        df["_nct"] = df["URL"].map(nct_depuis_url).fillna(df["URL"])
+        return df.drop_duplicates(subset=["_nct"], keep="last")
+
+    def dataframe_compacts():
+        return compacts().dataframe()
+
+    print(f"\n🧱 {args.essais} essais")
+    par_100k = 100_000 / args.essais
+    for nom, fonction in [
+        ("liste de dicts", dicts),
+        ("TamponEssais", compacts),
+        ("DataFrame depuis dicts", dataframe_dicts),
+        ("DataFrame par lots", dataframe_compacts),
+    ]:
+        resultat, actuel, pic, duree = mesurer_memoire(fonction)
+        del resultat
+        print(
+            f"   {nom:<24} retenu {actuel * par_100k:7.1f} Mo / 100k essais, "
+            f"pic {pic * par_100k:7.1f} Mo, {duree:.2f}s"
+        )
+    print("   (les colonnes texte stockées par pyarrow échappent à tracemalloc : comparer les pics)")
+
+
+# ==========================================
+# 🗺️ RÉGIONS : TESTS `in` vs AUTOMATE
+# ==========================================
+MOTS_NEUTRES = ["Research", "Foundation", "Pharma", "Hospital", "Group", "Institute", "Inc.", "Center", "Trust"]
+
+
+def sponsors_synthetiques(nb, graine=0):
+    """nb sponsors : vrais sponsors du jeu de référence, noms inventés avec ou sans mot-clé, NaN"""
+    import random
+    import string
+    from regions import REGLES
+
+    aleatoire = random.Random(graine)
+    reels = pd.read_csv(DATASET_REFERENCE, encoding="utf-8-sig")["Sponsor"].dropna().tolist()
+    mots_cles = [mot for _, mots in REGLES for mot in mots]
+    sponsors = []
+    for _ in range(nb):
+        tirage = aleatoire.random()
+        if tirage < 0.01:
+            sponsors.append(None)
+        elif tirage < 0.4:
+            sponsors.append(aleatoire.choice(reels))
+        else:
+            nom = "".join(aleatoire.choices(string.ascii_letters, k=aleatoire.randint(4, 12)))
+            parties = [nom.capitalize(), *aleatoire.sample(MOTS_NEUTRES, aleatoire.randint(1, 3))]
+            if tirage < 0.8:
+                parties.insert(aleatoire.randint(0, len(parties)), aleatoire.choice(mots_cles).title())
+            sponsors.append(" ".join(parties))
+    return pd.Series(sponsors, dtype=object, name="Sponsor")
+
+
+def bench_regions(args):
+    import regions
+    from regions_origine import extract_country_region
+
+    sponsors = sponsors_synthetiques(args.distincts or args.sponsors)
+    if args.distincts:
+        # Sponsors répétés comme dans le vrai jeu (913 distincts pour 1688 essais)
+        sponsors = sponsors.sample(args.sponsors, replace=True, random_state=0).reset_index(drop=True)
+    print(f"\n🗺️ {len(sponsors)} sponsors ({sponsors.nunique()} distincts)")
+
+    # Référence : copie figée du code d'origine, indépendante des tables de regions.py
+    debut = time.perf_counter()
+    reference = sponsors.apply(extract_country_region)
+    duree_reference = time.perf_counter() - debut
+    print(f"   {'tests `in` (.apply)':<24} {duree_reference:6.2f}s  {len(sponsors) / duree_reference / 1000:6.0f} k sponsors/s")
+
+    # Tables de regions.py, mêmes tests `in` : isole une erreur de transcription des mots-clés
+    lineaire = sponsors.apply(regions.classer_lineaire)
+    print(f"   {'tables de regions.py':<24} {(reference != lineaire).sum()} différence(s) avec le code d'origine")
+
+    moteurs = [("automate Python", False)] + ([("automate pyahocorasick", True)] if regions.ahocorasick else [])
+    for nom, natif in moteurs:
+        debut = time.perf_counter()
+        automate = regions.AutomateRegions(natif=natif)
+        compilation = time.perf_counter() - debut
+        debut = time.perf_counter()
+        nouveau = automate.classer_serie(sponsors)
+        duree = time.perf_counter() - debut
+        # Même résultat attendu ligne à ligne
+        differences = (reference != nouveau).sum()
+        print(
+            f"   {nom:<24} {duree:6.2f}s  {len(sponsors) / duree / 1000:6.0f} k sponsors/s, "
+            f"x{duree_reference / duree:.1f}, compilé en {compilation * 1000:.0f} ms, {differences} différence(s)"
+        )
+
+    # Un classement par sponsor distinct, puis relance avec le mémo déjà rempli
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as dossier:
+        memo = regions.MemoRegions(os.path.join(dossier, "regions.sqlite"))
+        for nom, avec_memo in [("distincts, sans mémo", None), ("mémo vide", memo), ("mémo rempli (relance)", memo)]:
+            debut = time.perf_counter()
+            nouveau = regions.classer_sponsors(sponsors, avec_memo)
+            duree = time.perf_counter() - debut
+            differences = (reference != nouveau).sum()
+            print(
+                f"   {nom:<24} {duree:6.2f}s  {len(sponsors) / duree / 1000:6.0f} k sponsors/s, "
+                f"x{duree_reference / duree:.1f}, {memo.nb_ajoutes} sponsors en mémo, {differences} différence(s)"
+            )
+        memo.fermer()
+    print(reference.value_counts().to_string())
+
+
+# ==========================================
+# 🧹 NETTOYAGE : .apply vs NOYAUX VECTORISÉS
+# ==========================================
+def colonnes_essais(nb):
+    """Colonnes URL et Titre de nb essais : jeu de référence répété, NCT renumérotés, quelques cas limites"""
+    reference = pd.read_csv(DATASET_REFERENCE, encoding="utf-8-sig")
+    titres = reference["Titre"].tolist() + ["Titre sans séparateur", "A | B", " |  | ClinicalTrials.gov ", None]
+    urls, titres_essais = [], []
+    for i in range(nb):
+        nct = f"NCT{i:08d}"
+        urls.append(f"https://clinicaltrials.gov/study/{nct}?rank={i % 50}" if i % 1000 else "https://clinicaltrials.gov/")
+        titre = titres[i % len(titres)]
+        titres_essais.append(re.sub(r"NCT\d+", nct, titre) if isinstance(titre, str) else titre)
+    return pd.DataFrame({"URL": urls, "Titre": titres_essais})
+
+
+def bench_colonnes(args):
+    from nettoyage_essais import extraire_nct_ids, nettoyer_titres, extract_nct_id, clean_title, identiques
+
+    for nb in args.lignes:
+        df = colonnes_essais(nb)
+        print(f"\n🧹 {nb} essais")
+        for nom, colonne, ligne_a_ligne, vectorise in [
+            ("ID NCT", "URL", extract_nct_id, extraire_nct_ids),
+            ("titre", "Titre", clean_title, nettoyer_titres),
+        ]:
+            debut = time.perf_counter()
+            reference = df[colonne].apply(ligne_a_ligne)
+            duree_reference = time.perf_counter() - debut
+            debut = time.perf_counter()
+            nouveau = vectorise(df[colonne])
+            duree = time.perf_counter() - debut
+            print(
+                f"   {nom:<7} .apply {duree_reference * 1000:8.1f} ms   vectorisé {duree * 1000:7.1f} ms   "
+                f"x{duree_reference / duree:5.1f}   {'identique' if identiques(reference, nouveau) else 'DIFFÉRENT'}"
+            )
+
+
+# ==========================================
+# 🗃️ SORTIES : CSV vs PARQUET TYPÉ
+# ==========================================
+PHASES = ["Phase 1", "Phase 2", "Phase 3", "Phase 1/Phase 2", "Not Applicable", None]
+TYPES_INTERVENTION = ["Drug", "Procedure", "Drug | Radiation", "Behavioral", "Device", None]
+PAYS = ["United States", "France | Germany", "China", "United States | Canada", None]
+
+
+def essais_nettoyes(nb):
+    """nb lignes au format de clinical_trials_clean.csv, valeurs reprises du jeu de référence"""
+    from nettoyage_essais import clean_title
+
+    reference = pd.read_csv(DATASET_REFERENCE, encoding="utf-8-sig")
+    rangs = [i % len(reference) for i in range(nb)]
+    lignes = reference.iloc[rangs].reset_index(drop=True)
+    return pd.DataFrame({
+        "Cancer": lignes["Maladie"],
+        "Trial_ID": [f"NCT{i:08d}" for i in range(nb)],
+        "Title": lignes["Titre"].map(clean_title),
+        "Sponsor": lignes["Sponsor"],
+        "Status": lignes["Statut"],
+        "URL": [f"https://clinicaltrials.gov/study/NCT{i:08d}" for i in range(nb)],
+        "Cancers": lignes["Maladie"],
+        "Phase": [PHASES[i % len(PHASES)] for i in range(nb)],
+        "Enrollment": pd.array([None if i % 10 == 0 else 20 + i % 900 for i in range(nb)], dtype="Int64"),
+        "Start_Date": [f"{2005 + i % 20}-{1 + i % 12:02d}" for i in range(nb)],
+        "Completion_Date": [None if i % 4 == 0 else f"{2010 + i % 20}-{1 + i % 12:02d}-15" for i in range(nb)],
+        "Conditions": lignes["Maladie"],
+        "Intervention_Type": [TYPES_INTERVENTION[i % len(TYPES_INTERVENTION)] for i in range(nb)],
+        "Countries": [PAYS[i % len(PAYS)] for i in range(nb)],
+    })
+
+
+def memes_valeurs(a, b):
+    """Mêmes valeurs colonne par colonne (le CSV relit les titres vides "" comme manquants)"""
+    for colonne in a.columns:
+        x = a[colonne].astype(object).replace("", None)
+        y = b[colonne].astype(object).replace("", None)
+        if not ((x == y) | (x.isna() & y.isna())).all():
+            return False
+    return True
+
+
+def bench_sorties(args):
+    from sorties_typees import ecrire_sortie, chemin_parquet, pq
+    from etapes_nettoyage import ESSAIS, TYPES_SORTIES
+
+    if pq is None:
+        print("❌ pyarrow est requis pour écrire le Parquet : pip install pyarrow")
+        return
+
+    def meilleur_temps(fonction):
+        durees = []
+        for _ in range(args.repetitions):
+            debut = time.perf_counter()
+            resultat = fonction()
+            durees.append(time.perf_counter() - debut)
+        return resultat, min(durees)
+
+    with tempfile.TemporaryDirectory() as dossier:
+        chemin_csv = os.path.join(dossier, os.path.basename(ESSAIS))
+        for nb in args.lignes:
+            ecrire_sortie(essais_nettoyes(nb), chemin_csv, TYPES_SORTIES[ESSAIS])
+            csv, duree_csv = meilleur_temps(lambda: pd.read_csv(chemin_csv))
+            parquet, duree_parquet = meilleur_temps(lambda: pq.read_table(chemin_parquet(chemin_csv)).to_pandas())
+            memoire_csv = csv.memory_usage(deep=True).sum() / 1024 / 1024
+            memoire_parquet = parquet.memory_usage(deep=True).sum() / 1024 / 1024
+
+            print(f"\n🗃️ {nb} essais ({len(csv.columns)} colonnes)")
+            for nom, chemin, duree, memoire in [
+                ("CSV", chemin_csv, duree_csv, memoire_csv),
+                ("Parquet typé", chemin_parquet(chemin_csv), duree_parquet, memoire_parquet),
+            ]:
+                print(
+                    f"   {nom:<13} fichier {os.path.getsize(chemin) / 1024 / 1024:7.1f} Mo   "
+                    f"lecture {duree * 1000:8.1f} ms   DataFrame {memoire:7.1f} Mo"
+                )
+            print(
+                f"   lecture x{duree_csv / duree_parquet:.1f}, mémoire ÷{memoire_csv / memoire_parquet:.1f}   "
+                f"{'mêmes valeurs' if memes_valeurs(csv, parquet) else 'DIFFÉRENT'}"
+            )
+            categories = [c for c in parquet.columns if isinstance(parquet[c].dtype, pd.CategoricalDtype)]
+            print(f"   catégories : {', '.join(categories)}")
+
+
+# ==========================================
+# 🚀 LANCEMENT
+# ==========================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks du pipeline")
+    sous_commandes = parser.add_subparsers(dest="mesure", required=True)
+
+    p = sous_commandes.add_parser("attentes", help="Pauses fixes vs attentes conditionnelles (Selenium)")
+    p.add_argument("--fiches", type=int, default=30, help="Fiches tirées du jeu de référence")
+    p.add_argument("--pages", type=int, default=5, help="Pages de liste")
+    p.add_argument("--maladie", default="Lung Cancer")
+    p.set_defaults(executer=bench_attentes)
+
+    p = sous_commandes.add_parser("profils", help="Profil Chrome complet vs léger : octets et temps par fiche")
+    p.add_argument("--fiches", type=int, default=30, help="Fiches tirées du jeu de référence")
+    p.set_defaults(executer=bench_profils)
+
+    p = sous_commandes.add_parser("extraction", help="Extraction d'origine vs extraire_fiche (hors ligne)")
+    p.add_argument("--pages", type=int, default=2000, help="Nombre de textes de fiche")
+    p.add_argument("--repetitions", type=int, default=5, help="Meilleur temps sur N répétitions")
+    p.set_defaults(executer=bench_extraction)
+
+    p = sous_commandes.add_parser("memoire", help="Dicts par essai vs enregistrements compacts (__slots__)")
+    p.add_argument("--essais", type=int, default=100_000, help="Nombre d'essais synthétiques")
+    p.set_defaults(executer=bench_memoire)
+
+    p = sous_commandes.add_parser("regions", help="Région des sponsors : tests `in` vs automate d'Aho-Corasick")
+    p.add_argument("--sponsors", type=int, default=1_000_000, help="Nombre de sponsors synthétiques")
+    p.add_argument("--distincts", type=int, default=None, help="Tirer les sponsors parmi N noms distincts")
+    p.set_defaults(executer=bench_regions)
+
+    p = sous_commandes.add_parser("colonnes", help="ID NCT et titres : .apply ligne à ligne vs méthodes .str Arrow")
+    p.add_argument("--lignes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000], help="Tailles mesurées")
+    p.set_defaults(executer=bench_colonnes)
+
+    p = sous_commandes.add_parser("sorties", help="data_clean : lecture CSV vs Parquet typé (temps, mémoire)")
+    p.add_argument("--lignes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000], help="Tailles mesurées")
+    p.add_argument("--repetitions", type=int, default=3, help="Meilleur temps sur N lectures")
+    p.set_defaults(executer=bench_sorties)
+
+    args = parser.parse_args()
+    args.executer(args)
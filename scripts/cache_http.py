@@ -0,0 +1,181 @@
+import os
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# ==========================================
+# 🔧 CONFIGURATION
+# ==========================================
+DOSSIER_CACHE = os.environ.get("CACHE_HTTP_DOSSIER", "data/cache_http")
+TTL_DEFAUT = float(os.environ.get("CACHE_HTTP_TTL_HEURES", "24")) * 3600
+TAILLE_MAX_DEFAUT = int(float(os.environ.get("CACHE_HTTP_TAILLE_MAX_MO", "500")) * 1024 * 1024)
+# Paramètres d'identification (clé API NCBI...) : hors de la clé de cache et de l'index
+PARAMS_IGNORES = {"api_key", "tool", "email"}
+
+
+def normaliser_url(url, params=None):
+    """URL canonique : schéma/hôte en minuscules, paramètres triés, sans fragment"""
+    morceaux = urlsplit(url)
+    requete = parse_qsl(morceaux.query, keep_blank_values=True)
+    if params:
+        requete += [(str(k), str(v)) for k, v in params.items()]
+    requete = [(k, v) for k, v in requete if k not in PARAMS_IGNORES]
+    return urlunsplit(
+        (
+            morceaux.scheme.lower(),
+            morceaux.netloc.lower(),
+            morceaux.path or "/",
+            urlencode(sorted(requete)),
+            "",
+        )
+    )
+
+
+def cle_cache(url, params=None):
+    return hashlib.sha256(normaliser_url(url, params).encode("utf-8")).hexdigest()
+
+
+# ==========================================
+# 🗄️ CACHE DISQUE
+# ==========================================
+class CacheHTTP:
+    """Cache disque adressé par le contenu de la requête (URL normalisée).
+
+    - Corps compressés (zlib), un fichier par clé : dossier/ab/abcdef...
+    - Index SQLite : dates de création / dernier accès, taille, ETag, Last-Modified
+    - Une entrée plus vieille que le TTL est périmée mais reste revalidable
+    - Au-delà de taille_max, les entrées les moins récemment lues sont supprimées
+    """
+
+    def __init__(self, dossier=DOSSIER_CACHE, ttl=TTL_DEFAUT, taille_max=TAILLE_MAX_DEFAUT):
+        self.dossier = dossier
+        self.ttl = ttl
+        self.taille_max = taille_max
+        os.makedirs(dossier, exist_ok=True)
+
+        self._verrou = threading.Lock()
+        self._db = sqlite3.connect(
+            os.path.join(dossier, "index.sqlite"), check_same_thread=False
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS entrees (
+                cle TEXT PRIMARY KEY,
+                url TEXT,
+                taille INTEGER,
+                cree REAL,
+                acces REAL,
+                etag TEXT,
+                last_modified TEXT,
+                content_type TEXT
+            )"""
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_acces ON entrees(acces)")
+        self._db.commit()
+
+    def _chemin(self, cle):
+        return os.path.join(self.dossier, cle[:2], cle)
+
+    def lire(self, url, params=None):
+        """Renvoie l'entrée {contenu, frais, etag, last_modified, content_type} ou None"""
+        cle = cle_cache(url, params)
+        with self._verrou:
+            ligne = self._db.execute(
+                "SELECT cree, etag, last_modified, content_type FROM entrees WHERE cle = ?",
+                (cle,),
+            ).fetchone()
+            if ligne is None:
+                return None
+            try:
+                with open(self._chemin(cle), "rb") as f:
+                    contenu = zlib.decompress(f.read())
+            except (OSError, zlib.error):
+                self._db.execute("DELETE FROM entrees WHERE cle = ?", (cle,))
+                self._db.commit()
+                return None
+            self._db.execute("UPDATE entrees SET acces = ? WHERE cle = ?", (time.time(), cle))
+            self._db.commit()
+
+        cree, etag, last_modified, content_type = ligne
+        return {
+            "contenu": contenu,
+            "frais": time.time() - cree < self.ttl,
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_type": content_type,
+        }
+
+    def ecrire(self, url, contenu, params=None, etag=None, last_modified=None, content_type=None):
+        cle = cle_cache(url, params)
+        compresse = zlib.compress(contenu, 6)
+        chemin = self._chemin(cle)
+        os.makedirs(os.path.dirname(chemin), exist_ok=True)
+
+        with self._verrou:
+            temporaire = f"{chemin}.{threading.get_ident()}.tmp"
+            with open(temporaire, "wb") as f:
+                f.write(compresse)
+            os.replace(temporaire, chemin)
+
+            maintenant = time.time()
+            self._db.execute(
+                "INSERT OR REPLACE INTO entrees VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    cle,
+                    normaliser_url(url, params),
+                    len(compresse),
+                    maintenant,
+                    maintenant,
+                    etag,
+                    last_modified,
+                    content_type,
+                ),
+            )
+            self._evincer()
+            self._db.commit()
+
+    def revalider(self, url, params=None):
+        """La réponse n'a pas changé (304) : l'entrée repart pour un TTL complet"""
+        with self._verrou:
+            maintenant = time.time()
+            self._db.execute(
+                "UPDATE entrees SET cree = ?, acces = ? WHERE cle = ?",
+                (maintenant, maintenant, cle_cache(url, params)),
+            )
+            self._db.commit()
+
+    def _evincer(self):
+        """LRU : supprime les entrées les moins récemment lues au-delà de taille_max"""
+        total = self._db.execute("SELECT COALESCE(SUM(taille), 0) FROM entrees").fetchone()[0]
+        if total <= self.taille_max:
+            return
+        for cle, taille in self._db.execute(
+            "SELECT cle, taille FROM entrees ORDER BY acces ASC"
+        ).fetchall():
+            try:
+                os.remove(self._chemin(cle))
+            except OSError:
+                pass
+            self._db.execute("DELETE FROM entrees WHERE cle = ?", (cle,))
+            total -= taille
+            if total <= self.taille_max:
+                break
+
+    # Pages lues par Selenium : on garde directement les données utiles en JSON
+    def lire_json(self, url, params=None):
+        entree = self.lire(url, params)
+        if entree is None or not entree["frais"]:
+            return None
+        return json.loads(entree["contenu"].decode("utf-8"))
+
+    def ecrire_json(self, url, donnees, params=None):
+        contenu = json.dumps(donnees, ensure_ascii=False).encode("utf-8")
+        self.ecrire(url, contenu, params=params, content_type="application/json")
+
+    def fermer(self):
+        with self._verrou:
+            self._db.close()
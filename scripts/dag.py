@@ -0,0 +1,249 @@
+"""
+Petit exécuteur d'étapes à entrées / sorties déclarées (graphe acyclique) :
+
+    etapes = [Etape("oms", nettoyer_oms, entrees=[...], sorties=[...]), ...]
+    executer(etapes, "data/etat_nettoyage.json", nb_workers=4)
+
+Une étape dépend de celles qui produisent ses entrées. Elle est sautée si
+l'empreinte de ses entrées (contenu des fichiers) et de son code n'a pas
+changé depuis sa dernière réussite et que ses sorties sont intactes. Les
+étapes prêtes tournent en parallèle (threads), leur affichage est regroupé
+par étape pour ne pas s'entremêler.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import hashlib
+import inspect
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+NB_WORKERS = 4
+TAILLE_BLOC = 1024 * 1024
+
+
+# ==========================================
+# 🧩 ÉTAPES
+# ==========================================
+class Etape:
+    """Fonction sans argument qui lit `entrees` et écrit `sorties` (chemins de fichiers).
+
+    code : fonctions ou modules supplémentaires dont le source compte dans
+    l'empreinte (ex: module des mots-clés utilisé par l'étape), ou données
+    JSON (ex: types des colonnes écrites).
+    facultative : sautée (sans erreur) si une entrée n'existe pas.
+    """
+
+    def __init__(self, nom, fonction, entrees, sorties, code=(), facultative=False):
+        self.nom = nom
+        self.fonction = fonction
+        self.entrees = list(entrees)
+        self.sorties = list(sorties)
+        self.code = [fonction, *code]
+        self.facultative = facultative
+
+    def empreinte_code(self):
+        h = hashlib.sha256()
+        for objet in self.code:
+            if isinstance(objet, (dict, list)):
+                h.update(json.dumps(objet, sort_keys=True).encode("utf-8"))
+            else:
+                h.update(inspect.getsource(objet).encode("utf-8"))
+        h.update(json.dumps([self.entrees, self.sorties]).encode("utf-8"))
+        return h.hexdigest()
+
+
+def dependances(etapes):
+    """{nom: noms des étapes qui produisent une de ses entrées} ; erreur si cycle ou sortie en double"""
+    producteurs = {}
+    for etape in etapes:
+        for sortie in etape.sorties:
+            if sortie in producteurs:
+                raise ValueError(f"{sortie} produit par {producteurs[sortie]} et {etape.nom}")
+            producteurs[sortie] = etape.nom
+    graphe = {
+        etape.nom: {producteurs[e] for e in etape.entrees if e in producteurs}
+        for etape in etapes
+    }
+
+    # Tri topologique (Kahn) uniquement pour détecter un cycle
+    restantes = {nom: set(deps) for nom, deps in graphe.items()}
+    while restantes:
+        pretes = [nom for nom, deps in restantes.items() if not deps]
+        if not pretes:
+            raise ValueError(f"Cycle entre les étapes : {', '.join(sorted(restantes))}")
+        for nom in pretes:
+            del restantes[nom]
+        for deps in restantes.values():
+            deps.difference_update(pretes)
+    return graphe
+
+
+# ==========================================
+# 🔑 EMPREINTES DE FICHIERS
+# ==========================================
+class EmpreintesFichiers:
+    """SHA-256 du contenu des fichiers, recalculé seulement si taille ou date ont changé"""
+
+    def __init__(self, connues=None):
+        self.connues = dict(connues or {})  # chemin -> [taille, mtime_ns, sha]
+        self._verrou = threading.Lock()
+
+    def empreinte(self, chemin):
+        """Empreinte du fichier, ou None s'il n'existe pas"""
+        try:
+            infos = os.stat(chemin)
+        except FileNotFoundError:
+            return None
+        with self._verrou:
+            connue = self.connues.get(chemin)
+        if connue and connue[0] == infos.st_size and connue[1] == infos.st_mtime_ns:
+            return connue[2]
+
+        h = hashlib.sha256()
+        with open(chemin, "rb") as f:
+            for bloc in iter(lambda: f.read(TAILLE_BLOC), b""):
+                h.update(bloc)
+        with self._verrou:
+            self.connues[chemin] = [infos.st_size, infos.st_mtime_ns, h.hexdigest()]
+        return h.hexdigest()
+
+    def instantane(self):
+        with self._verrou:
+            return dict(self.connues)
+
+
+# ==========================================
+# 🖨️ AFFICHAGE PAR ÉTAPE
+# ==========================================
+class SortieParThread(io.TextIOBase):
+    """sys.stdout de remplacement : chaque thread d'étape écrit dans son propre tampon"""
+
+    def __init__(self, sortie):
+        self.sortie = sortie
+        self._local = threading.local()
+
+    def capturer(self):
+        self._local.tampon = io.StringIO()
+
+    def liberer(self):
+        tampon = getattr(self._local, "tampon", None)
+        self._local.tampon = None
+        return tampon.getvalue() if tampon else ""
+
+    def write(self, texte):
+        tampon = getattr(self._local, "tampon", None)
+        return (tampon or self.sortie).write(texte)
+
+    def flush(self):
+        self.sortie.flush()
+
+
+# ==========================================
+# 🚀 EXÉCUTION
+# ==========================================
+def _charger_etat(chemin):
+    if not os.path.exists(chemin):
+        return {"etapes": {}, "fichiers": {}}
+    with open(chemin, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _sauver_etat(chemin, etat):
+    os.makedirs(os.path.dirname(chemin) or ".", exist_ok=True)
+    temporaire = chemin + ".tmp"
+    with open(temporaire, "w", encoding="utf-8") as f:
+        json.dump(etat, f, ensure_ascii=False, indent=2)
+    os.replace(temporaire, chemin)
+
+
+def executer(etapes, chemin_etat, nb_workers=NB_WORKERS, forcer=()):
+    """Exécute les étapes périmées, en parallèle dès que leurs dépendances sont finies.
+
+    forcer : noms d'étapes à relancer même si elles sont à jour ("*" : toutes).
+    Renvoie {nom: "faite" | "a_jour" | "sautee" | "echec" | "bloquee"}.
+    """
+    graphe = dependances(etapes)
+    par_nom = {etape.nom: etape for etape in etapes}
+    etat = _charger_etat(chemin_etat)
+    empreintes = EmpreintesFichiers(etat.get("fichiers"))
+    verrou_etat = threading.Lock()
+
+    sortie = SortieParThread(sys.stdout)
+    sys.stdout = sortie
+
+    def lancer(etape):
+        """Exécutée dans un thread : (statut, affichage, durée)"""
+        sortie.capturer()
+        debut = time.perf_counter()
+        try:
+            entrees = {chemin: empreintes.empreinte(chemin) for chemin in etape.entrees}
+            manquantes = [chemin for chemin, sha in entrees.items() if sha is None]
+            if manquantes:
+                if etape.facultative:
+                    print(f"⏭️ Entrée absente : {', '.join(manquantes)}")
+                    return "sautee", sortie.liberer(), 0.0
+                raise FileNotFoundError(f"Entrée absente : {', '.join(manquantes)}")
+
+            empreinte = hashlib.sha256(
+                json.dumps([etape.empreinte_code(), entrees], sort_keys=True).encode("utf-8")
+            ).hexdigest()
+            with verrou_etat:
+                precedente = etat["etapes"].get(etape.nom, {})
+            sorties_intactes = precedente.get("sorties") == {
+                chemin: empreintes.empreinte(chemin) for chemin in etape.sorties
+            }
+            if precedente.get("empreinte") == empreinte and sorties_intactes and not (
+                "*" in forcer or etape.nom in forcer
+            ):
+                return "a_jour", sortie.liberer(), 0.0
+
+            etape.fonction()
+            resultat = {
+                "empreinte": empreinte,
+                "sorties": {chemin: empreintes.empreinte(chemin) for chemin in etape.sorties},
+                "faite_le": time.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            with verrou_etat:
+                etat["etapes"][etape.nom] = resultat
+                etat["fichiers"] = empreintes.instantane()
+                _sauver_etat(chemin_etat, etat)
+            return "faite", sortie.liberer(), time.perf_counter() - debut
+        except Exception:
+            print(traceback.format_exc())
+            return "echec", sortie.liberer(), time.perf_counter() - debut
+
+    statuts = {}
+    en_cours = {}
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, nb_workers)) as pool:
+            while len(statuts) < len(etapes):
+                for nom, deps in graphe.items():
+                    if nom in statuts or nom in en_cours.values():
+                        continue
+                    if any(statuts.get(d) in ("echec", "bloquee") for d in deps):
+                        statuts[nom] = "bloquee"
+                        print(f"\n⛔ [{nom}] non lancée : une étape dont elle dépend a échoué")
+                    elif all(d in statuts for d in deps):
+                        en_cours[pool.submit(lancer, par_nom[nom])] = nom
+                if not en_cours:
+                    continue
+
+                finies, _ = wait(en_cours, return_when=FIRST_COMPLETED)
+                for futur in finies:
+                    nom = en_cours.pop(futur)
+                    statut, affichage, duree = futur.result()
+                    statuts[nom] = statut
+                    if statut == "a_jour":
+                        print(f"\n✔️ [{nom}] à jour, sautée")
+                    else:
+                        icone = {"faite": "✅", "sautee": "⏭️", "echec": "❌"}[statut]
+                        print(f"\n{icone} [{nom}] {statut} ({duree:.2f}s)")
+                        print(affichage.rstrip("\n"))
+    finally:
+        sys.stdout = sortie.sortie
+    return statuts
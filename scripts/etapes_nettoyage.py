@@ -0,0 +1,485 @@
+"""
+Étapes de 3_Nettoyage.py, une fonction par partie : chaque étape lit des
+fichiers et en écrit d'autres, déclarés dans ETAPES pour l'exécuteur
+(scripts/dag.py) qui ne relance que les étapes dont les entrées ou le code
+ont changé.
+"""
+
+import pandas as pd
+
+import regions
+import nettoyage_essais
+from regions import classer_sponsors, MemoRegions
+from nettoyage_essais import extraire_nct_ids, nettoyer_titres
+import sorties_typees
+from sorties_typees import chemin_parquet, ecrire_sortie
+from dag import Etape
+
+# ==========================================
+# 📂 FICHIERS
+# ==========================================
+OMS_BRUT = "data/oms/dataset-absolute-numbers-mort-both-sexes-in-2022-continents (1).csv"
+PUBMED_BRUT = "data/DATA_API_PUBMED.csv"
+PUBMED_ANNEES_BRUT = "data/publications_by_year.csv"
+ESSAIS_BRUT = "data/scraping/FINAL_DATASET_CANCER.csv"
+BUDGET_BRUT = "data/Budget.csv"
+# Liste des fichiers Google Trends
+FICHIERS_TENDANCES = {
+    "Lung Cancer": "data/Google-Trend/lung_cancer.csv",
+    "Breast Cancer": "data/Google-Trend/breast_cancer.csv",
+    "Pancreatic Cancer": "data/Google-Trend/pancreatic_cancer.csv",
+    "Leukemia": "data/Google-Trend/leukemia.csv",
+    "Prostate Cancer": "data/Google-Trend/prostate_cancer.csv",
+}
+
+MORTALITE = "data_clean/cancer_mortality_2022.csv"
+RECHERCHE_VS_MORTALITE = "data_clean/cancer_research_vs_mortality.csv"
+PUBLICATIONS_ANNEES = "data_clean/publications_by_year.csv"
+ESSAIS = "data_clean/clinical_trials_clean.csv"
+ESSAIS_PAR_CANCER = "data_clean/trials_count_by_cancer.csv"
+BUDGET = "data_clean/nci_budget_2023.csv"
+TENDANCES = "data_clean/google_trends_comparison.csv"
+GEOGRAPHIE = "data_clean/clinical_trials_geography_count.csv"
+GEOGRAPHIE_PCT = "data_clean/clinical_trials_geography_percentage.csv"
+
+# Types des colonnes du Parquet écrit à côté de chaque CSV (scripts/sorties_typees.py)
+TYPES_SORTIES = {
+    MORTALITE: {"Label": "texte", "Mortality": "entier"},
+    RECHERCHE_VS_MORTALITE: {
+        "Cancer": "categorie",
+        "Publications_2024": "entier",
+        "Mortality_2022": "entier",
+        "Publications_per_1000_deaths": "reel",
+    },
+    PUBLICATIONS_ANNEES: {
+        "Cancer": "categorie",
+        "Year": "entier16",
+        "Publications": "entier",
+        "Mortality_2022": "entier",
+        "Publications_per_1000_deaths": "reel",
+    },
+    ESSAIS: {
+        "Cancer": "categorie",
+        "Trial_ID": "texte",
+        "Title": "texte",
+        "Sponsor": "texte",
+        "Status": "categorie",
+        "URL": "texte",
+        "Cancers": "categorie",
+        "Phase": "categorie",
+        "Enrollment": "entier",
+        "Start_Date": "texte",
+        "Completion_Date": "texte",
+        "Conditions": "texte",
+        "Intervention_Type": "categorie",
+        "Countries": "texte",
+    },
+    ESSAIS_PAR_CANCER: {"Cancer": "categorie", "Clinical_Trials_Count": "entier"},
+    BUDGET: {"Cancer": "categorie", "Budget_2023_Million_USD": "reel"},
+    TENDANCES: {
+        "Cancer": "categorie",
+        "Mean_Interest_Score": "reel",
+        "Max_Score": "entier",
+        "Countries_Count": "entier",
+        "Top_3_Countries": "texte",
+        "Relative_Visibility_%": "reel",
+    },
+    # Une colonne par région : comptes entiers / pourcentages réels
+    GEOGRAPHIE: {"Cancer": "categorie"},
+    GEOGRAPHIE_PCT: {"Cancer": "categorie"},
+}
+
+
+# ==========================================
+# 🏥 PARTIE 1 : Nettoyer le fichier OMS
+# ==========================================
+def nettoyer_oms():
+    df_oms = pd.read_csv(OMS_BRUT)
+
+    # Garder seulement 2 colonnes
+    df_clean = df_oms[["Label", "Mortality"]]
+
+    # Supprimer les lignes vides/inutiles
+    df_clean = df_clean.dropna()
+    df_clean = df_clean[df_clean["Mortality"] > 0]
+
+    # Trier par mortalité décroissante
+    df_clean = df_clean.sort_values("Mortality", ascending=False)
+
+    # Sauvegarder
+    ecrire_sortie(df_clean, MORTALITE, TYPES_SORTIES[MORTALITE])
+
+
+# ==========================================
+# 📚 PARTIE 2 : Ajouter Mortality au fichier PubMed
+# ==========================================
+def enrichir_pubmed():
+    df_pubmed = pd.read_csv(PUBMED_BRUT)
+    df_clean = pd.read_csv(MORTALITE)
+
+    # Mapping OMS → PubMed (pour faire correspondre les noms)
+    cancer_mapping = {
+        "Lung Cancer": "Trachea bronchus and lung",
+        "Breast Cancer": "Breast",
+        "Pancreatic Cancer": "Pancreas",
+        "Leukemia": "Leukaemia",
+        "Prostate Cancer": "Prostate",
+    }
+
+    # Créer une colonne avec le nom OMS
+    df_pubmed["Label_OMS"] = df_pubmed["Maladie"].map(cancer_mapping)
+
+    # Fusionner avec les données de mortalité
+    df_pubmed_enriched = df_pubmed.merge(
+        df_clean[["Label", "Mortality"]], left_on="Label_OMS", right_on="Label", how="left"
+    )
+
+    # Garder seulement les colonnes utiles
+    df_pubmed_enriched = df_pubmed_enriched[
+        ["Maladie", "Nb_Publications_2024", "Mortality"]
+    ]
+
+    # Renommer pour plus de clarté
+    df_pubmed_enriched.columns = ["Cancer", "Publications_2024", "Mortality_2022"]
+
+    # Calculer le ratio (publications pour 1000 morts)
+    df_pubmed_enriched["Publications_per_1000_deaths"] = (
+        df_pubmed_enriched["Publications_2024"]
+        / df_pubmed_enriched["Mortality_2022"]
+        * 1000
+    ).round(2)
+
+    # Sauvegarder
+    ecrire_sortie(df_pubmed_enriched, RECHERCHE_VS_MORTALITE, TYPES_SORTIES[RECHERCHE_VS_MORTALITE])
+
+    print(df_pubmed_enriched)
+
+
+def publications_annuelles():
+    """Série annuelle (2_ApiSearch.py --series) : même rapport à la mortalité, année par année"""
+    df_pubmed_enriched = pd.read_csv(RECHERCHE_VS_MORTALITE)
+    df_pubmed_annees = pd.read_csv(PUBMED_ANNEES_BRUT)
+    df_pubmed_annees = df_pubmed_annees.merge(
+        df_pubmed_enriched[["Cancer", "Mortality_2022"]],
+        left_on="Maladie",
+        right_on="Cancer",
+        how="left",
+    )[["Cancer", "Annee", "Nb_Publications", "Mortality_2022"]]
+    df_pubmed_annees.columns = ["Cancer", "Year", "Publications", "Mortality_2022"]
+    df_pubmed_annees["Publications_per_1000_deaths"] = (
+        df_pubmed_annees["Publications"] / df_pubmed_annees["Mortality_2022"] * 1000
+    ).round(2)
+    df_pubmed_annees = df_pubmed_annees.sort_values(["Cancer", "Year"])
+    ecrire_sortie(df_pubmed_annees, PUBLICATIONS_ANNEES, TYPES_SORTIES[PUBLICATIONS_ANNEES])
+    print(f"📈 Publications par année : {len(df_pubmed_annees)} lignes")
+
+
+# ==========================================
+# 🧪 PARTIE 3 : Nettoyer les essais cliniques
+# ==========================================
+def nettoyer_essais():
+    df_trials = pd.read_csv(ESSAIS_BRUT)
+
+    print(f"\n📊 Essais cliniques - Nombre de lignes initial : {len(df_trials)}")
+
+    # Extraire l'ID et nettoyer le titre
+    # (une opération par colonne au lieu d'un appel par ligne : scripts/nettoyage_essais.py)
+    df_trials["Clinical_Trial_ID"] = extraire_nct_ids(df_trials["URL"])
+    df_trials["Title_Clean"] = nettoyer_titres(df_trials["Titre"])
+
+    # Supprimer les doublons (garder la première occurrence de chaque ID)
+    df_trials_unique = df_trials.drop_duplicates(subset=["Clinical_Trial_ID"], keep="first")
+
+    print(f"🗑️  Doublons supprimés : {len(df_trials) - len(df_trials_unique)}")
+    print(f"✅ Nombre de lignes final : {len(df_trials_unique)}")
+
+    # Réorganiser les colonnes (les colonnes de détail absentes d'un ancien scraping restent vides)
+    colonnes_trials = {
+        "Maladie": "Cancer",
+        "Clinical_Trial_ID": "Trial_ID",
+        "Title_Clean": "Title",
+        "Sponsor": "Sponsor",
+        "Statut": "Status",
+        "URL": "URL",
+        "Maladies": "Cancers",
+        "Phase": "Phase",
+        "Effectif": "Enrollment",
+        "Date_Debut": "Start_Date",
+        "Date_Fin": "Completion_Date",
+        "Conditions": "Conditions",
+        "Type_Intervention": "Intervention_Type",
+        "Pays": "Countries",
+    }
+    df_trials_clean = df_trials_unique.reindex(columns=list(colonnes_trials))
+
+    # Renommer pour cohérence
+    df_trials_clean.columns = list(colonnes_trials.values())
+    df_trials_clean["Cancers"] = df_trials_clean["Cancers"].fillna(df_trials_clean["Cancer"])
+    df_trials_clean["Enrollment"] = df_trials_clean["Enrollment"].astype("Int64")
+
+    # Compter les essais par cancer
+    trials_count = df_trials_clean["Cancer"].value_counts().reset_index()
+    trials_count.columns = ["Cancer", "Clinical_Trials_Count"]
+
+    print("\n📈 Nombre d'essais cliniques par cancer :")
+    print(trials_count)
+
+    # Sauvegarder
+    ecrire_sortie(df_trials_clean, ESSAIS, TYPES_SORTIES[ESSAIS])
+    ecrire_sortie(trials_count, ESSAIS_PAR_CANCER, TYPES_SORTIES[ESSAIS_PAR_CANCER])
+
+    print("\n✅ Fichiers essais cliniques sauvegardés :")
+    print("   - clinical_trials_clean.csv")
+    print("   - trials_count_by_cancer.csv")
+
+
+# ==========================================
+# 💰 PARTIE 4 : Nettoyer les budgets NCI
+# ==========================================
+# Fonction pour nettoyer les montants
+def clean_budget(value):
+    """Convertit les montants en float"""
+    if pd.isna(value):
+        return None
+
+    # Convertir en string
+    value = str(value)
+
+    # Supprimer $ et espaces
+    value = value.replace("$", "").replace(" ", "")
+
+    # Remplacer virgules par points
+    value = value.replace(",", ".")
+
+    try:
+        return float(value)
+    except:
+        return None
+
+
+def nettoyer_budget():
+    # https://www.cancer.gov/about-nci/budget/fact-book/data/research-funding
+    df_budget = pd.read_csv(BUDGET_BRUT)
+
+    print(f"\n💰 Budget NCI - Nombre de lignes initial : {len(df_budget)}")
+
+    # Nettoyer la colonne 2023 Estimate
+    df_budget["Budget_2023_Million_USD"] = df_budget["2023 Estimate"].apply(clean_budget)
+
+    # Garder seulement les colonnes utiles
+    df_budget_clean = df_budget[["Disease Area", "Budget_2023_Million_USD"]].copy()
+
+    # Renommer
+    df_budget_clean.columns = ["Cancer", "Budget_2023_Million_USD"]
+
+    # Filtrer pour garder seulement les 5 cancers qui nous intéressent
+    cancers_to_keep = [
+        "Lung Cancer",
+        "Breast Cancer",
+        "Pancreatic Cancer",
+        "Leukemia",
+        "Prostate Cancer",
+    ]
+    df_budget_filtered = df_budget_clean[
+        df_budget_clean["Cancer"].isin(cancers_to_keep)
+    ].copy()
+
+    print("\n💵 Budgets NCI 2023 extraits :")
+    print(df_budget_filtered)
+
+    # Sauvegarder
+    ecrire_sortie(df_budget_filtered, BUDGET, TYPES_SORTIES[BUDGET])
+
+    print("\n✅ Fichier budget sauvegardé : nci_budget_2023.csv")
+
+
+# ==========================================
+# 📊 PARTIE 5 : Analyser Google Trends
+# ==========================================
+def analyser_tendances():
+    print(f"\n📊 Google Trends - Visibilité médiatique des cancers\n")
+
+    # Liste pour stocker les résultats
+    trends_results = []
+
+    # Analyser chaque fichier
+    for cancer_name, filepath in FICHIERS_TENDANCES.items():
+        # Charger le fichier (skip les 2 premières lignes)
+        df_trend = pd.read_csv(filepath, skiprows=2)
+
+        # La colonne 2 contient les scores
+        column_name = df_trend.columns[1]
+
+        # Nettoyer : supprimer les lignes vides et convertir en numérique
+        df_trend[column_name] = pd.to_numeric(df_trend[column_name], errors="coerce")
+
+        # Supprimer les NaN
+        df_trend_clean = df_trend.dropna(subset=[column_name])
+
+        # Calculer les statistiques
+        mean_score = df_trend_clean[column_name].mean()
+        max_score = df_trend_clean[column_name].max()
+        count_countries = len(df_trend_clean)
+
+        # Top 3 pays
+        top_countries = df_trend_clean.head(3)["Country"].tolist()
+        top_scores = df_trend_clean.head(3)[column_name].tolist()
+
+        trends_results.append(
+            {
+                "Cancer": cancer_name,
+                "Mean_Interest_Score": round(mean_score, 2),
+                "Max_Score": int(max_score),
+                "Countries_Count": count_countries,
+                "Top_3_Countries": ", ".join(top_countries[:3]),
+            }
+        )
+
+        print(f"✅ {cancer_name}")
+        print(f"   Score moyen : {mean_score:.2f}")
+        print(f"   Score max : {max_score}")
+        print(f"   Nombre de pays : {count_countries}")
+        print(
+            f"   Top 3 pays : {', '.join([f'{c} ({s})' for c, s in zip(top_countries[:3], top_scores[:3])])}"
+        )
+        print()
+
+    # Créer un DataFrame de comparaison
+    df_trends_comparison = pd.DataFrame(trends_results)
+
+    # Trier par score moyen décroissant
+    df_trends_comparison = df_trends_comparison.sort_values(
+        "Mean_Interest_Score", ascending=False
+    )
+
+    print("\n" + "=" * 70)
+    print("📈 CLASSEMENT DE LA VISIBILITÉ MÉDIATIQUE (Google Trends)")
+    print("=" * 70)
+    print(
+        df_trends_comparison[["Cancer", "Mean_Interest_Score", "Max_Score"]].to_string(
+            index=False
+        )
+    )
+
+    # Calcul du ratio de visibilité
+    max_score_overall = df_trends_comparison["Mean_Interest_Score"].max()
+
+    df_trends_comparison["Relative_Visibility_%"] = (
+        df_trends_comparison["Mean_Interest_Score"] / max_score_overall * 100
+    ).round(2)
+
+    print("\n" + "=" * 70)
+    print("🔍 ANALYSE : Visibilité relative")
+    print("=" * 70)
+    print(
+        df_trends_comparison[
+            ["Cancer", "Mean_Interest_Score", "Relative_Visibility_%"]
+        ].to_string(index=False)
+    )
+
+    # Sauvegarder
+    ecrire_sortie(df_trends_comparison, TENDANCES, TYPES_SORTIES[TENDANCES])
+
+    print("\n✅ Fichier Google Trends sauvegardé : google_trends_comparison.csv")
+
+
+# ==========================================
+# 🌍 PARTIE 6 : Répartition géographique des essais cliniques
+# ==========================================
+def repartir_geographie():
+    print(f"\n🌍 Répartition géographique des essais cliniques\n")
+    df_trials_clean = pd.read_csv(ESSAIS)
+
+    # Appliquer l'extraction de pays/région
+    # (mots-clés compilés une fois en automate, ordre de priorité inchangé : scripts/regions.py)
+    # Seuls les sponsors jamais vus sont classés, les autres viennent du mémo
+    memo_regions = MemoRegions()
+    df_trials_clean["Region"] = classer_sponsors(df_trials_clean["Sponsor"], memo_regions)
+    memo_regions.fermer()
+    print(f"   {memo_regions.nb_ajoutes} nouveau(x) sponsor(s) classé(s)"
+          + (" (mots-clés modifiés : mémo réinitialisé)" if memo_regions.invalide else ""))
+
+    # Compter les essais par cancer ET par région
+    geo_distribution = (
+        df_trials_clean.groupby(["Cancer", "Region"]).size().reset_index(name="Count")
+    )
+
+    # Pivoter pour avoir un tableau lisible
+    geo_pivot = (
+        geo_distribution.pivot(index="Cancer", columns="Region", values="Count")
+        .fillna(0)
+        .astype(int)
+    )
+
+    print("📊 Répartition géographique des essais cliniques :")
+    print(geo_pivot)
+
+    # Calculer les pourcentages par cancer
+    geo_pivot_pct = geo_pivot.div(geo_pivot.sum(axis=1), axis=0) * 100
+    geo_pivot_pct = geo_pivot_pct.round(1)
+
+    print("\n📊 Répartition géographique en % :")
+    print(geo_pivot_pct)
+
+    # Sauvegarder
+    ecrire_sortie(geo_pivot, GEOGRAPHIE, TYPES_SORTIES[GEOGRAPHIE], index=True)
+    ecrire_sortie(geo_pivot_pct, GEOGRAPHIE_PCT, TYPES_SORTIES[GEOGRAPHIE_PCT], index=True)
+
+    print("\n✅ Fichiers géographiques sauvegardés :")
+    print("   - clinical_trials_geography_count.csv")
+    print("   - clinical_trials_geography_percentage.csv")
+
+    # Statistiques globales
+    print("\n🌐 Statistiques globales par région :")
+    total_by_region = df_trials_clean["Region"].value_counts()
+    print(total_by_region)
+
+
+# ==========================================
+# 🔗 GRAPHE DES ÉTAPES
+# ==========================================
+def sorties(*chemins_csv):
+    """Chaque CSV et son Parquet typé"""
+    return [chemin for csv in chemins_csv for chemin in (csv, chemin_parquet(csv))]
+
+
+def typage(*chemins_csv):
+    """Code et types des Parquet : les modifier relance l'étape"""
+    return [sorties_typees, *(TYPES_SORTIES[csv] for csv in chemins_csv)]
+
+
+# Dépendances déduites des fichiers : une étape attend celles qui produisent ses entrées
+ETAPES = [
+    Etape("oms", nettoyer_oms, [OMS_BRUT], sorties(MORTALITE), code=typage(MORTALITE)),
+    Etape(
+        "pubmed",
+        enrichir_pubmed,
+        [PUBMED_BRUT, MORTALITE],
+        sorties(RECHERCHE_VS_MORTALITE),
+        code=typage(RECHERCHE_VS_MORTALITE),
+    ),
+    Etape(
+        "publications_annuelles",
+        publications_annuelles,
+        [PUBMED_ANNEES_BRUT, RECHERCHE_VS_MORTALITE],
+        sorties(PUBLICATIONS_ANNEES),
+        code=typage(PUBLICATIONS_ANNEES),
+        facultative=True,
+    ),
+    Etape(
+        "essais",
+        nettoyer_essais,
+        [ESSAIS_BRUT],
+        sorties(ESSAIS, ESSAIS_PAR_CANCER),
+        code=[nettoyage_essais, *typage(ESSAIS, ESSAIS_PAR_CANCER)],
+    ),
+    Etape("budget", nettoyer_budget, [BUDGET_BRUT], sorties(BUDGET), code=[clean_budget, *typage(BUDGET)]),
+    Etape("tendances", analyser_tendances, list(FICHIERS_TENDANCES.values()), sorties(TENDANCES), code=typage(TENDANCES)),
+    Etape(
+        "geographie",
+        repartir_geographie,
+        [ESSAIS],
+        sorties(GEOGRAPHIE, GEOGRAPHIE_PCT),
+        code=[regions, *typage(GEOGRAPHIE, GEOGRAPHIE_PCT)],
+    ),
+]
@@ -0,0 +1,313 @@
+import re
+
+from journal import nct_depuis_url, COLONNES_DETAIL, SEPARATEUR_MALADIES
+from pays import PAYS, PAYS_AMBIGUS
+
+# Valeurs par défaut quand un champ n'est pas trouvé
+TITRE_INCONNU = "Titre Inconnu"
+STATUT_INCONNU = "Inconnu"
+SPONSOR_INCONNU = "Non spécifié"
+
+# Mot-clé trouvé dans le texte -> statut, par ordre de priorité.
+# Les cinq premiers sont ceux d'origine ; les suivants, libellés du site pour
+# les autres statuts, ne servent que si aucun des cinq n'apparaît.
+STATUTS_TEXTE = {
+    "Recruiting": "Recruiting",
+    "Completed": "Completed",
+    "Active, not recruiting": "Active",
+    "Terminated": "Terminated",
+    "Withdrawn": "Withdrawn",
+    "Not yet recruiting": "Not yet recruiting",
+    "Enrolling by invitation": "Enrolling by invitation",
+    "Suspended": "Suspended",
+    "No longer available": "No longer available",
+    "Temporarily not available": "Temporarily not available",
+    "Approved for marketing": "Approved for marketing",
+    "Withheld": "Withheld",
+    "Available": "Available",
+    "Unknown": "Unknown",
+}
+MOIS = {
+    "January": "01", "February": "02", "March": "03", "April": "04",
+    "May": "05", "June": "06", "July": "07", "August": "08",
+    "September": "09", "October": "10", "November": "11", "December": "12",
+}
+# Types d'intervention affichés devant le nom ("Drug: Pembrolizumab")
+TYPES_INTERVENTION = [
+    "Drug", "Biological", "Procedure", "Radiation", "Device", "Behavioral", "Genetic",
+    "Dietary Supplement", "Combination Product", "Diagnostic Test", "Other",
+]
+# Lignes qui terminent la liste des conditions
+FIN_CONDITIONS = (
+    "Keywords", "Intervention", "Other Study ID", "Study ", "Brief Summary", "Official Title",
+    "Phase", "Enrollment", "Location", "Eligibility", "Participation", "Sponsor", "Collaborator",
+)
+MAX_CONDITIONS = 20
+# Section des sites sur la fiche (les pays ne sont cherchés que là si elle existe)
+TITRES_SITES = ("Contacts and Locations", "Locations")
+FIN_SITES = "Participation Criteria"
+_PAYS = set(PAYS)
+_SUITES_PAYS = {p.split(", ", 1)[1] for p in PAYS if ", " in p}
+_TYPES_INTERVENTION = set(TYPES_INTERVENTION)
+
+_QUALIFICATIF = r"(?:[^\S\n]*\((?:Actual|Estimated|Anticipated)\))?[^\S\n]*:?\s*"
+_DATE = r"\d{4}-\d{2}(?:-\d{2})?|(?:" + "|".join(MOIS) + r")(?: \d{1,2},)? \d{4}"
+
+# Motifs précompilés, appliqués seulement là où leur mot-clé apparaît
+_MOTIF_NCT = re.compile(r"NCT\d+")
+_MOTIF_PHASE = re.compile(r"Phase [1-4](?:[^\S\n]*/[^\S\n]*Phase [1-4])?")
+_MOTIF_PHASE_NA = re.compile(r"Phase" + _QUALIFICATIF + "Not Applicable")
+_MOTIF_EFFECTIF = re.compile(r"Enrollment" + _QUALIFICATIF + r"(\d[\d,]*)")
+_MOTIF_DEBUT = re.compile(r"Study Start" + _QUALIFICATIF + "(" + _DATE + ")")
+_MOTIF_FIN_ETUDE = re.compile(r"Study Completion" + _QUALIFICATIF + "(" + _DATE + ")")
+_MOTIF_FIN_PRIMAIRE = re.compile(r"Primary Completion" + _QUALIFICATIF + "(" + _DATE + ")")
+
+
+def formater_titre(nct_id, titre):
+    """Titre au format du <title> des fiches, attendu par 3_Nettoyage.py"""
+    return f"Study Details | {nct_id} | {titre} | ClinicalTrials.gov"
+
+
+def date_iso(date):
+    """'2021-03-15' / 'March 15, 2021' / 'March 2021' -> AAAA-MM(-JJ)"""
+    if date[0].isdigit():
+        return date
+    morceaux = date.replace(",", "").split()
+    if len(morceaux) == 3:
+        return f"{morceaux[2]}-{MOIS[morceaux[0]]}-{int(morceaux[1]):02d}"
+    return f"{morceaux[1]}-{MOIS[morceaux[0]]}"
+
+
+def _positions(texte, mot):
+    pos = texte.find(mot)
+    while pos != -1:
+        yield pos
+        pos = texte.find(mot, pos + 1)
+
+
+def _chercher(texte, mot, motif):
+    """Premier match de motif, essayé uniquement aux positions de mot"""
+    for pos in _positions(texte, mot):
+        match = motif.match(texte, pos)
+        if match:
+            return match
+    return None
+
+
+def _extraire_sponsor(texte):
+    """Même règle que chercher_sponsor, sans découper tout le texte en lignes"""
+    candidats = sorted(
+        [(pos, "Sponsor") for pos in _positions(texte, "Sponsor")]
+        + [(pos, "Responsible Party") for pos in _positions(texte, "Responsible Party")]
+    )
+    for pos, mot in candidats:
+        # La ligne doit commencer par le mot (ou par "Lead Sponsor")
+        debut_ligne = texte.rfind("\n", 0, pos) + 1
+        avant = texte[debut_ligne:pos].lstrip()
+        if avant and not (mot == "Sponsor" and avant == "Lead "):
+            continue
+
+        fin_ligne = texte.find("\n", pos)
+        reste = texte[pos + len(mot):fin_ligne if fin_ligne != -1 else None]
+        if ":" in reste:
+            candidat = reste.split(":", 1)[1].strip()
+            if len(candidat) > 2:
+                return candidat
+        elif fin_ligne != -1:
+            fin_suivante = texte.find("\n", fin_ligne + 1)
+            candidat = texte[fin_ligne + 1:fin_suivante if fin_suivante != -1 else None].strip()
+            if len(candidat) > 2 and "NCT" not in candidat:
+                return candidat
+    return SPONSOR_INCONNU
+
+
+def _en_debut_de_ligne(texte, pos):
+    debut_ligne = texte.rfind("\n", 0, pos) + 1
+    return not texte[debut_ligne:pos].strip()
+
+
+def _extraire_conditions(texte):
+    """Lignes qui suivent l'intitulé "Conditions" jusqu'à la section suivante"""
+    for mot in ("Conditions", "Condition"):
+        for pos in _positions(texte, mot + "\n"):
+            if not _en_debut_de_ligne(texte, pos):
+                continue
+            conditions = []
+            suite = texte[pos + len(mot) + 1:pos + len(mot) + 1 + 200 * MAX_CONDITIONS]
+            for ligne in suite.split("\n", MAX_CONDITIONS)[:MAX_CONDITIONS]:
+                ligne = ligne.strip()
+                if not ligne or ligne.startswith(FIN_CONDITIONS):
+                    break
+                if ligne not in conditions:
+                    conditions.append(ligne)
+            if conditions:
+                return SEPARATEUR_MALADIES.join(conditions)
+    return None
+
+
+def _extraire_types_intervention(texte):
+    """Types des interventions listées ("Drug: ...", "Procedure: ..."), dans l'ordre d'apparition"""
+    trouves = []
+    # Un seul parcours : chaque ": " dont le début de ligne est un type connu
+    for pos in _positions(texte, ": "):
+        candidat = texte[texte.rfind("\n", 0, pos) + 1:pos].strip()
+        if candidat in _TYPES_INTERVENTION and candidat not in trouves:
+            trouves.append(candidat)
+    return SEPARATEUR_MALADIES.join(trouves) or None
+
+
+def _section_sites(texte):
+    """Texte de la section des sites (tout le texte si l'intitulé est absent)"""
+    for titre in TITRES_SITES:
+        debut = texte.find("\n" + titre + "\n")
+        if debut != -1:
+            fin = texte.find("\n" + FIN_SITES + "\n", debut)
+            return texte[debut:fin if fin != -1 else None]
+    return texte
+
+
+def _extraire_pays(texte):
+    """Pays des sites : ligne "Ville, Région, Pays[, code postal]" ou ligne réduite au pays"""
+    trouves = []
+    for ligne in _section_sites(texte).split("\n"):
+        if ", " not in ligne:
+            pays, code_postal = ligne.strip(), False
+        else:
+            tete, _, pays = ligne.rstrip().rpartition(", ")
+            code_postal = pays[:1].isdigit()
+            if code_postal:
+                tete, _, pays = tete.rpartition(", ")
+            if pays in _SUITES_PAYS:
+                # "Seoul, Korea, Republic of"
+                pays = tete.rpartition(", ")[2] + ", " + pays
+        if pays in _PAYS and pays not in trouves and not (code_postal and pays in PAYS_AMBIGUS):
+            trouves.append(pays)
+    return SEPARATEUR_MALADIES.join(trouves) or None
+
+
+def _extraire_statut(texte):
+    """Règle de chercher_statut (premier mot-clé présent, par priorité), étendue à tous les statuts du site"""
+    return next((STATUTS_TEXTE[mot] for mot in STATUTS_TEXTE if mot in texte), STATUT_INCONNU)
+
+
+def extraire_statut_sponsor(texte):
+    """(statut, sponsor) seuls, pour les cartes de liste et les vérifications.
+
+    Mêmes règles qu'extraire_fiche, sans lire les autres champs : moins
+    cher que l'ancien chercher_statut + chercher_sponsor, qui découpait
+    tout le texte en lignes.
+    """
+    return _extraire_statut(texte), _extraire_sponsor(texte)
+
+
+def extraire_fiche(texte):
+    """Tous les champs d'une fiche à partir de son texte (fonction pure).
+
+    Réservée aux fiches : les cartes n'ont besoin que d'extraire_statut_sponsor.
+    Chaque champ est localisé par une recherche de sous-chaîne puis lu avec
+    un motif précompilé ancré à cet endroit : plusieurs passes en C, pas un
+    parcours unique. Mesuré en CPython, une seule regex pour tous les
+    repères ou une boucle sur les lignes sont plus lentes que ces passes.
+    Coût : 2 à 3 fois l'ancien statut + sponsor, pour dix champs
+    (benchmarks.py extraction).
+
+    Statut et sponsor suivent les mêmes règles que chercher_statut /
+    chercher_sponsor. Les champs à plusieurs valeurs (conditions, types
+    d'intervention, pays) sont joints par ";" comme la colonne Maladies.
+    """
+    statut = _extraire_statut(texte)
+
+    nct = _chercher(texte, "NCT", _MOTIF_NCT)
+    phase = _chercher(texte, "Phase ", _MOTIF_PHASE)
+    effectif = _chercher(texte, "Enrollment", _MOTIF_EFFECTIF)
+    debut = _chercher(texte, "Study Start", _MOTIF_DEBUT)
+    fin = _chercher(texte, "Study Completion", _MOTIF_FIN_ETUDE) or _chercher(
+        texte, "Primary Completion", _MOTIF_FIN_PRIMAIRE
+    )
+
+    if phase:
+        early = texte[max(0, phase.start() - 6):phase.start()] == "Early "
+        phase = ("Early " if early else "") + re.sub(r"\s*/\s*", "/", phase.group())
+    elif _chercher(texte, "Phase", _MOTIF_PHASE_NA):
+        phase = "Not Applicable"
+
+    return {
+        "Statut": statut,
+        "Sponsor": _extraire_sponsor(texte),
+        "NCT": nct.group() if nct else None,
+        "Phase": phase,
+        "Effectif": int(effectif.group(1).replace(",", "")) if effectif else None,
+        "Date_Debut": date_iso(debut.group(1)) if debut else None,
+        "Date_Fin": date_iso(fin.group(1)) if fin else None,
+        "Conditions": _extraire_conditions(texte),
+        "Type_Intervention": _extraire_types_intervention(texte),
+        "Pays": _extraire_pays(texte),
+    }
+
+
+# Versions d'origine (plusieurs passes sur le texte), gardées comme
+# référence pour `benchmarks.py extraction`
+def chercher_statut(texte_brut):
+    """Statut de l'essai d'après le texte de la page (ou de la carte)"""
+    if "Recruiting" in texte_brut: return "Recruiting"
+    elif "Completed" in texte_brut: return "Completed"
+    elif "Active, not recruiting" in texte_brut: return "Active"
+    elif "Terminated" in texte_brut: return "Terminated"
+    elif "Withdrawn" in texte_brut: return "Withdrawn"
+    return STATUT_INCONNU
+
+
+def chercher_sponsor(lignes):
+    """Sponsor : valeur après "Sponsor:" ou ligne suivant l'intitulé"""
+    for i, ligne in enumerate(lignes):
+        ligne = ligne.strip()
+        if ligne.startswith("Lead Sponsor") or ligne.startswith("Responsible Party") or ligne.startswith("Sponsor"):
+            if ":" in ligne:
+                candidat = ligne.split(":", 1)[1].strip()
+                if len(candidat) > 2:
+                    return candidat
+            elif i + 1 < len(lignes):
+                candidat_next = lignes[i+1].strip()
+                if len(candidat_next) > 2 and "NCT" not in candidat_next:
+                    return candidat_next
+    return SPONSOR_INCONNU
+
+
+def analyser_page(page):
+    """Champs d'une fiche rendue ({"titre": <title>, "texte": body}) :
+    titre, statut, sponsor et les colonnes de détail (phase, effectif, dates...)"""
+    # 1. TITRE
+    titre_page = page["titre"]
+    if "-" in titre_page:
+        titre = titre_page.rsplit('-', 1)[0].strip()
+    else:
+        titre = titre_page
+
+    # 2. SCANNER LE TEXTE
+    champs = extraire_fiche(page["texte"])
+    return {
+        "Titre": titre,
+        "Statut": champs["Statut"],
+        "Sponsor": champs["Sponsor"],
+        **{colonne: champs[colonne] for colonne in COLONNES_DETAIL},
+    }
+
+
+def analyser_carte(href, titre, texte):
+    """Champs disponibles sur une carte de la liste de résultats"""
+    titre = (titre or "").strip()
+    statut, sponsor = extraire_statut_sponsor(texte)
+    return {
+        "Titre": formater_titre(nct_depuis_url(href), titre) if titre else TITRE_INCONNU,
+        "Statut": statut,
+        "Sponsor": sponsor,
+    }
+
+
+def carte_complete(carte):
+    """Vrai si la carte suffit : pas besoin d'ouvrir la fiche"""
+    return bool(carte) and (
+        carte.get("Titre", TITRE_INCONNU) != TITRE_INCONNU
+        and carte.get("Statut", STATUT_INCONNU) != STATUT_INCONNU
+        and carte.get("Sponsor", SPONSOR_INCONNU) != SPONSOR_INCONNU
+    )
@@ -0,0 +1,366 @@
+"""
+Frontière de crawl partagée : conditions, pages de liste et études à traiter,
+stockées dans des fichiers SQLite (shards) que plusieurs processus, ou
+plusieurs machines montant le même dossier, vident ensemble :
+
+    python scripts/1_Scrapping.py --frontiere --conditions conditions.txt   # sur chaque machine
+    python scripts/frontiere.py stats
+    python scripts/frontiere.py compacter      # CSV final à partir des journaux de tous les workers
+
+Chaque tâche prise l'est avec un bail (propriétaire + échéance), prolongé
+à chaque étude ou page écrite : si le worker meurt, le bail expire et la
+tâche est reprise par un autre. Les
+échecs sont retentés avec un délai croissant, puis marqués "echec".
+"""
+
+import os
+import glob
+import json
+import time
+import zlib
+import socket
+import sqlite3
+import argparse
+from collections import namedtuple
+
+from journal import Journal, TamponEssais, nct_depuis_url, ecrire_dataset, SEPARATEUR_MALADIES
+
+# ==========================================
+# 🔧 CONFIGURATION
+# ==========================================
+DOSSIER_FRONTIERE = "data/scraping/frontiere"
+NB_SHARDS = 8  # fichiers SQLite : moins d'attente sur les verrous d'écriture
+DUREE_BAIL = 600  # secondes sans progrès avant qu'une tâche prise soit rendue à la frontière
+MAX_TENTATIVES = 3
+DELAI_REESSAI = 30  # secondes, doublé à chaque tentative
+DELAI_VERROU = 60  # attente max d'un verrou SQLite tenu par un autre processus
+FICHIER_META = "frontiere.json"  # nombre de shards, fixé par le premier worker
+
+SORTIE_CSV = "data/scraping/FINAL_DATASET_CANCER.csv"
+SORTIE_PARQUET = "data/scraping/FINAL_DATASET_CANCER.parquet"
+
+# Genres de tâches, par ordre de priorité : finir les études avant d'ouvrir de nouvelles listes
+GENRES = ["etude", "page", "condition"]
+
+Tache = namedtuple("Tache", "cle genre maladie page url tentatives")
+
+
+def proprietaire_par_defaut():
+    """Identifiant unique du worker : machine + processus"""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def cle_condition(maladie):
+    return f"condition:{maladie}"
+
+
+def cle_page(maladie, page):
+    return f"page:{maladie}:{page}"
+
+
+def lire_nb_shards(dossier, nb_shards=NB_SHARDS):
+    """Nombre de shards de la frontière, écrit une seule fois dans FICHIER_META.
+
+    Le premier worker crée le fichier (O_EXCL : un seul y parvient), les
+    autres lisent sa valeur, même s'ils démarrent en même temps sur un
+    dossier vide. Une frontière créée avant ce fichier garde ses shards.
+    """
+    chemin = os.path.join(dossier, FICHIER_META)
+    try:
+        fd = os.open(chemin, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        pass
+    else:
+        existants = glob.glob(os.path.join(dossier, "shard_*.sqlite"))
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"nb_shards": len(existants) or nb_shards}, f)
+
+    # Le créateur peut ne pas avoir fini d'écrire : on relit jusqu'à un contenu complet
+    echeance = time.time() + DELAI_VERROU
+    while True:
+        try:
+            with open(chemin, encoding="utf-8") as f:
+                return int(json.load(f)["nb_shards"])
+        except (ValueError, KeyError):
+            if time.time() > echeance:
+                raise
+            time.sleep(0.05)
+
+
+# ==========================================
+# 🧭 FRONTIÈRE
+# ==========================================
+class Frontiere:
+    """Tâches de crawl persistantes réparties sur nb_shards bases SQLite.
+
+    Une tâche est rangée dans le shard de hash(clé) : une étude (clé = NCT)
+    trouvée sous plusieurs conditions n'existe qu'une fois, et la table
+    liens garde toutes ses conditions. Pas de mode WAL : sa mémoire
+    partagée ne fonctionne pas entre machines sur un dossier réseau.
+    """
+
+    def __init__(self, dossier=DOSSIER_FRONTIERE, nb_shards=NB_SHARDS, proprietaire=None,
+                 duree_bail=DUREE_BAIL, max_tentatives=MAX_TENTATIVES):
+        self.dossier = dossier
+        os.makedirs(dossier, exist_ok=True)
+        self.proprietaire = proprietaire or proprietaire_par_defaut()
+        self.duree_bail = duree_bail
+        self.max_tentatives = max_tentatives
+
+        self.nb_shards = lire_nb_shards(dossier, nb_shards)
+        self._shards = [self._ouvrir(i) for i in range(self.nb_shards)]
+        # Chaque worker commence par un shard différent
+        self._premier = zlib.crc32(self.proprietaire.encode()) % self.nb_shards
+
+    def _ouvrir(self, num):
+        db = sqlite3.connect(
+            os.path.join(self.dossier, f"shard_{num:02d}.sqlite"),
+            timeout=DELAI_VERROU,
+            isolation_level=None,  # transactions explicites (BEGIN IMMEDIATE)
+            check_same_thread=False,  # appelée par le thread écrivain du pool de navigateurs
+        )
+        db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS taches (
+                cle TEXT PRIMARY KEY,
+                genre TEXT NOT NULL,
+                maladie TEXT,
+                page INTEGER,
+                url TEXT,
+                etat TEXT NOT NULL DEFAULT 'a_faire',  -- a_faire / en_cours / fait / echec
+                tentatives INTEGER NOT NULL DEFAULT 0,
+                disponible_le REAL NOT NULL DEFAULT 0,
+                proprietaire TEXT,
+                bail_jusqua REAL,
+                erreur TEXT,
+                maj REAL
+            );
+            CREATE INDEX IF NOT EXISTS taches_dispo ON taches (genre, etat, disponible_le);
+            CREATE TABLE IF NOT EXISTS liens (
+                nct TEXT,
+                maladie TEXT,
+                rang INTEGER,
+                PRIMARY KEY (nct, maladie)
+            );
+            """
+        )
+        return db
+
+    def _shard(self, cle):
+        return self._shards[zlib.crc32(cle.encode()) % self.nb_shards]
+
+    # --- Ajout -------------------------------------------------------------
+    def ajouter_condition(self, maladie):
+        return self._ajouter(cle_condition(maladie), "condition", maladie)
+
+    def ajouter_page(self, maladie, page):
+        return self._ajouter(cle_page(maladie, page), "page", maladie, page=page)
+
+    def ajouter_etude(self, url, maladie):
+        """Ajoute une étude (une seule tâche par NCT) ; renvoie True si elle est nouvelle"""
+        nct_id = nct_depuis_url(url)
+        if not nct_id:
+            return False
+        db = self._shard(nct_id)
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.execute(
+                "INSERT OR IGNORE INTO liens VALUES (?, ?, "
+                "(SELECT COUNT(*) FROM liens WHERE nct = ?))",
+                (nct_id, maladie, nct_id),
+            )
+            nouvelle = db.execute(
+                "INSERT OR IGNORE INTO taches (cle, genre, maladie, url, maj) VALUES (?, 'etude', ?, ?, ?)",
+                (nct_id, maladie, url, time.time()),
+            ).rowcount
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        return bool(nouvelle)
+
+    def _ajouter(self, cle, genre, maladie, page=None, url=None):
+        return bool(
+            self._shard(cle).execute(
+                "INSERT OR IGNORE INTO taches (cle, genre, maladie, page, url, maj) VALUES (?, ?, ?, ?, ?, ?)",
+                (cle, genre, maladie, page, url, time.time()),
+            ).rowcount
+        )
+
+    # --- Prise / fin de tâche ----------------------------------------------
+    def prendre(self, genre, nb=1):
+        """Jusqu'à nb tâches du genre donné, sous bail de ce worker"""
+        pris = []
+        for i in range(self.nb_shards):
+            if len(pris) >= nb:
+                break
+            db = self._shards[(self._premier + i) % self.nb_shards]
+            maintenant = time.time()
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                # Bail expiré d'une tâche déjà tentée max_tentatives fois : worker mort dessus à chaque fois
+                db.execute(
+                    "UPDATE taches SET etat = 'echec', erreur = 'Bail expiré', maj = ? "
+                    "WHERE etat = 'en_cours' AND bail_jusqua < ? AND tentatives >= ?",
+                    (maintenant, maintenant, self.max_tentatives),
+                )
+                lignes = db.execute(
+                    """SELECT cle, genre, maladie, page, url, tentatives FROM taches
+                       WHERE genre = ? AND (
+                           (etat = 'a_faire' AND disponible_le <= ?)
+                           OR (etat = 'en_cours' AND bail_jusqua < ?)
+                       )
+                       ORDER BY page, maj LIMIT ?""",
+                    (genre, maintenant, maintenant, nb - len(pris)),
+                ).fetchall()
+                db.executemany(
+                    """UPDATE taches SET etat = 'en_cours', proprietaire = ?, bail_jusqua = ?,
+                       tentatives = tentatives + 1, maj = ? WHERE cle = ?""",
+                    [(self.proprietaire, maintenant + self.duree_bail, maintenant, l[0]) for l in lignes],
+                )
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            pris.extend(Tache(*l[:5], l[5] + 1) for l in lignes)
+        return pris
+
+    def terminer(self, cle):
+        """Marque la tâche faite (ignoré si le bail a été repris par un autre worker)"""
+        self._shard(cle).execute(
+            "UPDATE taches SET etat = 'fait', bail_jusqua = NULL, erreur = NULL, maj = ? "
+            "WHERE cle = ? AND proprietaire = ? AND etat = 'en_cours'",
+            (time.time(), cle, self.proprietaire),
+        )
+
+    def prolonger(self, cles):
+        """Repousse le bail des tâches encore en cours chez ce worker (lot ou liste longue)"""
+        par_shard = {}
+        for cle in cles:
+            par_shard.setdefault(zlib.crc32(cle.encode()) % self.nb_shards, []).append(cle)
+        echeance = time.time() + self.duree_bail
+        for num, cles_shard in par_shard.items():
+            self._shards[num].execute(
+                f"UPDATE taches SET bail_jusqua = ? WHERE proprietaire = ? AND etat = 'en_cours' "
+                f"AND cle IN ({', '.join('?' * len(cles_shard))})",
+                (echeance, self.proprietaire, *cles_shard),
+            )
+
+    def echouer(self, cle, erreur):
+        """Rend la tâche avec un délai croissant, ou l'abandonne après max_tentatives"""
+        maintenant = time.time()
+        db = self._shard(cle)
+        db.execute(
+            """UPDATE taches SET
+                   etat = CASE WHEN tentatives >= ? THEN 'echec' ELSE 'a_faire' END,
+                   disponible_le = ? + ? * (1 << (tentatives - 1)),
+                   bail_jusqua = NULL, erreur = ?, maj = ?
+               WHERE cle = ? AND proprietaire = ? AND etat = 'en_cours'""",
+            (self.max_tentatives, maintenant, DELAI_REESSAI, str(erreur)[:500], maintenant,
+             cle, self.proprietaire),
+        )
+
+    def relancer_echecs(self):
+        """Remet les tâches abandonnées dans la file (après une panne réseau par ex.)"""
+        total = 0
+        for db in self._shards:
+            total += db.execute(
+                "UPDATE taches SET etat = 'a_faire', tentatives = 0, disponible_le = 0 WHERE etat = 'echec'"
+            ).rowcount
+        return total
+
+    # --- État ----------------------------------------------------------------
+    def restantes(self):
+        """Tâches pas encore faites ni abandonnées (dont celles en cours chez d'autres workers)"""
+        return sum(
+            db.execute("SELECT COUNT(*) FROM taches WHERE etat IN ('a_faire', 'en_cours')").fetchone()[0]
+            for db in self._shards
+        )
+
+    def stats(self):
+        """{(genre, etat): nombre}"""
+        compte = {}
+        for db in self._shards:
+            for genre, etat, nb in db.execute("SELECT genre, etat, COUNT(*) FROM taches GROUP BY genre, etat"):
+                compte[(genre, etat)] = compte.get((genre, etat), 0) + nb
+        return compte
+
+    def maladies(self, nct_id):
+        """Toutes les conditions sous lesquelles l'étude a été trouvée (même interface qu'IndexNCT)"""
+        lignes = self._shard(nct_id).execute(
+            "SELECT maladie FROM liens WHERE nct = ? ORDER BY rang", (nct_id,)
+        ).fetchall()
+        return SEPARATEUR_MALADIES.join(m for (m,) in lignes)
+
+    def fermer(self):
+        for db in self._shards:
+            db.close()
+
+
+# ==========================================
+# 📦 COMPACTION DES JOURNAUX DES WORKERS
+# ==========================================
+def chemin_journal(dossier, proprietaire):
+    """Un journal par worker : jamais deux processus dans le même fichier"""
+    return os.path.join(dossier, "journaux", f"journal_{proprietaire}.jsonl")
+
+
+def compacter(dossier=DOSSIER_FRONTIERE, chemin_csv=SORTIE_CSV, chemin_parquet=SORTIE_PARQUET):
+    """CSV final à partir de tous les journaux ; colonne Maladies recalculée depuis la frontière"""
+    frontiere = Frontiere(dossier)
+    tampon = TamponEssais()
+    for chemin in sorted(glob.glob(chemin_journal(dossier, "*"))):
+        journal = Journal(chemin, reprise=True)
+        journal.fermer()
+        for donnees in journal.lire():
+            tampon.ajouter(donnees)
+    if not len(tampon):
+        frontiere.fermer()
+        print("⚠️ Aucun essai dans les journaux de la frontière.")
+        return 0
+
+    df = tampon.dataframe()
+    df["Maladies"] = [frontiere.maladies(nct_id) or maladie for nct_id, maladie in zip(df["_nct"], df["Maladie"])]
+    frontiere.fermer()
+    nb_lignes = ecrire_dataset(df, chemin_csv, chemin_parquet)
+    print(f"💾 {chemin_csv} : {nb_lignes} essais.")
+    return nb_lignes
+
+
+def afficher_stats(dossier=DOSSIER_FRONTIERE):
+    frontiere = Frontiere(dossier)
+    compte = frontiere.stats()
+    frontiere.fermer()
+    print(f"🧭 Frontière {dossier} ({frontiere.nb_shards} shards)")
+    for genre in GENRES:
+        detail = ", ".join(
+            f"{etat} {compte.get((genre, etat), 0)}" for etat in ["a_faire", "en_cours", "fait", "echec"]
+        )
+        print(f"   {genre:<10} {detail}")
+
+
+# ==========================================
+# 🚀 LANCEMENT
+# ==========================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Frontière de crawl partagée")
+    parser.add_argument("--dossier", default=DOSSIER_FRONTIERE)
+    sous_commandes = parser.add_subparsers(dest="commande", required=True)
+
+    sous_commandes.add_parser("stats", help="Tâches par genre et par état")
+
+    p = sous_commandes.add_parser("compacter", help="CSV final à partir des journaux de tous les workers")
+    p.add_argument("--sortie", default=SORTIE_CSV)
+    p.add_argument("--parquet", default=SORTIE_PARQUET)
+
+    sous_commandes.add_parser("relancer-echecs", help="Remet les tâches abandonnées dans la file")
+
+    args = parser.parse_args()
+    if args.commande == "stats":
+        afficher_stats(args.dossier)
+    elif args.commande == "compacter":
+        compacter(args.dossier, args.sortie, args.parquet)
+    else:
+        frontiere = Frontiere(args.dossier)
+        print(f"🔁 {frontiere.relancer_echecs()} tâches remises dans la file.")
+        frontiere.fermer()
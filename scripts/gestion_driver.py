@@ -0,0 +1,173 @@
+import os
+import json
+import time
+import queue
+import threading
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import WebDriverException, SessionNotCreatedException
+from webdriver_manager.chrome import ChromeDriverManager
+
+from profil_navigateur import options_chrome, appliquer_blocages, PROFIL_DEFAUT
+
+# ==========================================
+# 🔧 CONFIGURATION
+# ==========================================
+# Chemin du chromedriver résolu au dernier run (évite l'appel réseau de ChromeDriverManager)
+FICHIER_CHEMIN_DRIVER = "data/scraping/chromedriver.json"
+DUREE_VALIDITE_CHEMIN = 7 * 24 * 3600  # Chrome se met à jour : on revérifie chaque semaine
+DELAI_CHARGEMENT = 30  # secondes max pour driver.get()
+DELAI_WATCHDOG = 60  # au-delà, le navigateur est considéré comme bloqué
+NB_CHAUDS = 1  # navigateurs de rechange déjà lancés
+
+_chemin_driver = None
+_verrou_chemin = threading.Lock()
+
+
+def chemin_driver(forcer=False):
+    """Chemin du chromedriver, résolu une seule fois par processus.
+
+    Ordre : variable CHROMEDRIVER_PATH, chemin mémorisé sur disque (s'il
+    existe encore et a moins d'une semaine), sinon ChromeDriverManager.
+    """
+    global _chemin_driver
+    with _verrou_chemin:
+        if _chemin_driver and not forcer:
+            return _chemin_driver
+
+        if os.environ.get("CHROMEDRIVER_PATH"):
+            _chemin_driver = os.environ["CHROMEDRIVER_PATH"]
+            return _chemin_driver
+
+        if not forcer and os.path.exists(FICHIER_CHEMIN_DRIVER):
+            with open(FICHIER_CHEMIN_DRIVER, encoding="utf-8") as f:
+                memo = json.load(f)
+            if os.path.exists(memo["chemin"]) and time.time() - memo["resolu"] < DUREE_VALIDITE_CHEMIN:
+                _chemin_driver = memo["chemin"]
+                return _chemin_driver
+
+        _chemin_driver = ChromeDriverManager().install()
+        os.makedirs(os.path.dirname(FICHIER_CHEMIN_DRIVER), exist_ok=True)
+        with open(FICHIER_CHEMIN_DRIVER, "w", encoding="utf-8") as f:
+            json.dump({"chemin": _chemin_driver, "resolu": time.time()}, f)
+        return _chemin_driver
+
+
+def lancer_chrome(profil=PROFIL_DEFAUT, headless=False, journal_reseau=False):
+    """Démarre un Chrome du profil donné avec le chromedriver mémorisé"""
+    options = options_chrome(profil, headless=headless, journal_reseau=journal_reseau)
+    try:
+        driver = webdriver.Chrome(service=Service(chemin_driver()), options=options)
+    except SessionNotCreatedException:
+        # Chrome a été mis à jour depuis la résolution : on retélécharge le bon driver
+        driver = webdriver.Chrome(service=Service(chemin_driver(forcer=True)), options=options)
+    appliquer_blocages(driver, profil)
+    driver.set_page_load_timeout(DELAI_CHARGEMENT)
+    return driver
+
+
+# ==========================================
+# 🔥 NAVIGATEURS CHAUDS + WATCHDOG
+# ==========================================
+class GestionnaireDrivers:
+    """Fournit des navigateurs déjà démarrés et surveille les opérations.
+
+    - prendre() : un navigateur de rechange s'il y en a un, sinon un neuf ;
+      un remplaçant est aussitôt préparé en arrière-plan
+    - surveiller(driver, action) : exécute action(driver) ; si elle dépasse
+      delai_watchdog, le chromedriver est tué et WebDriverException remonte
+    - Plus de vérification avant chaque page : on ne redémarre qu'après un échec
+    """
+
+    def __init__(self, profil=PROFIL_DEFAUT, headless=False, nb_chauds=NB_CHAUDS,
+                 delai_watchdog=DELAI_WATCHDOG, metriques=None):
+        self.profil = profil
+        self.headless = headless
+        self.nb_chauds = nb_chauds
+        self.delai_watchdog = delai_watchdog
+        self.metriques = metriques
+
+        self._chauds = queue.Queue()
+        self._en_preparation = 0
+        self._verrou = threading.Lock()
+        self._ferme = False
+
+    def _lancer(self):
+        return lancer_chrome(self.profil, headless=self.headless)
+
+    def _preparer(self):
+        try:
+            driver = self._lancer()
+        except Exception as e:
+            print(f"   ⚠️ Navigateur de rechange non démarré : {e}")
+            driver = None
+        with self._verrou:
+            self._en_preparation -= 1
+            if driver is not None and self._ferme:
+                driver.quit()
+            elif driver is not None:
+                self._chauds.put(driver)
+
+    def _rechauffer(self):
+        """Complète la réserve jusqu'à nb_chauds navigateurs"""
+        with self._verrou:
+            manquants = self.nb_chauds - self._chauds.qsize() - self._en_preparation
+            if self._ferme or manquants <= 0:
+                return
+            self._en_preparation += manquants
+        for _ in range(manquants):
+            threading.Thread(target=self._preparer, daemon=True).start()
+
+    def prendre(self):
+        try:
+            driver = self._chauds.get_nowait()
+        except queue.Empty:
+            driver = self._lancer()
+        self._rechauffer()
+        return driver
+
+    def remplacer(self, driver):
+        """Abandonne un navigateur en échec et en renvoie un autre"""
+        if self.metriques:
+            self.metriques.incrementer("redemarrages")
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        return self.prendre()
+
+    def surveiller(self, driver, action):
+        declenche = threading.Event()
+
+        def tuer():
+            declenche.set()
+            if self.metriques:
+                self.metriques.incrementer("watchdog")
+            try:
+                driver.service.process.kill()
+            except Exception:
+                pass
+
+        minuteur = threading.Timer(self.delai_watchdog, tuer)
+        minuteur.daemon = True
+        minuteur.start()
+        try:
+            return action(driver)
+        except Exception as e:
+            if declenche.is_set():
+                raise WebDriverException(f"Watchdog : pas de réponse après {self.delai_watchdog}s") from e
+            raise
+        finally:
+            minuteur.cancel()
+
+    def fermer(self):
+        with self._verrou:
+            self._ferme = True
+        while True:
+            try:
+                self._chauds.get_nowait().quit()
+            except queue.Empty:
+                break
+            except Exception:
+                pass
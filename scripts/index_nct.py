@@ -0,0 +1,84 @@
+import os
+import json
+
+from journal import nct_depuis_url, SEPARATEUR_MALADIES
+
+
+# ==========================================
+# 🗂️ INDEX DES ÉTUDES (TOUTES MALADIES)
+# ==========================================
+class IndexNCT:
+    """Ensemble des IDs NCT vus dans les listes, toutes maladies confondues.
+
+    Une étude trouvée sous plusieurs maladies n'est visitée qu'une fois ;
+    l'index garde la liste de ses maladies. Il est sauvegardé sur disque
+    après chaque maladie pour être repris avec --resume.
+    """
+
+    def __init__(self, chemin, reprise=False):
+        self.chemin = chemin
+        # nct -> {"url": ..., "maladies": [...], "carte": {...}} (ordre d'insertion conservé)
+        self.etudes = {}
+        self.maladies_listees = []
+
+        if reprise and os.path.exists(chemin):
+            with open(chemin, encoding="utf-8") as f:
+                data = json.load(f)
+            self.etudes = data.get("etudes", {})
+            self.maladies_listees = data.get("maladies_listees", [])
+
+    def ajouter(self, url, maladie, carte=None):
+        """Ajoute un lien (et les champs de sa carte) ; renvoie True si l'étude est nouvelle"""
+        nct_id = nct_depuis_url(url)
+        if not nct_id:
+            return False
+
+        if nct_id in self.etudes:
+            maladies = self.etudes[nct_id]["maladies"]
+            if maladie not in maladies:
+                maladies.append(maladie)
+            return False
+
+        self.etudes[nct_id] = {"url": url, "maladies": [maladie]}
+        if carte:
+            self.etudes[nct_id]["carte"] = carte
+        return True
+
+    def est_listee(self, maladie):
+        return maladie in self.maladies_listees
+
+    def marquer_listee(self, maladie):
+        if maladie not in self.maladies_listees:
+            self.maladies_listees.append(maladie)
+        self.sauvegarder()
+
+    def carte(self, nct_id):
+        """Champs lus sur la carte de l'étude (None si pas de mode cartes)"""
+        return self.etudes.get(nct_id, {}).get("carte")
+
+    def maladies(self, nct_id):
+        """Toutes les maladies d'une étude, dans l'ordre de LISTE_MALADIES"""
+        etude = self.etudes.get(nct_id)
+        return SEPARATEUR_MALADIES.join(etude["maladies"]) if etude else ""
+
+    def taches(self, deja_faits=()):
+        """(url, maladie principale) de chaque étude restant à visiter"""
+        return [
+            (etude["url"], etude["maladies"][0])
+            for nct_id, etude in self.etudes.items()
+            if nct_id not in deja_faits
+        ]
+
+    def sauvegarder(self):
+        os.makedirs(os.path.dirname(self.chemin) or ".", exist_ok=True)
+        temporaire = self.chemin + ".tmp"
+        with open(temporaire, "w", encoding="utf-8") as f:
+            json.dump(
+                {"maladies_listees": self.maladies_listees, "etudes": self.etudes},
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(temporaire, self.chemin)
+
+    def __len__(self):
+        return len(self.etudes)
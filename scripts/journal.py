@@ -0,0 +1,199 @@
+import os
+import re
+import sys
+import json
+import pandas as pd
+
+# Champs lus pendant la même visite de la fiche (extraction.extraire_fiche / API)
+COLONNES_DETAIL = [
+    "Phase", "Effectif", "Date_Debut", "Date_Fin", "Conditions", "Type_Intervention", "Pays",
+]
+COLONNES = ["Maladie", "Maladies", "Sponsor", "Statut", "Titre", "URL"] + COLONNES_DETAIL
+SEPARATEUR_MALADIES = ";"
+# Colonnes aux valeurs très répétées : une seule copie de chaque chaîne en mémoire
+COLONNES_INTERNEES = {"Maladie", "Maladies", "Sponsor", "Statut", "Phase", "Type_Intervention", "Pays"}
+TAILLE_LOT = 50_000  # essais par lot colonnaire lors de la conversion en DataFrame
+
+_MOTIF_NCT = re.compile(r"NCT\d+")
+
+
+def nct_depuis_url(url):
+    """Extrait l'ID NCT d'une URL de fiche (None si absent)"""
+    match = _MOTIF_NCT.search(url or "")
+    return match.group(0) if match else None
+
+
+def _finit_par_saut_de_ligne(chemin):
+    with open(chemin, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+# ==========================================
+# 🧱 ENREGISTREMENTS COMPACTS
+# ==========================================
+class Essai:
+    """Un essai : attributs fixes (__slots__) au lieu d'un dict par étude"""
+
+    __slots__ = tuple(COLONNES)
+
+    def __init__(self, donnees):
+        for colonne in COLONNES:
+            valeur = donnees.get(colonne)
+            if colonne in COLONNES_INTERNEES and isinstance(valeur, str):
+                valeur = sys.intern(valeur)
+            setattr(self, colonne, valeur)
+
+
+class TamponEssais:
+    """Dernière version de chaque essai, convertie en DataFrame par lots de colonnes.
+
+    Remplace la liste de dicts + drop_duplicates : une étude relue après une
+    reprise écrase simplement l'ancienne entrée.
+    """
+
+    def __init__(self, taille_lot=TAILLE_LOT):
+        self.taille_lot = taille_lot
+        self._essais = {}
+
+    def ajouter(self, donnees):
+        essai = Essai(donnees)
+        cle = nct_depuis_url(essai.URL) or essai.URL
+        # Réinsertion : l'étude prend la place de sa dernière apparition (comme keep="last")
+        self._essais.pop(cle, None)
+        self._essais[cle] = essai
+
+    def __len__(self):
+        return len(self._essais)
+
+    def lots(self):
+        """DataFrames successifs de taille_lot essais, construits colonne par colonne"""
+        cles = list(self._essais)
+        for i in range(0, len(cles), self.taille_lot):
+            essais = [self._essais[cle] for cle in cles[i:i + self.taille_lot]]
+            colonnes = {colonne: [getattr(e, colonne) for e in essais] for colonne in COLONNES}
+            colonnes["_nct"] = cles[i:i + self.taille_lot]
+            yield pd.DataFrame(colonnes)
+
+    def dataframe(self):
+        if not self._essais:
+            return pd.DataFrame()
+        return pd.concat(self.lots(), ignore_index=True)
+
+
+# ==========================================
+# 📒 JOURNAL APPEND-ONLY
+# ==========================================
+class Journal:
+    """Journal JSONL : une ligne par essai, écrite dès qu'il est récupéré.
+
+    Un crash ne perd au plus que la ligne en cours ; le CSV final est
+    reconstruit une seule fois à la fin avec compacter().
+    """
+
+    def __init__(self, chemin, reprise=False):
+        self.chemin = chemin
+        os.makedirs(os.path.dirname(chemin) or ".", exist_ok=True)
+        if not reprise and os.path.exists(chemin):
+            print(f"🧹 Nouveau journal (l'ancien {chemin} est remplacé).")
+            os.remove(chemin)
+        self._fichier = open(chemin, "a", encoding="utf-8")
+        if self._fichier.tell() > 0 and not _finit_par_saut_de_ligne(chemin):
+            # Dernière ligne tronquée par un crash : on repart sur une ligne propre
+            self._fichier.write("\n")
+
+    def ecrire(self, donnees):
+        self._fichier.write(json.dumps(donnees, ensure_ascii=False) + "\n")
+        self._fichier.flush()
+
+    def fermer(self):
+        if not self._fichier.closed:
+            self._fichier.close()
+
+    def lire(self):
+        """Parcourt les enregistrements (une ligne tronquée par un crash est ignorée)"""
+        if not os.path.exists(self.chemin):
+            return
+        with open(self.chemin, encoding="utf-8") as f:
+            for ligne in f:
+                try:
+                    yield json.loads(ligne)
+                except json.JSONDecodeError:
+                    continue
+
+    def ids_traites(self):
+        """IDs NCT déjà présents dans le journal (pour --resume)"""
+        ids = set()
+        for donnees in self.lire():
+            nct_id = nct_depuis_url(donnees.get("URL"))
+            if nct_id:
+                ids.add(nct_id)
+        return ids
+
+    def _dataframe(self):
+        # Une étude relue après une reprise : on garde la version la plus récente
+        tampon = TamponEssais()
+        for donnees in self.lire():
+            tampon.ajouter(donnees)
+        return tampon.dataframe()
+
+    def compacter(self, chemin_csv, chemin_parquet=None):
+        """Reconstruit le CSV (et le Parquet si demandé) à partir du journal"""
+        df = self._dataframe()
+        if df.empty:
+            return 0
+        return ecrire_dataset(df, chemin_csv, chemin_parquet)
+
+    def fusionner(self, chemin_csv, chemin_parquet=None):
+        """Mode incrémental : remplace/ajoute les études du journal dans le CSV existant"""
+        nouveaux = self._dataframe()
+        if not os.path.exists(chemin_csv):
+            return ecrire_dataset(nouveaux, chemin_csv, chemin_parquet) if not nouveaux.empty else 0
+        anciens = pd.read_csv(chemin_csv, encoding="utf-8-sig")
+        if nouveaux.empty:
+            return len(anciens)
+
+        anciens["_nct"] = anciens["URL"].map(nct_depuis_url).fillna(anciens["URL"])
+        if "Maladies" not in anciens.columns:
+            anciens["Maladies"] = anciens["Maladie"]
+
+        # Une étude modifiée garde toutes les maladies sous lesquelles elle était connue
+        connues = {}
+        for nct_id, maladie, maladies in zip(anciens["_nct"], anciens["Maladie"], anciens["Maladies"]):
+            liste = connues.setdefault(nct_id, [])
+            for m in [maladie] + str(maladies).split(SEPARATEUR_MALADIES):
+                if m and m != "nan" and m not in liste:
+                    liste.append(m)
+        fusionnees = [
+            connues.get(nct_id, []) + [
+                m for m in str(maladies).split(SEPARATEUR_MALADIES)
+                if m not in connues.get(nct_id, [])
+            ]
+            for nct_id, maladies in zip(nouveaux["_nct"], nouveaux["Maladies"])
+        ]
+        nouveaux["Maladie"] = [liste[0] for liste in fusionnees]
+        nouveaux["Maladies"] = [SEPARATEUR_MALADIES.join(liste) for liste in fusionnees]
+
+        df = pd.concat(
+            [anciens[~anciens["_nct"].isin(nouveaux["_nct"])], nouveaux],
+            ignore_index=True,
+        )
+        print(
+            f"🔀 Fusion : {nouveaux['_nct'].isin(anciens['_nct']).sum()} études mises à jour, "
+            f"{(~nouveaux['_nct'].isin(anciens['_nct'])).sum()} nouvelles."
+        )
+        return ecrire_dataset(df, chemin_csv, chemin_parquet)
+
+
+def ecrire_dataset(df, chemin_csv, chemin_parquet=None):
+    df = df[[c for c in COLONNES if c in df.columns]]
+    if "Effectif" in df.columns:
+        # Entier nullable : "1450" dans le CSV plutôt que "1450.0"
+        df = df.astype({"Effectif": "Int64"})
+    df.to_csv(chemin_csv, index=False, encoding="utf-8-sig")
+    if chemin_parquet:
+        try:
+            df.to_parquet(chemin_parquet, index=False)
+        except ImportError:
+            print("⚠️ pyarrow absent : export Parquet ignoré.")
+    return len(df)
@@ -0,0 +1,144 @@
+import json
+import time
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+# Bornes supérieures des classes d'histogramme (secondes)
+BORNES = [0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+
+
+# ==========================================
+# 📊 HISTOGRAMME
+# ==========================================
+class Histogramme:
+    """Histogramme cumulatif à classes fixes (même modèle que Prometheus)"""
+
+    def __init__(self, bornes=BORNES):
+        self.bornes = list(bornes)
+        self.comptes = [0] * (len(self.bornes) + 1)  # dernière classe : +Inf
+        self.nombre = 0
+        self.somme = 0.0
+        self.maximum = 0.0
+
+    def observer(self, valeur):
+        i = 0
+        while i < len(self.bornes) and valeur > self.bornes[i]:
+            i += 1
+        self.comptes[i] += 1
+        self.nombre += 1
+        self.somme += valeur
+        self.maximum = max(self.maximum, valeur)
+
+    def quantile(self, q):
+        """Borne supérieure de la classe contenant le quantile q"""
+        if not self.nombre:
+            return 0.0
+        rang = q * self.nombre
+        cumul = 0
+        for i, compte in enumerate(self.comptes):
+            cumul += compte
+            if cumul >= rang:
+                return self.bornes[i] if i < len(self.bornes) else self.maximum
+        return self.maximum
+
+    def resume(self):
+        return {
+            "nombre": self.nombre,
+            "total_s": round(self.somme, 3),
+            "moyenne_s": round(self.somme / self.nombre, 4) if self.nombre else 0.0,
+            "p50_s": self.quantile(0.5),
+            "p95_s": self.quantile(0.95),
+            "max_s": round(self.maximum, 3),
+            "classes": {
+                **{str(b): c for b, c in zip(self.bornes, self.comptes)},
+                "+Inf": self.comptes[-1],
+            },
+        }
+
+
+# ==========================================
+# ⏱️ MÉTRIQUES DU SCRAPER
+# ==========================================
+class Metriques:
+    """Temps par phase (navigation, attente, pause, parse, sauvegarde...) et compteurs.
+
+    Partagée entre threads : toutes les mises à jour passent par un verrou.
+    """
+
+    def __init__(self):
+        self.debut = time.time()
+        self.phases = {}
+        self.compteurs = {}
+        self._verrou = threading.Lock()
+
+    def observer(self, phase, duree):
+        with self._verrou:
+            if phase not in self.phases:
+                self.phases[phase] = Histogramme()
+            self.phases[phase].observer(duree)
+
+    @contextmanager
+    def mesurer(self, phase):
+        debut = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observer(phase, time.perf_counter() - debut)
+
+    def incrementer(self, compteur, n=1):
+        with self._verrou:
+            self.compteurs[compteur] = self.compteurs.get(compteur, 0) + n
+
+    def rapport(self):
+        with self._verrou:
+            duree = time.time() - self.debut
+            pages = self.compteurs.get("pages_liste", 0) + self.compteurs.get("fiches", 0)
+            return {
+                "debut": datetime.fromtimestamp(self.debut).isoformat(timespec="seconds"),
+                "duree_s": round(duree, 3),
+                "pages_par_seconde": round(pages / duree, 3) if duree else 0.0,
+                "compteurs": dict(self.compteurs),
+                "phases": {nom: h.resume() for nom, h in self.phases.items()},
+            }
+
+    def ecrire_json(self, chemin):
+        with open(chemin, "w", encoding="utf-8") as f:
+            json.dump(self.rapport(), f, ensure_ascii=False, indent=2)
+
+    def ecrire_prometheus(self, chemin):
+        """Format texte Prometheus (collecteur textfile de node_exporter)"""
+        rapport = self.rapport()
+        lignes = [
+            "# TYPE scraper_phase_seconds histogram",
+        ]
+        with self._verrou:
+            for nom, h in self.phases.items():
+                cumul = 0
+                for borne, compte in zip(h.bornes + ["+Inf"], h.comptes):
+                    cumul += compte
+                    lignes.append(f'scraper_phase_seconds_bucket{{phase="{nom}",le="{borne}"}} {cumul}')
+                lignes.append(f'scraper_phase_seconds_sum{{phase="{nom}"}} {h.somme:.6f}')
+                lignes.append(f'scraper_phase_seconds_count{{phase="{nom}"}} {h.nombre}')
+
+        lignes.append("# TYPE scraper_events_total counter")
+        for nom, valeur in sorted(rapport["compteurs"].items()):
+            lignes.append(f'scraper_events_total{{type="{nom}"}} {valeur}')
+        lignes.append("# TYPE scraper_pages_per_second gauge")
+        lignes.append(f"scraper_pages_per_second {rapport['pages_par_seconde']}")
+        lignes.append("# TYPE scraper_run_duration_seconds gauge")
+        lignes.append(f"scraper_run_duration_seconds {rapport['duree_s']}")
+
+        with open(chemin, "w", encoding="utf-8") as f:
+            f.write("\n".join(lignes) + "\n")
+
+    def afficher(self):
+        rapport = self.rapport()
+        print(f"\n📊 {rapport['duree_s']:.0f}s, {rapport['pages_par_seconde']} pages/s")
+        for nom, resume in sorted(rapport["phases"].items()):
+            print(
+                f"   {nom:<12} {resume['nombre']:>6} x  moy {resume['moyenne_s']:.3f}s"
+                f"  p95 ≤ {resume['p95_s']}s  total {resume['total_s']:.0f}s"
+            )
+        for nom, valeur in sorted(rapport["compteurs"].items()):
+            print(f"   {nom:<12} {valeur:>6}")
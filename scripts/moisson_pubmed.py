@@ -0,0 +1,278 @@
+"""
+Moisson des notices PubMed (PMID, année, revue, MeSH, titre, résumé) des
+termes de 2_ApiSearch.py, en Parquet partitionné par cancer :
+
+    python scripts/moisson_pubmed.py --annees 2015-2024
+    python scripts/moisson_pubmed.py --annees 2024 --maladies "Leukemia" --taille-lot 5000
+
+esearch avec usehistory=y (WebEnv), puis efetch par gros lots sur la
+recherche enregistrée. Chaque lot XML est lu en flux (iterparse, éléments
+libérés au fur et à mesure) et écrit comme un groupe de lignes Parquet :
+la mémoire dépend de la taille des lots, pas du nombre de notices.
+
+PubMed ne sert que les 9 999 premières notices d'une recherche : chaque
+année est découpée en fenêtres de dates (pdat) qui restent sous ce seuil.
+Une fenêtre terminée est un fichier, ignoré à la relance s'il a été écrit
+après la fin de la fenêtre ; sinon (année en cours) il est refait après
+`ttl` secondes, comme dans MemoComptes. Quand le découpage d'une année
+change (fenêtre devenue trop pleine), les fichiers de l'ancien découpage
+qui chevauchent le nouveau sont supprimés une fois celui-ci écrit. Un article peut
+tomber dans deux fenêtres (date électronique et date papier) : dédoublonner
+sur (cancer, PMID) à la lecture.
+"""
+
+import io
+import os
+import glob
+import time
+import asyncio
+import argparse
+import datetime
+import xml.etree.ElementTree as ET
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+from pubmed import (
+    ClientPubMed,
+    MemoComptes,
+    compter_fenetres,
+    fenetre_annee,
+    terme_maladie,
+    LISTE_MALADIES,
+    TTL_ANNEE_EN_COURS,
+)
+
+# ==========================================
+# 🔧 CONFIGURATION
+# ==========================================
+DOSSIER_MOISSON = "data/pubmed/articles"
+TAILLE_LOT = 2000  # notices par efetch (10 000 au plus côté NCBI)
+LOTS_EN_VOL = 3  # efetch simultanés d'une même fenêtre
+LIMITE_HISTORIQUE = 9999  # notices accessibles par recherche (retstart < 10 000)
+FORMAT_DATE = "%Y/%m/%d"
+
+if pa is not None:
+    SCHEMA = pa.schema([
+        ("PMID", pa.int64()),
+        ("Year", pa.int16()),
+        ("Journal", pa.string()),
+        ("MeSH", pa.list_(pa.string())),
+        ("Title", pa.string()),
+        ("Abstract", pa.string()),
+    ])
+
+
+def _verifier_pyarrow():
+    if pa is None:
+        raise ImportError("Le module pyarrow est requis pour la moisson : pip install pyarrow")
+
+
+# ==========================================
+# 📄 LECTURE DU XML EN FLUX
+# ==========================================
+def _texte(element):
+    """Texte complet d'un élément, balises de mise en forme (<i>, <sup>...) comprises"""
+    return "".join(element.itertext()).strip() if element is not None else None
+
+
+def _annee(article):
+    """Année de publication : PubDate/Year, sinon MedlineDate ("2023 Dec-2024 Jan"), sinon ArticleDate"""
+    date = article.find("Journal/JournalIssue/PubDate")
+    if date is not None:
+        annee = date.findtext("Year") or (date.findtext("MedlineDate") or "")[:4]
+        if annee.isdigit():
+            return int(annee)
+    annee = article.findtext("ArticleDate/Year")
+    return int(annee) if annee and annee.isdigit() else None
+
+
+def _resume(article):
+    """Parties du résumé jointes, préfixées de leur libellé (BACKGROUND: ...)"""
+    parties = []
+    for partie in article.iterfind("Abstract/AbstractText"):
+        texte = _texte(partie)
+        if not texte:
+            continue
+        libelle = partie.get("Label")
+        parties.append(f"{libelle}: {texte}" if libelle else texte)
+    return "\n".join(parties) or None
+
+
+def lire_notices(contenu):
+    """Colonnes (dict de listes) des PubmedArticle d'une réponse efetch XML"""
+    colonnes = {nom: [] for nom in SCHEMA.names}
+    evenements = ET.iterparse(io.BytesIO(contenu), events=("start", "end"))
+    _, racine = next(evenements)
+    for evenement, element in evenements:
+        if evenement != "end" or element.tag != "PubmedArticle":
+            continue
+        citation = element.find("MedlineCitation")
+        article = citation.find("Article")
+        colonnes["PMID"].append(int(citation.findtext("PMID")))
+        colonnes["Year"].append(_annee(article))
+        colonnes["Journal"].append(article.findtext("Journal/Title"))
+        colonnes["MeSH"].append(
+            [_texte(d) for d in citation.iterfind("MeshHeadingList/MeshHeading/DescriptorName")]
+        )
+        colonnes["Title"].append(_texte(article.find("ArticleTitle")))
+        colonnes["Abstract"].append(_resume(article))
+        # Notice lue : on la retire de l'arbre pour garder une mémoire constante
+        racine.clear()
+    return colonnes
+
+
+# ==========================================
+# 🗓️ FENÊTRES DE DATES
+# ==========================================
+def couper_fenetre(debut, fin):
+    """Deux moitiés d'une fenêtre (dates AAAA/MM/JJ incluses)"""
+    d = datetime.datetime.strptime(debut, FORMAT_DATE).date()
+    f = datetime.datetime.strptime(fin, FORMAT_DATE).date()
+    milieu = d + (f - d) // 2
+    return [
+        (debut, milieu.strftime(FORMAT_DATE)),
+        ((milieu + datetime.timedelta(days=1)).strftime(FORMAT_DATE), fin),
+    ]
+
+
+async def fenetres_moisson(client, terme, annees, memo=None):
+    """[(début, fin, nombre)] couvrant les années, chaque fenêtre sous LIMITE_HISTORIQUE.
+
+    Les fenêtres trop pleines sont coupées en deux jusqu'à passer sous le
+    seuil ; les nombres intermédiaires passent par le mémo des comptes.
+    """
+    a_compter = [fenetre_annee(annee) for annee in annees]
+    fenetres = []
+    while a_compter:
+        nombres = await compter_fenetres(client, [(terme, d, f) for d, f in a_compter], memo)
+        trop_pleines = []
+        for debut, fin in a_compter:
+            nombre = nombres[(terme, debut, fin)]
+            if isinstance(nombre, Exception):
+                raise nombre
+            if nombre == 0:
+                continue
+            if nombre <= LIMITE_HISTORIQUE or debut == fin:
+                if nombre > LIMITE_HISTORIQUE:
+                    print(f"   ⚠️ {debut} : {nombre} notices en un jour, seules {LIMITE_HISTORIQUE} sont accessibles")
+                fenetres.append((debut, fin, nombre))
+            else:
+                trop_pleines.extend(couper_fenetre(debut, fin))
+        a_compter = trop_pleines
+    return sorted(fenetres)
+
+
+# ==========================================
+# 🌾 MOISSON
+# ==========================================
+def chemin_fenetre(dossier, maladie, debut, fin):
+    """Fichier d'une fenêtre, dans la partition du cancer (cancer=<nom>)"""
+    nom = f"{debut.replace('/', '-')}_{fin.replace('/', '-')}.parquet"
+    return os.path.join(dossier, f"cancer={maladie}", nom)
+
+
+def fenetres_ecrites(dossier, maladie):
+    """{(début, fin): chemin} des fenêtres déjà écrites pour un cancer"""
+    ecrites = {}
+    for chemin in glob.glob(os.path.join(dossier, f"cancer={maladie}", "*_*.parquet")):
+        debut, _, fin = os.path.basename(chemin)[:-len(".parquet")].partition("_")
+        ecrites[(debut.replace("-", "/"), fin.replace("-", "/"))] = chemin
+    return ecrites
+
+
+def fenetre_a_jour(chemin, fin, ttl=TTL_ANNEE_EN_COURS):
+    """Vrai si le fichier de la fenêtre peut être gardé : écrit après sa fin, ou depuis moins de ttl"""
+    if not os.path.exists(chemin):
+        return False
+    ecrit_le = os.path.getmtime(chemin)
+    if datetime.date.fromtimestamp(ecrit_le).strftime(FORMAT_DATE) > fin:
+        return True
+    return time.time() - ecrit_le < ttl
+
+
+async def moissonner_fenetre(client, terme, debut, fin, chemin, taille_lot=TAILLE_LOT, lots_en_vol=LOTS_EN_VOL):
+    """Écrit les notices d'une fenêtre dans `chemin` ; renvoie le nombre de notices"""
+    resultat = await client.esearch(
+        terme, usehistory="y", retmax=0, datetype="pdat", mindate=debut, maxdate=fin
+    )
+    webenv, query_key = resultat["webenv"], resultat["querykey"]
+    nombre = min(int(resultat["count"]), LIMITE_HISTORIQUE)
+    departs = list(range(0, nombre, taille_lot))
+
+    # Fichier temporaire renommé à la fin : une fenêtre interrompue sera refaite
+    os.makedirs(os.path.dirname(chemin), exist_ok=True)
+    temporaire = chemin + ".tmp"
+    nb_notices = 0
+    with pq.ParquetWriter(temporaire, SCHEMA, compression="zstd") as ecrivain:
+        for i in range(0, len(departs), lots_en_vol):
+            contenus = await asyncio.gather(
+                *(client.efetch(webenv, query_key, d, min(taille_lot, nombre - d)) for d in departs[i:i + lots_en_vol])
+            )
+            for contenu in contenus:
+                colonnes = await asyncio.to_thread(lire_notices, contenu)
+                ecrivain.write_table(pa.Table.from_pydict(colonnes, schema=SCHEMA))
+                nb_notices += len(colonnes["PMID"])
+            del contenus
+    os.replace(temporaire, chemin)
+    return nb_notices
+
+
+async def moissonner(maladies, annees, dossier=DOSSIER_MOISSON, taille_lot=TAILLE_LOT, client=None, memo=None,
+                     ttl=TTL_ANNEE_EN_COURS):
+    """Moissonne chaque cancer, fenêtre par fenêtre ; renvoie {maladie: nb de notices écrites}"""
+    _verifier_pyarrow()
+    client = client or ClientPubMed()
+    bilan = {}
+    for maladie in maladies:
+        terme = terme_maladie(maladie)
+        fenetres = await fenetres_moisson(client, terme, annees, memo)
+        print(f"📚 {maladie} : {sum(n for _, _, n in fenetres)} notices en {len(fenetres)} fenêtres")
+
+        bilan[maladie] = 0
+        for debut, fin, nombre in fenetres:
+            chemin = chemin_fenetre(dossier, maladie, debut, fin)
+            if fenetre_a_jour(chemin, fin, ttl):
+                continue
+            bilan[maladie] += await moissonner_fenetre(client, terme, debut, fin, chemin, taille_lot)
+            print(f"   > {debut} - {fin} : {nombre} notices")
+
+        # Ancien découpage (fenêtre recoupée ou regroupée) : remplacé par les fenêtres ci-dessus
+        prevues = {(debut, fin) for debut, fin, _ in fenetres}
+        for (debut, fin), chemin in fenetres_ecrites(dossier, maladie).items():
+            if (debut, fin) not in prevues and any(d <= fin and debut <= f for d, f in prevues):
+                os.remove(chemin)
+                print(f"   🧹 {debut} - {fin} : remplacée par le nouveau découpage")
+    return bilan
+
+
+def lire_annees(texte):
+    """"2024" ou "2015-2024" -> range d'années"""
+    premiere, _, derniere = texte.partition("-")
+    return range(int(premiere), int(derniere or premiere) + 1)
+
+
+# ==========================================
+# 🚀 LANCEMENT
+# ==========================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Moisson des notices PubMed en Parquet partitionné")
+    parser.add_argument("--annees", required=True, metavar="DEBUT-FIN", help="Années de publication (ex: 2015-2024)")
+    parser.add_argument("--maladies", nargs="+", default=LISTE_MALADIES)
+    parser.add_argument("--dossier", default=DOSSIER_MOISSON)
+    parser.add_argument("--taille-lot", type=int, default=TAILLE_LOT, help="Notices par efetch")
+    args = parser.parse_args()
+
+    debut = time.perf_counter()
+    client = ClientPubMed()
+    memo = MemoComptes()
+    try:
+        bilan = asyncio.run(moissonner(args.maladies, lire_annees(args.annees), args.dossier, args.taille_lot, client, memo))
+    finally:
+        client.fermer()
+        memo.fermer()
+
+    print(f"\n✅ {sum(bilan.values())} notices écrites dans {args.dossier} en {time.perf_counter() - debut:.0f}s")
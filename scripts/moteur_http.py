@@ -0,0 +1,261 @@
+import os
+import asyncio
+from contextlib import nullcontext
+
+from recuperation_async import ClientAsync, MAX_EN_VOL
+from extraction import formater_titre, TITRE_INCONNU, STATUT_INCONNU, SPONSOR_INCONNU
+from journal import SEPARATEUR_MALADIES
+
+# ==========================================
+# 🔧 CONFIGURATION
+# ==========================================
+# API publique v2 de ClinicalTrials.gov (JSON). Surchargeable pour pointer
+# vers le serveur local de réponses enregistrées (scripts/serveur_local.py).
+API_URL = os.environ.get("CTGOV_API_URL", "https://clinicaltrials.gov/api/v2")
+URL_FICHE = "https://clinicaltrials.gov/study/{nct_id}"
+
+TAILLE_PAGE = 10  # Même nombre d'études que la vue "Card" du site
+
+# Statuts de l'API (tout l'enum overallStatus) -> valeurs du moteur Selenium
+# (extraction.STATUTS_TEXTE : libellés affichés par le site)
+STATUTS = {
+    "RECRUITING": "Recruiting",
+    "COMPLETED": "Completed",
+    "ACTIVE_NOT_RECRUITING": "Active",
+    "TERMINATED": "Terminated",
+    "WITHDRAWN": "Withdrawn",
+    "NOT_YET_RECRUITING": "Not yet recruiting",
+    "ENROLLING_BY_INVITATION": "Enrolling by invitation",
+    "SUSPENDED": "Suspended",
+    "NO_LONGER_AVAILABLE": "No longer available",
+    "TEMPORARILY_NOT_AVAILABLE": "Temporarily not available",
+    "APPROVED_FOR_MARKETING": "Approved for marketing",
+    "WITHHELD": "Withheld",
+    "AVAILABLE": "Available",
+    "UNKNOWN": "Unknown",
+}
+# Phases de l'API -> libellés du site ("PHASE2" -> "Phase 2")
+PHASES = {
+    "EARLY_PHASE1": "Early Phase 1",
+    "PHASE1": "Phase 1",
+    "PHASE2": "Phase 2",
+    "PHASE3": "Phase 3",
+    "PHASE4": "Phase 4",
+    "NA": "Not Applicable",
+}
+
+CHAMPS_FICHE = ",".join(
+    [
+        "protocolSection.identificationModule",
+        "protocolSection.statusModule",
+        "protocolSection.sponsorCollaboratorsModule",
+        "protocolSection.conditionsModule",
+        "protocolSection.designModule",
+        "InterventionType",
+        "LocationCountry",
+    ]
+)
+
+
+# ==========================================
+# 🌐 MOTEUR SANS NAVIGATEUR
+# ==========================================
+class MoteurHTTP:
+    """Récupère les études en JSON via l'API, sans lancer de navigateur.
+
+    Produit exactement les mêmes colonnes que le moteur Selenium :
+    Maladie / Sponsor / Statut / Titre / URL + colonnes de détail. Toutes les requêtes passent
+    par le client asyncio (débit par hôte, requêtes en vol bornées, retry).
+    """
+
+    def __init__(self, api_url=API_URL, max_en_vol=MAX_EN_VOL, cache=None, metriques=None, archive=None):
+        self.api_url = api_url.rstrip("/")
+        # "navigation" : échange HTTP seul, l'attente du débit est mesurée à part ("limitation")
+        self.client = ClientAsync(
+            max_en_vol=max_en_vol, headers={"Accept": "application/json"}, cache=cache, metriques=metriques
+        )
+        # Instrumentation optionnelle (metriques.Metriques)
+        self.metriques = metriques
+        # JSON brut de chaque étude, pour la ré-extraction hors ligne (archive_pages.ArchivePages)
+        self.archive = archive
+
+    def _mesurer(self, phase):
+        return self.metriques.mesurer(phase) if self.metriques else nullcontext()
+
+    def _compter(self, compteur):
+        if self.metriques:
+            self.metriques.incrementer(compteur)
+
+    def fermer(self):
+        self.client.fermer()
+
+    async def _lister_async(self, maladie, nb_pages, champs, params_extra=None, lever=False, apres_page=None):
+        """nb_pages=None : toutes les pages.
+
+        Une page en erreur arrête la liste : on renvoie les pages déjà lues,
+        ou, si lever, l'exception remonte (une liste incomplète n'est pas
+        acceptable pour l'appelant). apres_page() est appelée après chaque
+        page lue.
+        """
+        etudes_trouvees = []
+        params = {
+            "query.cond": maladie,
+            "pageSize": TAILLE_PAGE,
+            "fields": champs,
+            **(params_extra or {}),
+        }
+
+        # Pagination par jeton : chaque page dépend de la précédente
+        page_num = 0
+        while nb_pages is None or page_num < nb_pages:
+            page_num += 1
+            try:
+                data = await self.client.get_json(f"{self.api_url}/studies", params=params)
+            except Exception as e:
+                print(f"   ❌ PAGE {page_num}: {e}")
+                self._compter("erreurs")
+                if lever:
+                    raise
+                break
+            self._compter("pages_liste")
+            if apres_page:
+                apres_page()
+
+            etudes = data.get("studies", [])
+            etudes_trouvees.extend(etudes)
+            print(f"   PAGE {page_num}: {len(etudes)} liens trouvés.")
+
+            jeton = data.get("nextPageToken")
+            if not jeton:
+                break
+            params["pageToken"] = jeton
+
+        return etudes_trouvees
+
+    def lister_etudes(self, maladie, nb_pages, lever=False, apres_page=None):
+        """Renvoie les URLs des études d'une maladie (nb_pages pages de résultats).
+
+        lever : une page en erreur lève une exception au lieu de tronquer la liste.
+        """
+        etudes = asyncio.run(
+            self._lister_async(maladie, nb_pages, "NCTId", lever=lever, apres_page=apres_page)
+        )
+        return [
+            URL_FICHE.format(nct_id=etude["protocolSection"]["identificationModule"]["nctId"])
+            for etude in etudes
+        ]
+
+    def compter_etudes(self, maladie):
+        """Nombre total d'études d'une maladie (countTotal de l'API, une seule étude lue)"""
+        params = {"query.cond": maladie, "countTotal": "true", "pageSize": 1, "fields": "NCTId"}
+        data = asyncio.run(self.client.get_json(f"{self.api_url}/studies", params=params))
+        return int(data["totalCount"])
+
+    def lister_mises_a_jour(self, maladie, depuis=None, nb_pages=None):
+        """(url, date) des études mises à jour depuis `depuis` (AAAA-MM-JJ, incluse).
+
+        La liste est triée par date de dernière mise à jour décroissante et
+        filtrée côté serveur : seules les études nouvelles ou modifiées sont
+        parcourues. Sans `depuis`, on prend les nb_pages premières pages.
+        Une page en erreur lève une exception : avec une liste partielle, le
+        repère avancerait au-delà des études des pages manquantes.
+        """
+        params_extra = {"sort": "LastUpdatePostDate:desc"}
+        if depuis:
+            params_extra["filter.advanced"] = f"AREA[LastUpdatePostDate]RANGE[{depuis},MAX]"
+
+        etudes = asyncio.run(
+            self._lister_async(maladie, nb_pages, "NCTId,LastUpdatePostDate", params_extra, lever=True)
+        )
+        resultats = []
+        for etude in etudes:
+            protocole = etude["protocolSection"]
+            date = (
+                protocole.get("statusModule", {})
+                .get("lastUpdatePostDateStruct", {})
+                .get("date")
+            )
+            # Tri décroissant : la première étude plus ancienne que le repère clôt la liste
+            if depuis and date and date < depuis:
+                break
+            nct_id = protocole["identificationModule"]["nctId"]
+            resultats.append((URL_FICHE.format(nct_id=nct_id), date))
+        return resultats
+
+    def lister_cartes(self, maladie, nb_pages):
+        """Mode cartes : les champs de chaque étude sont demandés dès la liste"""
+        etudes = asyncio.run(self._lister_async(maladie, nb_pages, CHAMPS_FICHE))
+        cartes = []
+        for etude in etudes:
+            nct_id = etude["protocolSection"]["identificationModule"]["nctId"]
+            carte = convertir_etude(etude, URL_FICHE.format(nct_id=nct_id), None)
+            del carte["Maladie"]
+            cartes.append(carte)
+        return cartes
+
+    async def lire_fiche(self, url, maladie):
+        """Lit une étude via l'API. Les erreurs réseau remontent à l'appelant."""
+        nct_id = url.rstrip("/").split("/study/")[-1].split("?")[0]
+        data = await self.client.get_json(
+            f"{self.api_url}/studies/{nct_id}", params={"fields": CHAMPS_FICHE}
+        )
+        if self.archive:
+            self.archive.ajouter(url, maladie, data, genre="api")
+        with self._mesurer("analyse"):
+            return convertir_etude(data, url, maladie)
+
+    async def _lire_fiches_async(self, taches, ecrire, en_echec):
+        async def lire(url, maladie):
+            try:
+                info = await self.lire_fiche(url, maladie)
+                print(f"      ✅ Sponsor: {info['Sponsor']}")
+                self._compter("fiches")
+                return info
+            except Exception as e:
+                print(f"      ❌ Erreur fiche (passé): {e}")
+                self._compter("erreurs")
+                return en_echec(url, maladie)
+
+        # ecrire() est appelée depuis la boucle : un seul écrivain
+        for tache in asyncio.as_completed([lire(*tache) for tache in taches]):
+            ecrire(await tache)
+
+    def lire_fiches(self, taches, ecrire, en_echec):
+        """Lit toutes les fiches (url, maladie) en parallèle et passe chaque résultat à ecrire()"""
+        asyncio.run(self._lire_fiches_async(taches, ecrire, en_echec))
+
+
+def convertir_etude(data, url, maladie):
+    """Convertit le JSON d'une étude au format de sortie du scraper"""
+    protocole = data.get("protocolSection", {})
+    identification = protocole.get("identificationModule", {})
+    statut = protocole.get("statusModule", {})
+    sponsors = protocole.get("sponsorCollaboratorsModule", {})
+    design = protocole.get("designModule", {})
+    interventions = protocole.get("armsInterventionsModule", {}).get("interventions", [])
+    sites = protocole.get("contactsLocationsModule", {}).get("locations", [])
+
+    nct_id = identification.get("nctId", "")
+    titre = identification.get("briefTitle") or identification.get("officialTitle")
+    sponsor = sponsors.get("leadSponsor", {}).get("name")
+    phases = [PHASES.get(p, p) for p in design.get("phases", [])]
+    fin = statut.get("completionDateStruct") or statut.get("primaryCompletionDateStruct") or {}
+    conditions = protocole.get("conditionsModule", {}).get("conditions", [])
+    # Mêmes libellés que le site : "DIETARY_SUPPLEMENT" -> "Dietary Supplement"
+    types = [i["type"].replace("_", " ").title() for i in interventions if i.get("type")]
+    pays = [site["country"] for site in sites if site.get("country")]
+
+    return {
+        "Maladie": maladie,
+        "Titre": formater_titre(nct_id, titre) if titre else TITRE_INCONNU,
+        "Statut": STATUTS.get(statut.get("overallStatus"), STATUT_INCONNU),
+        "Sponsor": sponsor if sponsor else SPONSOR_INCONNU,
+        "URL": url,
+        "Phase": "/".join(phases) or None,
+        "Effectif": design.get("enrollmentInfo", {}).get("count"),
+        "Date_Debut": statut.get("startDateStruct", {}).get("date"),
+        "Date_Fin": fin.get("date"),
+        "Conditions": SEPARATEUR_MALADIES.join(dict.fromkeys(conditions)) or None,
+        "Type_Intervention": SEPARATEUR_MALADIES.join(dict.fromkeys(types)) or None,
+        "Pays": SEPARATEUR_MALADIES.join(dict.fromkeys(pays)) or None,
+    }
@@ -0,0 +1,99 @@
+"""
+Extraction de l'ID NCT et du titre des essais (PARTIE 3 de 3_Nettoyage.py),
+sur une colonne entière :
+
+    df["Clinical_Trial_ID"] = extraire_nct_ids(df["URL"])
+    df["Title_Clean"] = nettoyer_titres(df["Titre"])
+
+Méthodes .str de pandas sur une colonne de chaînes Arrow (ArrowDtype),
+appliquées à la colonne entière au lieu d'un appel Python par ligne ; sans
+pyarrow, repli sur les versions ligne par ligne d'origine (extract_nct_id,
+clean_title), qui restent la référence des mesures :
+python scripts/benchmarks.py colonnes.
+"""
+
+import re
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+# Troisième morceau de "Study Details | NCT... | TITRE | ClinicalTrials.gov"
+SEPARATEUR_TITRE = "|"
+SUFFIXE_TITRE = "ClinicalTrials.gov"
+# Caractères retirés par str.strip() (c.isspace()) : l'Unicode White_Space d'Arrow n'a pas \x1c-\x1f
+ESPACES = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005"
+    "\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+
+
+# ==========================================
+# ⚡ VERSIONS VECTORISÉES
+# ==========================================
+def _chaines_arrow(serie):
+    """Colonne de chaînes -> Series de chaînes Arrow (valeurs manquantes -> null)"""
+    return serie.astype(pd.ArrowDtype(pa.string()))
+
+
+def _vers_objets(serie):
+    """Series Arrow -> colonne object, None pour les valeurs manquantes (comme les versions ligne par ligne)"""
+    return serie.astype(object).where(serie.notna(), None)
+
+
+def extraire_nct_ids(urls):
+    """ID NCT ("NCT" + chiffres) de chaque URL, manquant si absent"""
+    if pa is None:
+        return urls.apply(lambda url: extract_nct_id(url) if isinstance(url, str) else None)
+
+    chaines = _chaines_arrow(urls)
+    ids = _vers_objets(chaines.str.extract(r"(?P<nct>NCT\d+)", expand=False))
+    # \d d'Arrow (RE2) ne reconnaît que les chiffres ASCII, celui de re tous les chiffres Unicode
+    non_ascii = (~chaines.str.isascii()).fillna(False).astype(bool)
+    if non_ascii.any():
+        ids[non_ascii] = urls[non_ascii].map(extract_nct_id)
+    return ids
+
+
+def nettoyer_titres(titres):
+    """Vrai titre de chaque titre de page ; inchangé s'il n'a pas au moins deux "|" """
+    if pa is None:
+        return titres.apply(clean_title)
+
+    # "||" ajouté à la fin : toutes les lignes ont un 3e morceau, gardé seulement s'il en avait déjà 3
+    chaines = _chaines_arrow(titres)
+    morceaux = (chaines + SEPARATEUR_TITRE * 2).str.split(SEPARATEUR_TITRE)
+    assez = (morceaux.list.len() >= 5).fillna(False).astype(bool)
+    propre = morceaux.list[2].str.strip(ESPACES).str.replace(SUFFIXE_TITRE, "", regex=False).str.strip(ESPACES)
+    return _vers_objets(propre.where(assez, chaines))
+
+
+# ==========================================
+# 🐢 VERSIONS LIGNE PAR LIGNE (RÉFÉRENCE)
+# ==========================================
+def extract_nct_id(url):
+    """Extrait l'ID NCT depuis l'URL"""
+    match = re.search(r"NCT\d+", url)
+    return match.group(0) if match else None
+
+
+def clean_title(titre):
+    """Extrait le vrai titre depuis la chaîne scraped"""
+    if pd.isna(titre):
+        return None
+
+    # Pattern : "Study Details | NCT... | TITRE | ClinicalTrials.gov"
+    parts = titre.split("|")
+    if len(parts) >= 3:
+        title = parts[2].strip()
+        title = title.replace("ClinicalTrials.gov", "").strip()
+        return title
+    return titre
+
+
+def identiques(a, b):
+    """Même valeur sur chaque ligne, valeurs manquantes (None, NaN) comprises"""
+    return bool(((a == b) | (a.isna() & b.isna())).all())
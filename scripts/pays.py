@@ -0,0 +1,44 @@
+# Noms de pays tels qu'affichés dans les sites des fiches ClinicalTrials.gov
+# (champ LocationCountry de l'API)
+PAYS = [
+    "Afghanistan", "Albania", "Algeria", "American Samoa", "Andorra", "Angola",
+    "Antigua and Barbuda", "Argentina", "Armenia", "Aruba", "Australia", "Austria",
+    "Azerbaijan", "Bahamas", "Bahrain", "Bangladesh", "Barbados", "Belarus", "Belgium",
+    "Belize", "Benin", "Bermuda", "Bhutan", "Bolivia", "Bosnia and Herzegovina",
+    "Botswana", "Brazil", "Brunei Darussalam", "Bulgaria", "Burkina Faso", "Burundi",
+    "Cambodia", "Cameroon", "Canada", "Cape Verde", "Cayman Islands",
+    "Central African Republic", "Chad", "Chile", "China", "Colombia", "Comoros",
+    "Congo", "Congo, The Democratic Republic of the", "Costa Rica", "Côte D'Ivoire",
+    "Croatia", "Cuba", "Curaçao", "Cyprus", "Czechia", "Czech Republic", "Denmark",
+    "Djibouti", "Dominica", "Dominican Republic", "Ecuador", "Egypt", "El Salvador",
+    "Equatorial Guinea", "Eritrea", "Estonia", "Eswatini", "Ethiopia", "Faroe Islands",
+    "Fiji", "Finland", "France", "French Guiana", "French Polynesia", "Gabon", "Gambia",
+    "Georgia", "Germany", "Ghana", "Gibraltar", "Greece", "Greenland", "Grenada",
+    "Guadeloupe", "Guam", "Guatemala", "Guinea", "Guinea-Bissau", "Guyana", "Haiti",
+    "Holy See (Vatican City State)", "Honduras", "Hong Kong", "Hungary", "Iceland",
+    "India", "Indonesia", "Iran, Islamic Republic of", "Iraq", "Ireland", "Israel",
+    "Italy", "Jamaica", "Japan", "Jersey", "Jordan", "Kazakhstan", "Kenya", "Kiribati",
+    "Korea, Democratic People's Republic of", "Korea, Republic of", "Kosovo", "Kuwait",
+    "Kyrgyzstan", "Lao People's Democratic Republic", "Latvia", "Lebanon", "Lesotho",
+    "Liberia", "Libya", "Liechtenstein", "Lithuania", "Luxembourg", "Macao",
+    "Madagascar", "Malawi", "Malaysia", "Maldives", "Mali", "Malta", "Martinique",
+    "Mauritania", "Mauritius", "Mayotte", "Mexico", "Moldova, Republic of", "Monaco",
+    "Mongolia", "Montenegro", "Morocco", "Mozambique", "Myanmar", "Namibia", "Nepal",
+    "Netherlands", "New Caledonia", "New Zealand", "Nicaragua", "Niger", "Nigeria",
+    "North Macedonia", "Norway", "Oman", "Pakistan", "Palestinian Territory, occupied",
+    "Panama", "Papua New Guinea", "Paraguay", "Peru", "Philippines", "Poland",
+    "Portugal", "Puerto Rico", "Qatar", "Réunion", "Romania", "Russian Federation",
+    "Rwanda", "Saint Kitts and Nevis", "Saint Lucia", "Samoa", "San Marino",
+    "Saudi Arabia", "Senegal", "Serbia", "Seychelles", "Sierra Leone", "Singapore",
+    "Slovakia", "Slovenia", "Somalia", "South Africa", "South Sudan", "Spain",
+    "Sri Lanka", "Sudan", "Suriname", "Sweden", "Switzerland", "Syrian Arab Republic",
+    "Taiwan", "Tajikistan", "Tanzania", "Thailand", "Togo", "Trinidad and Tobago",
+    "Tunisia", "Turkey", "Türkiye", "Turkmenistan", "Uganda", "Ukraine",
+    "United Arab Emirates", "United Kingdom", "United States", "Uruguay", "Uzbekistan",
+    "Vanuatu", "Venezuela", "Vietnam", "Virgin Islands (U.S.)", "Yemen", "Zambia",
+    "Zimbabwe",
+]
+
+# Noms qui sont aussi des États américains : refusés quand un code postal suit
+# ("Tbilisi, Georgia" mais pas "Atlanta, Georgia, 30322")
+PAYS_AMBIGUS = {"Georgia", "Jersey"}
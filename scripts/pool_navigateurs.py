@@ -0,0 +1,135 @@
+import os
+import queue
+import threading
+
+# ==========================================
+# 🔧 CONFIGURATION DU POOL
+# ==========================================
+# Par défaut : un navigateur par cœur
+NB_NAVIGATEURS_DEFAUT = os.cpu_count() or 1
+
+# Nombre de tentatives par fiche avant abandon (avec redémarrage entre deux)
+NB_TENTATIVES = 2
+
+_FIN = object()
+
+
+# ==========================================
+# 🏭 POOL DE NAVIGATEURS
+# ==========================================
+class PoolNavigateurs:
+    """N navigateurs qui piochent dans une file partagée, un seul écrivain.
+
+    - creer_driver() : fabrique un navigateur neuf (appelée par chaque worker)
+    - traiter(driver, tache) : traite une tâche et renvoie un résultat
+    - ecrire(resultat) : appelée uniquement depuis le thread écrivain
+    - en_echec(tache) : résultat de repli quand toutes les tentatives ont échoué
+
+    Toutes les tâches doivent être ajoutées avant d'appeler executer().
+    """
+
+    def __init__(
+        self,
+        creer_driver,
+        traiter,
+        ecrire,
+        nb_workers=NB_NAVIGATEURS_DEFAUT,
+        en_echec=None,
+    ):
+        self.creer_driver = creer_driver
+        self.traiter = traiter
+        self.ecrire = ecrire
+        self.en_echec = en_echec
+        self.nb_workers = max(1, int(nb_workers))
+
+        self.taches = queue.Queue()
+        self.resultats = queue.Queue()
+        self.arret = threading.Event()
+        self.nb_redemarrages = 0
+        self._verrou = threading.Lock()
+
+    def ajouter(self, tache):
+        self.taches.put(tache)
+
+    def _demarrer_driver(self, num):
+        try:
+            return self.creer_driver()
+        except Exception as e:
+            print(f"   ❌ [Worker {num}] Impossible de lancer le navigateur: {e}")
+            return None
+
+    def _redemarrer(self, num, driver):
+        """Redémarrage local : seul le navigateur de ce worker est relancé."""
+        print(f"\n🚑 [Worker {num}] Le navigateur ne répond plus ! Redémarrage...")
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        with self._verrou:
+            self.nb_redemarrages += 1
+        return self._demarrer_driver(num)
+
+    def _worker(self, num):
+        driver = self._demarrer_driver(num)
+        try:
+            while not self.arret.is_set():
+                tache = self.taches.get()
+                if tache is _FIN:
+                    break
+
+                resultat = None
+                for tentative in range(NB_TENTATIVES):
+                    if driver is None:
+                        driver = self._demarrer_driver(num)
+                        if driver is None:
+                            break
+                    try:
+                        resultat = self.traiter(driver, tache)
+                        break
+                    except Exception:
+                        driver = self._redemarrer(num, driver)
+
+                if resultat is None and self.en_echec is not None:
+                    resultat = self.en_echec(tache)
+                if resultat is not None:
+                    self.resultats.put(resultat)
+        finally:
+            if driver is not None:
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+
+    def _ecrivain(self):
+        while True:
+            resultat = self.resultats.get()
+            if resultat is _FIN:
+                break
+            self.ecrire(resultat)
+
+    def executer(self):
+        """Vide la file de tâches puis attend la fin de l'écriture."""
+        workers = [
+            threading.Thread(target=self._worker, args=(i + 1,), daemon=True)
+            for i in range(self.nb_workers)
+        ]
+        ecrivain = threading.Thread(target=self._ecrivain, daemon=True)
+
+        for _ in workers:
+            self.taches.put(_FIN)
+
+        ecrivain.start()
+        for w in workers:
+            w.start()
+
+        try:
+            for w in workers:
+                while w.is_alive():
+                    w.join(timeout=0.5)
+        except KeyboardInterrupt:
+            # On arrête de distribuer, mais on écrit tout ce qui est déjà fini
+            self.arret.set()
+            raise
+        finally:
+            self.resultats.put(_FIN)
+            ecrivain.join()
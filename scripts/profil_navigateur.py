@@ -0,0 +1,97 @@
+import json
+
+from selenium import webdriver
+
+# ==========================================
+# 🔧 PROFILS DE NAVIGATEUR
+# ==========================================
+# "complet" : Chrome tel qu'avant (fenêtre 1920x1080, tout est téléchargé)
+# "leger"   : headless, sans images / polices / médias ni traceurs tiers
+PROFILS = ["leger", "complet"]
+# Le profil d'origine reste le défaut : "leger" est à demander (--profil leger)
+# tant que benchmarks.py profils n'a pas confirmé la même extraction sur de vraies fiches
+PROFIL_DEFAUT = "complet"
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# On ne lit que du texte : ces ressources ne servent à rien.
+# Les feuilles de style restent chargées : elles décident du texte visible.
+EXTENSIONS_BLOQUEES = [
+    "png", "jpg", "jpeg", "gif", "webp", "svg", "ico",
+    "woff", "woff2", "ttf", "otf", "eot",
+    "mp4", "webm", "mp3",
+]
+HOTES_BLOQUES = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "dap.digitalgov.gov",
+    "fonts.googleapis.com",
+    "fonts.gstatic.com",
+    "siteimproveanalytics.com",
+    "nr-data.net",
+    "youtube.com",
+]
+
+ARGUMENTS_LEGER = [
+    "--headless=new",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-default-apps",
+    "--disable-dev-shm-usage",
+    "--no-first-run",
+    "--mute-audio",
+    "--blink-settings=imagesEnabled=false",
+]
+
+
+def motifs_bloques():
+    """Motifs pour Network.setBlockedURLs (joker *)"""
+    motifs = []
+    for ext in EXTENSIONS_BLOQUEES:
+        motifs += [f"*.{ext}", f"*.{ext}?*"]
+    motifs += [f"*{hote}*" for hote in HOTES_BLOQUES]
+    return motifs
+
+
+def options_chrome(profil=PROFIL_DEFAUT, headless=False, journal_reseau=False):
+    """Options Chrome du profil ; journal_reseau active les logs de performance (benchmark)"""
+    options = webdriver.ChromeOptions()
+    options.add_argument("--window-size=1920,1080")
+    # Anti-detection basique
+    options.add_argument(f"user-agent={USER_AGENT}")
+
+    if profil == "leger":
+        for argument in ARGUMENTS_LEGER:
+            options.add_argument(argument)
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+        # Les attentes conditionnelles (attentes.py) décident quand la page est prête :
+        # inutile d'attendre l'événement load et les scripts tiers
+        options.page_load_strategy = "eager"
+    elif headless:
+        options.add_argument("--headless")
+
+    if journal_reseau:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+
+def appliquer_blocages(driver, profil=PROFIL_DEFAUT):
+    """Interception réseau (CDP) : les requêtes inutiles ne partent jamais"""
+    if profil != "leger":
+        return
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": motifs_bloques()})
+
+
+def octets_transferes(driver):
+    """Octets reçus depuis le dernier appel (lit et vide le journal de performance)"""
+    total = 0
+    for entree in driver.get_log("performance"):
+        message = json.loads(entree["message"])["message"]
+        if message["method"] == "Network.loadingFinished":
+            total += message["params"].get("encodedDataLength", 0)
+    return total
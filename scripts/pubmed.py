@@ -0,0 +1,233 @@
+"""
+Client PubMed (E-utilities NCBI) partagé par les scripts de recherche :
+
+    NCBI_API_KEY=... python scripts/2_ApiSearch.py         # 10 req/s au lieu de 3
+    python scripts/serveur_pubmed.py --port 8766            # doublure locale des E-utilities
+    PUBMED_EUTILS_URL=http://127.0.0.1:8766/entrez/eutils python scripts/2_ApiSearch.py
+
+Session poolée et retry du client asyncio (recuperation_async.py), quota
+NCBI appliqué sur une fenêtre glissante d'une seconde, erreurs renvoyées
+par l'API levées en ErreurPubMed au lieu d'être lues comme 0 résultat.
+"""
+
+import os
+import time
+import sqlite3
+import asyncio
+import datetime
+import threading
+from urllib.parse import urlsplit
+
+from recuperation_async import ClientAsync, limiteur_fenetre, AReessayer, MAX_EN_VOL
+
+# ==========================================
+# 🔧 CONFIGURATION
+# ==========================================
+URL_EUTILS = os.environ.get("PUBMED_EUTILS_URL", "https://eutils.ncbi.nlm.nih.gov/entrez/eutils")
+CLE_API = os.environ.get("NCBI_API_KEY")
+EMAIL = os.environ.get("NCBI_EMAIL")
+OUTIL = "cancer-research-analytics"
+
+# Quotas NCBI : requêtes par seconde, sans / avec clé API
+QUOTA_SANS_CLE = 3
+QUOTA_AVEC_CLE = 10
+# Marge sur la fenêtre : deux départs espacés d'une seconde pile peuvent arriver plus proches
+MARGE_FENETRE = 0.05
+
+# Mémo des nombres de publications : années passées gardées pour toujours,
+# année en cours (encore alimentée) redemandée après le TTL
+FICHIER_MEMO = "data/cache_pubmed.sqlite"
+TTL_ANNEE_EN_COURS = 24 * 3600
+
+LISTE_MALADIES = [
+    "Lung Cancer", 
+    "Breast Cancer", 
+    "Pancreatic Cancer", 
+    "Leukemia", 
+    "Prostate Cancer"
+]
+
+
+def terme_maladie(maladie):
+    """Terme PubMed d'une maladie (la fenêtre de dates est passée à part)"""
+    return f'"{maladie}"[Title/Abstract]'
+
+
+class ErreurPubMed(Exception):
+    """Erreur renvoyée par les E-utilities (requête invalide, réponse illisible...)"""
+
+
+class QuotaDepasse(AReessayer):
+    """"API rate limit exceeded" dans une réponse 200 : la requête est retentée"""
+
+
+def verifier_reponse(reponse):
+    """Lève une exception si la réponse JSON des E-utilities signale une erreur"""
+    try:
+        data = reponse.json()
+    except ValueError:
+        raise ErreurPubMed(f"Réponse non JSON : {reponse.text[:200]}")
+    erreur = data.get("error") or data.get("esearchresult", {}).get("ERROR")
+    if erreur:
+        if "rate limit" in erreur.lower():
+            raise QuotaDepasse(erreur)
+        raise ErreurPubMed(erreur)
+
+
+def verifier_xml(reponse):
+    """Idem pour efetch : XML attendu, <ERROR> (historique expiré...) ou JSON d'erreur sinon"""
+    debut = reponse.content[:512].lstrip()
+    if debut.startswith(b"{"):
+        verifier_reponse(reponse)
+        raise ErreurPubMed(f"Réponse JSON inattendue : {reponse.text[:200]}")
+    if b"<ERROR>" in debut:
+        erreur = debut.split(b"<ERROR>", 1)[1].split(b"</ERROR>", 1)[0].decode("utf-8", "replace")
+        raise ErreurPubMed(erreur)
+
+
+# ==========================================
+# 📚 CLIENT
+# ==========================================
+class ClientPubMed:
+    """Requêtes E-utilities avec clé API optionnelle et quota NCBI exact.
+
+    Le quota est celui de l'hôte pour tout le processus : plusieurs clients
+    (ou coroutines) se partagent les 3 (ou 10) requêtes par seconde.
+    """
+
+    def __init__(self, cle_api=CLE_API, email=EMAIL, url=URL_EUTILS, cache=None, max_en_vol=MAX_EN_VOL):
+        self.url = url.rstrip("/")
+        self.cle_api = cle_api
+        self.quota = QUOTA_AVEC_CLE if cle_api else QUOTA_SANS_CLE
+        # Fenêtre de l'hôte partagée : reconstruire un client ne remet pas le quota à zéro
+        limiteur_fenetre(urlsplit(self.url).hostname, self.quota, 1.0 + MARGE_FENETRE)
+
+        self.client = ClientAsync(max_en_vol=max_en_vol, cache=cache)
+        self._identification = {"tool": OUTIL}
+        if email:
+            self._identification["email"] = email
+        if cle_api:
+            self._identification["api_key"] = cle_api
+
+    def fermer(self):
+        self.client.fermer()
+
+    def _params(self, params):
+        return {"db": "pubmed", **params, **self._identification}
+
+    async def esearch(self, term, **params):
+        """Résultat esearch (dict "esearchresult") pour un terme de recherche"""
+        data = await self.client.get_json(
+            f"{self.url}/esearch.fcgi",
+            params=self._params({"term": term, "retmode": "json", **params}),
+            verifier=verifier_reponse,
+        )
+        resultat = data.get("esearchresult")
+        if resultat is None or "count" not in resultat:
+            raise ErreurPubMed(f"Réponse esearch sans nombre de résultats pour {term!r}")
+        return resultat
+
+    async def efetch(self, webenv, query_key, retstart, retmax):
+        """Lot de notices XML (octets) d'une recherche enregistrée sur le serveur d'historique"""
+        reponse = await self.client.get(
+            f"{self.url}/efetch.fcgi",
+            params=self._params({
+                "WebEnv": webenv,
+                "query_key": query_key,
+                "retstart": retstart,
+                "retmax": retmax,
+                "retmode": "xml",
+            }),
+            verifier=verifier_xml,
+        )
+        return reponse.content
+
+    async def compter(self, term, debut=None, fin=None):
+        """Nombre de publications correspondant au terme (dates de publication AAAA/MM/JJ incluses)"""
+        fenetre = {"datetype": "pdat", "mindate": debut, "maxdate": fin} if debut else {}
+        resultat = await self.esearch(term, retmax=0, **fenetre)
+        return int(resultat["count"])
+
+
+# ==========================================
+# 🗃️ MÉMO DES NOMBRES DE PUBLICATIONS
+# ==========================================
+def fenetre_annee(annee):
+    """(début, fin) d'une année au format des E-utilities"""
+    return f"{annee}/01/01", f"{annee}/12/31"
+
+
+class MemoComptes:
+    """Nombres de publications déjà obtenus, par (terme, fenêtre de dates).
+
+    Une fenêtre entièrement passée est définitive ; celle qui contient
+    aujourd'hui est redemandée après `ttl` secondes.
+    """
+
+    def __init__(self, chemin=FICHIER_MEMO, ttl=TTL_ANNEE_EN_COURS):
+        self.ttl = ttl
+        os.makedirs(os.path.dirname(chemin) or ".", exist_ok=True)
+        self._verrou = threading.Lock()
+        self._db = sqlite3.connect(chemin, check_same_thread=False)
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS comptes (
+                terme TEXT,
+                debut TEXT,
+                fin TEXT,
+                nombre INTEGER,
+                obtenu_le REAL,
+                definitif INTEGER,
+                PRIMARY KEY (terme, debut, fin)
+            )"""
+        )
+        self._db.commit()
+
+    def lire(self, terme, debut, fin):
+        """Nombre mémorisé, ou None s'il manque ou a expiré"""
+        with self._verrou:
+            ligne = self._db.execute(
+                "SELECT nombre, obtenu_le, definitif FROM comptes WHERE terme = ? AND debut = ? AND fin = ?",
+                (terme, debut, fin),
+            ).fetchone()
+        if ligne is None:
+            return None
+        nombre, obtenu_le, definitif = ligne
+        if definitif or time.time() - obtenu_le < self.ttl:
+            return nombre
+        return None
+
+    def ecrire(self, terme, debut, fin, nombre):
+        # Définitif si la fenêtre était déjà close quand le nombre a été obtenu
+        definitif = fin < datetime.date.today().strftime("%Y/%m/%d")
+        with self._verrou:
+            self._db.execute(
+                "INSERT OR REPLACE INTO comptes VALUES (?, ?, ?, ?, ?, ?)",
+                (terme, debut, fin, nombre, time.time(), int(definitif)),
+            )
+            self._db.commit()
+
+    def fermer(self):
+        with self._verrou:
+            self._db.close()
+
+
+async def compter_fenetres(client, requetes, memo=None):
+    """{(terme, début, fin): nombre ou exception}, requêtes manquantes lancées en parallèle"""
+    resultats = {}
+    a_demander = []
+    for requete in requetes:
+        nombre = memo.lire(*requete) if memo else None
+        if nombre is None:
+            a_demander.append(requete)
+        else:
+            resultats[requete] = nombre
+
+    async def demander(terme, debut, fin):
+        nombre = await client.compter(terme, debut, fin)
+        if memo:
+            memo.ecrire(terme, debut, fin, nombre)
+        return nombre
+
+    reponses = await asyncio.gather(*(demander(*r) for r in a_demander), return_exceptions=True)
+    resultats.update(zip(a_demander, reponses))
+    return resultats
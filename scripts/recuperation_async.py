@@ -0,0 +1,302 @@
+import time
+import random
+import asyncio
+import threading
+from collections import deque
+from contextlib import nullcontext
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# ==========================================
+# 🔧 CONFIGURATION
+# ==========================================
+# Requêtes par seconde autorisées par hôte (les autres hôtes : DEBIT_DEFAUT)
+DEBITS_PAR_HOTE = {
+    "clinicaltrials.gov": 5.0,
+    "eutils.ncbi.nlm.nih.gov": 3.0,  # Limite NCBI sans clé API
+}
+DEBIT_DEFAUT = 2.0
+
+MAX_EN_VOL = 8  # Requêtes simultanées au maximum
+TIMEOUT = 30  # Secondes par requête
+NB_TENTATIVES = 5
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+
+# Codes pour lesquels on réessaie (trop de requêtes / erreurs serveur)
+CODES_A_REESSAYER = {429, 500, 502, 503, 504}
+
+
+# ==========================================
+# 🪣 LIMITEUR DE DÉBIT (TOKEN BUCKET)
+# ==========================================
+class LimiteurDebit:
+    """Seau à jetons partagé entre threads et coroutines.
+
+    Chaque appel réserve un jeton ; si le seau est vide, la réservation est
+    mise en file et l'appelant attend exactement le temps nécessaire.
+    """
+
+    def __init__(self, debit, rafale=1):
+        self.debit = float(debit)
+        self.rafale = rafale
+        self.jetons = float(rafale)
+        self.dernier = time.monotonic()
+        self._verrou = threading.Lock()
+
+    def _reserver(self):
+        """Réserve un jeton et renvoie l'attente (en secondes) avant de l'utiliser"""
+        with self._verrou:
+            maintenant = time.monotonic()
+            self.jetons = min(
+                self.rafale, self.jetons + (maintenant - self.dernier) * self.debit
+            )
+            self.dernier = maintenant
+            self.jetons -= 1
+            if self.jetons >= 0:
+                return 0.0
+            return -self.jetons / self.debit
+
+    def attendre(self):
+        """Version bloquante (threads, Selenium)"""
+        attente = self._reserver()
+        if attente > 0:
+            time.sleep(attente)
+
+    async def attendre_async(self):
+        attente = self._reserver()
+        if attente > 0:
+            await asyncio.sleep(attente)
+
+
+class LimiteurFenetre:
+    """Au plus nb requêtes dans toute fenêtre glissante de `periode` secondes.
+
+    Plus strict qu'un seau à jetons pour les quotas du type "3 requêtes par
+    seconde" (NCBI) : chaque départ est planifié au plus tôt `periode` après
+    le nb-ième départ précédent ; les rafales de nb requêtes restent permises.
+    """
+
+    def __init__(self, nb, periode=1.0):
+        self.nb = int(nb)
+        self.periode = periode
+        self._departs = deque(maxlen=self.nb)
+        self._verrou = threading.Lock()
+
+    def _reserver(self):
+        with self._verrou:
+            maintenant = time.monotonic()
+            depart = maintenant
+            if len(self._departs) == self.nb:
+                depart = max(maintenant, self._departs[0] + self.periode)
+            self._departs.append(depart)
+            return depart - maintenant
+
+    attendre = LimiteurDebit.attendre
+    attendre_async = LimiteurDebit.attendre_async
+
+
+_limiteurs = {}
+_verrou_limiteurs = threading.Lock()
+
+
+def limiteur_pour(hote):
+    """Limiteur unique par hôte, partagé par tout le processus"""
+    with _verrou_limiteurs:
+        if hote not in _limiteurs:
+            debit = DEBITS_PAR_HOTE.get(hote, DEBIT_DEFAUT)
+            _limiteurs[hote] = LimiteurDebit(debit)
+        return _limiteurs[hote]
+
+
+def configurer_debit(hote, debit):
+    """Change le débit autorisé pour un hôte (ex: clé API NCBI = 10 req/s)"""
+    with _verrou_limiteurs:
+        DEBITS_PAR_HOTE[hote] = debit
+        _limiteurs[hote] = LimiteurDebit(debit)
+
+
+def definir_limiteur(hote, limiteur):
+    """Remplace le limiteur d'un hôte (ex: LimiteurFenetre pour un quota strict)"""
+    with _verrou_limiteurs:
+        _limiteurs[hote] = limiteur
+
+
+def limiteur_fenetre(hote, nb, periode=1.0):
+    """LimiteurFenetre de l'hôte, créé une seule fois pour tout le processus.
+
+    Un client reconstruit (ou un deuxième client) reprend la même fenêtre et
+    son historique : les quotas ne s'additionnent pas. Un quota différent
+    (clé API ajoutée) remplace le limiteur en gardant les départs récents.
+    """
+    with _verrou_limiteurs:
+        actuel = _limiteurs.get(hote)
+        if isinstance(actuel, LimiteurFenetre) and (actuel.nb, actuel.periode) == (int(nb), periode):
+            return actuel
+        limiteur = LimiteurFenetre(nb, periode)
+        if isinstance(actuel, LimiteurFenetre):
+            with actuel._verrou:
+                limiteur._departs.extend(actuel._departs)
+        _limiteurs[hote] = limiteur
+        return limiteur
+
+
+class AReessayer(Exception):
+    """Levée par un vérificateur de réponse : réponse 200 mais à redemander (quota...)"""
+
+
+def delai_backoff(tentative, reponse=None):
+    """Attente avant la prochaine tentative : Retry-After, sinon backoff exponentiel avec jitter"""
+    if reponse is not None:
+        retry_after = reponse.headers.get("Retry-After")
+        if retry_after and retry_after.isdigit():
+            return min(BACKOFF_MAX, float(retry_after))
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2**tentative))
+
+
+def reponse_depuis_cache(url, entree):
+    """Reconstruit une requests.Response à partir d'une entrée du cache"""
+    reponse = requests.Response()
+    reponse.status_code = 200
+    reponse.url = url
+    reponse._content = entree["contenu"]
+    reponse.encoding = "utf-8"
+    if entree["content_type"]:
+        reponse.headers["Content-Type"] = entree["content_type"]
+    reponse.headers["X-Cache"] = "HIT"
+    return reponse
+
+
+# ==========================================
+# ⚡ CLIENT ASYNCIO
+# ==========================================
+class ClientAsync:
+    """Client HTTP asyncio : débit par hôte, requêtes en vol bornées, timeouts, retry.
+
+    Les requêtes passent par une session requests poolée, exécutée dans des
+    threads (asyncio.to_thread) pour ne pas bloquer la boucle.
+
+    Avec metriques (metriques.Metriques) : "limitation" mesure l'attente du
+    débit et d'une place parmi les requêtes en vol, "navigation" le seul
+    échange HTTP (comme driver.get côté Selenium).
+    """
+
+    def __init__(
+        self,
+        max_en_vol=MAX_EN_VOL,
+        timeout=TIMEOUT,
+        nb_tentatives=NB_TENTATIVES,
+        headers=None,
+        cache=None,
+        metriques=None,
+    ):
+        self.max_en_vol = max(1, int(max_en_vol))
+        self.metriques = metriques
+        # CacheHTTP optionnel : réponse fraîche servie sans réseau, sinon revalidation
+        self.cache = cache
+        self.timeout = timeout
+        self.nb_tentatives = nb_tentatives
+        self._semaphore = None
+        self._boucle = None
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.max_en_vol, pool_maxsize=self.max_en_vol
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if headers:
+            self.session.headers.update(headers)
+
+    def fermer(self):
+        self.session.close()
+
+    def _mesurer(self, phase):
+        return self.metriques.mesurer(phase) if self.metriques else nullcontext()
+
+    def _semaphore_courant(self):
+        """Un sémaphore par boucle asyncio (le client peut servir à plusieurs asyncio.run)"""
+        boucle = asyncio.get_running_loop()
+        if self._boucle is not boucle:
+            self._boucle = boucle
+            self._semaphore = asyncio.Semaphore(self.max_en_vol)
+        return self._semaphore
+
+    async def get(self, url, params=None, verifier=None):
+        """GET avec retry. Lève une exception si toutes les tentatives échouent.
+
+        verifier(reponse), appelé sur chaque réponse 200 avant sa mise en
+        cache, peut lever AReessayer (nouvelle tentative) ou toute autre
+        exception (remontée telle quelle, rien n'est mis en cache).
+        """
+        entree = self.cache.lire(url, params) if self.cache else None
+        if entree and entree["frais"]:
+            return reponse_depuis_cache(url, entree)
+
+        # Entrée périmée : requête conditionnelle (304 si rien n'a changé)
+        entetes = {}
+        if entree and entree["etag"]:
+            entetes["If-None-Match"] = entree["etag"]
+        if entree and entree["last_modified"]:
+            entetes["If-Modified-Since"] = entree["last_modified"]
+
+        limiteur = limiteur_pour(urlsplit(url).hostname)
+        semaphore = self._semaphore_courant()
+        reponse, erreur = None, None
+
+        for tentative in range(self.nb_tentatives):
+            with self._mesurer("limitation"):
+                await limiteur.attendre_async()
+                await semaphore.acquire()
+            try:
+                with self._mesurer("navigation"):
+                    reponse = await asyncio.wait_for(
+                        asyncio.to_thread(
+                            self.session.get,
+                            url,
+                            params=params,
+                            headers=entetes,
+                            timeout=self.timeout,
+                        ),
+                        self.timeout + 5,
+                    )
+                erreur = None
+            except (requests.ConnectionError, requests.Timeout, asyncio.TimeoutError) as e:
+                reponse, erreur = None, e
+            finally:
+                semaphore.release()
+
+            if reponse is not None and reponse.status_code == 200 and verifier is not None:
+                try:
+                    verifier(reponse)
+                except AReessayer as e:
+                    reponse, erreur = None, e
+
+            if reponse is not None and reponse.status_code not in CODES_A_REESSAYER:
+                break
+            if tentative + 1 < self.nb_tentatives:
+                await asyncio.sleep(delai_backoff(tentative, reponse))
+
+        if reponse is None:
+            raise erreur
+        if reponse.status_code == 304 and entree:
+            self.cache.revalider(url, params)
+            return reponse_depuis_cache(url, entree)
+        reponse.raise_for_status()
+
+        if self.cache is not None and reponse.status_code == 200:
+            self.cache.ecrire(
+                url,
+                reponse.content,
+                params=params,
+                etag=reponse.headers.get("ETag"),
+                last_modified=reponse.headers.get("Last-Modified"),
+                content_type=reponse.headers.get("Content-Type"),
+            )
+        return reponse
+
+    async def get_json(self, url, params=None, verifier=None):
+        reponse = await self.get(url, params=params, verifier=verifier)
+        return reponse.json()
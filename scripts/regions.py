@@ -0,0 +1,780 @@
+"""
+Région du sponsor d'un essai clinique (USA, Canada, Europe, Asie...), à
+partir de mots-clés cherchés dans le nom du sponsor en minuscules :
+
+    from regions import classer_sponsors, MemoRegions
+    df["Region"] = classer_sponsors(df["Sponsor"], MemoRegions())
+
+Les ~600 mots-clés sont compilés une seule fois en automate d'Aho-Corasick
+(pyahocorasick s'il est installé, sinon version Python) : une colonne est
+classée en un passage par sponsor au lieu d'un test `in` par mot-clé.
+Priorité inchangée : compagnies multinationales, puis USA, Canada, Europe,
+Asie, Moyen-Orient, Amérique latine, Océanie, sinon "Other".
+
+Chaque sponsor distinct n'est classé qu'une fois ; le mémo SQLite garde ces
+régions d'un run à l'autre et se vide quand les tables de mots-clés changent.
+"""
+
+import os
+import json
+import sqlite3
+import hashlib
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+REGION_INCONNUE = "Unknown"  # sponsor absent
+REGION_AUTRE = "Other"  # aucun mot-clé reconnu
+
+# Régions déjà attribuées, par sponsor normalisé (invalidé si les mots-clés changent)
+FICHIER_MEMO = "data/cache_regions.sqlite"
+
+# ==========================================
+# 🗺️ MOTS-CLÉS PAR RÉGION
+# ==========================================
+# USA - hôpitaux et institutions
+MOTS_USA = [
+    "united states",
+    "usa",
+    "u.s.",
+    "texas",
+    "california",
+    "new york",
+    "massachusetts",
+    "florida",
+    "ohio",
+    "pennsylvania",
+    "maryland",
+    "michigan",
+    "north carolina",
+    "washington",
+    "arizona",
+    "georgia",
+    "boston",
+    "harvard",
+    "yale",
+    "stanford",
+    "duke",
+    "johns hopkins",
+    "mayo clinic",
+    "cleveland clinic",
+    "md anderson",
+    "m.d. anderson",
+    "memorial sloan",
+    "dana-farber",
+    "national cancer institute",
+    "nci",
+    "nih",
+    "national institutes of health",
+    "wake forest",
+    "case comprehensive",
+    "city of hope",
+    "weill cornell",
+    "columbia university",
+    "vanderbilt",
+    "emory",
+    "kaiser permanente",
+    "adventhealth",
+    "moffitt cancer",
+    "abramson cancer",
+    "university of arkansas",
+    "university of colorado",
+    "precog",
+    "alliance for clinical trials",
+    "eastern cooperative oncology",
+    "swog cancer",
+    "children's oncology group",
+    "henry ford",
+    "dartmouth",
+    "utah",
+    "indiana",
+    "alabama",
+    "kentucky",
+    "tennessee",
+    "minnesota",
+    "wisconsin",
+    "iowa",
+    "nanospectra",
+    "cougar biotechnology",
+    "galvanize therapeutics",
+    "everest detection",
+    "integro theranostics",
+    "phenomapper",
+    "jonsson comprehensive",
+    "ucla",
+    "us oncology",
+    "baylor",
+    "methodist health",
+    "seagen",
+    "novian health",
+    "tigris pharmaceuticals",
+    "university of nebraska",
+    "university of illinois",
+    "va office",
+    "cmx research",
+    "aragon pharmaceuticals",
+    "exosome diagnostics",
+    "ohsu knight",
+    "roswell park",
+    "syndax pharmaceuticals",
+    "adenocyte",
+    "curium",
+    "bastyr university",
+    "tulane university",
+    "gtx",
+    "gaad medical",
+    "oncomed pharmaceuticals",
+    "mereo biopharma",
+    "georgetown university",
+    "rutgers",
+    "brigham and women",
+    "state university of new york",
+    "suny",
+    "university of california",
+    "baptist health",
+    "christian hospital",
+    "novarx",
+    "broncus technologies",
+    "menssana research",
+    "ka imaging",
+    "auris health",
+    "c. r. bard",
+    "mirati therapeutics",
+    "csa medical",
+    "university of vermont",
+    "thomas jefferson university",
+    "sharp healthcare",
+    "schiffler cancer center",
+    "university of pittsburgh",
+    "university of missouri",
+    "national center for plastic surgery",
+    "hibercell",
+    "bhr pharma",
+    "enzon pharmaceuticals",
+    "aegera therapeutics",
+]
+
+# USA - Big Pharma avec siège US
+PHARMA_USA = [
+    "merck sharp",
+    "msd",
+    "eli lilly",
+    "pfizer",
+    "johnson & johnson",
+    "janssen",
+    "bristol-myers",
+    "bms",
+    "amgen",
+    "celgene",
+    "abbvie",
+    "gilead",
+    "abbott",
+    "koning corporation",
+]
+
+# Europe - hôpitaux et institutions
+MOTS_EUROPE = [
+    "united kingdom",
+    "uk",
+    "england",
+    "scotland",
+    "wales",
+    "london",
+    "oxford",
+    "cambridge",
+    "manchester",
+    "glasgow",
+    "edinburgh",
+    "southampton nhs",
+    "bristol nhs",
+    "nhs foundation",
+    "france",
+    "french",
+    "paris",
+    "lyon",
+    "marseille",
+    "foch",
+    "tours",
+    "amiens",
+    "paoli-calmettes",
+    "institut de cancérologie",
+    "institut curie",
+    "centre leon berard",
+    "centre hospitalier universitaire de nice",
+    "chu nice",
+    "chu besancon",
+    "chu toulouse",
+    "hospital, toulouse",
+    "hospital, brest",
+    "unicancer",
+    "germany",
+    "german",
+    "berlin",
+    "munich",
+    "heidelberg",
+    "tuebingen",
+    "tübingen",
+    "medac gmbh",
+    "italy",
+    "italian",
+    "rome",
+    "milan",
+    "european institute of oncology",
+    "regina elena",
+    "link campus",
+    "fondazione del piemonte",
+    "fondazione piemonte",
+    "spain",
+    "spanish",
+    "madrid",
+    "barcelona",
+    "granada",
+    "pethema",
+    "grupo espanol",
+    "netherlands",
+    "dutch",
+    "amsterdam",
+    "rotterdam",
+    "radboud",
+    "maastricht university",
+    "groningen",
+    "belgium",
+    "brussels",
+    "leuven",
+    "ku leuven",
+    "universitaire ziekenhuizen",
+    "gasthuisberg",
+    "jules bordet",
+    "switzerland",
+    "swiss",
+    "zurich",
+    "geneva",
+    "sweden",
+    "stockholm",
+    "region stockholm",
+    "denmark",
+    "copenhagen",
+    "herlev",
+    "aalborg",
+    "norway",
+    "norwegian",
+    "oslo",
+    "st. olavs",
+    "trondheim",
+    "finland",
+    "helsinki",
+    "austria",
+    "vienna",
+    "otto wagner",
+    "portugal",
+    "lisbon",
+    "leiria",
+    "instituto politécnico",
+    "ireland",
+    "dublin",
+    "poland",
+    "silesia",
+    "czech",
+    "greece",
+    "trakya university",
+    "european lung cancer",
+    "montpellier",
+    "antoine lacassagne",
+    "nantes university",
+    "nantes hospital",
+    "institut bergonié",
+    "bergonie",
+    "henri becquerel",
+    "becquerel",
+    "besancon",
+    "chu besançon",
+    "technische universität",
+    "technische universitat",
+    "dresden",
+    "cliniques universitaires saint-luc",
+    "université catholique de louvain",
+    "universite catholique",
+    "cell medica",
+    "medsir",
+    "institut fuer frauengesundheit",
+    "wissenschaftliches institut bethanien",
+    "naestved hospital",
+    "næstved",
+    "tampere university",
+    "fundació institut de recerca",
+    "fundacio",
+    "sant pau",
+    "santa creu",
+    "irccs",
+    "sacro cuore",
+    "negrar",
+    "ente ospedaliero",
+    "galliera",
+    "tethis",
+    "frisius medisch centrum",
+    "bozok university",
+    "oslo university hospital",
+    "university of hull",
+    "hellenic cooperative oncology",
+    "trans tasman",
+    "grupo oncologico italia meridionale",
+    "baselşehir",
+    "hacettepe university",
+    "maltepe university",
+    "institut universitaire de cardiologie",
+    "quebec",
+    "laval",
+    "assistance publique",
+    "hopitaux de paris",
+    "hôpitaux de paris",
+    "medical university of vienna",
+    "oncology center of biochemical",
+    "sheba medical center",
+    "national institute for tuberculosis",
+    "spanish lung cancer group",
+    "institut de cancérologie de la loire",
+    "university of bristol",
+    "hospital, limoges",
+    "limoges",
+    "aarhus university hospital",
+    "aarhus",
+    "biocruces bizkaia",
+    "cantonal hospital of st. gallen",
+    "st. gallen",
+    "umeå university",
+    "umea",
+    "pantarhei oncology",
+    "maria sklodowska-curie",
+    "sklodowska",
+    "debiopharm",
+    "danish cancer society",
+    "institut rafael",
+    "region skane",
+    "skåne",
+    "istituto clinico humanitas",
+    "humanitas",
+    "ab-ct",
+    "advanced breast-ct",
+    "siemens healthcare",
+    "centre hospitalier emile roux",
+    "neutec pharma",
+    "pulsion medical",
+    "pierre fabre medicament",
+    "karolinska institutet",
+    "karolinska",
+]
+
+# Europe - Big Pharma
+PHARMA_EUROPE = [
+    "novartis",
+    "roche",
+    "hoffmann-la roche",
+    "sanofi",
+    "glaxosmithkline",
+    "gsk",
+    "astrazeneca",
+    "bayer",
+    "boehringer",
+    "servier",
+    "ipsen",
+    "astellas",
+]
+
+# Asie - hôpitaux et institutions
+MOTS_ASIE = [
+    "china",
+    "chinese",
+    "beijing",
+    "peking union",
+    "peking university",
+    "shanghai",
+    "ruijin hospital",
+    "renji hospital",
+    "chest hospital",
+    "guangzhou",
+    "guangdong",
+    "fuda cancer",
+    "tianjin medical",
+    "sichuan",
+    "fuzhou general",
+    "guang'anmen",
+    "tongji hospital",
+    "hong kong polytechnic",
+    "hong kong",
+    "fudan university",
+    "sun yat-sen",
+    "xi'an jiaotong",
+    "xian jiaotong",
+    "nanjing drum tower",
+    "hangzhou",
+    "chongqing",
+    "tang-du hospital",
+    "zhejiang",
+    "wonju severance",
+    "severance hospital",
+    "chandigarh",
+    "post graduate institute of medical education",
+    "assiut university",
+    "taipei medical university",
+    "national taipei university",
+    "seoul st. mary",
+    "bundang hospital",
+    "china medical university hospital",
+    "affiliated cancer hospital",
+    "guangzhou medical university",
+    "shanghai pulmonary hospital",
+    "beijing tongren hospital",
+    "central south university",
+    "chinese alliance against lung cancer",
+    "jiangsu hengrui medicine",
+    "innovent biologics",
+    "guangzhou fineimmune",
+    "jiangsu shengdiya",
+    "shanghai zhongshan hospital",
+    "first people's hospital of lianyungang",
+    "nantong university",
+    "air force military medical university",
+    "xiamen university",
+    "tianjin medical university second hospital",
+    "fakultas kedokteran universitas indonesia",
+    "japan",
+    "shenzhen gene health",
+    "shenzhen",
+    "swami rama cancer hospital",
+    "xijing hospital",
+    "qilu hospital of shandong university",
+    "shandong university",
+    "vardhman mahavir medical college",
+    "safdarjung hospital",
+    "olive healthcare",
+    "nippon kayaku",
+    "aryogen pharmed",
+    "japanese",
+    "tokyo",
+    "osaka",
+    "kyoto",
+    "japan clinical oncology",
+    "south korea",
+    "korea",
+    "korean",
+    "seoul",
+    "yonsei",
+    "samsung medical",
+    "asan medical",
+    "chonnam national",
+    "india",
+    "indian",
+    "mumbai",
+    "delhi",
+    "bangalore",
+    "lahore",
+    "ain shams",
+    "tata memorial",
+    "singapore",
+    "taiwan",
+    "national taiwan",
+    "chang gung",
+    "thailand",
+    "malaysia",
+    "philippines",
+    "indonesia",
+    "vietnam",
+    "pakistan",
+]
+
+# Asie - Pharma
+PHARMA_ASIE = [
+    "ethicon",
+    "rgene corporation",
+    "foresee pharmaceuticals",
+    "shanghai youhe",
+    "daiichi sankyo",
+    "takeda",
+    "chia tai tianqing",
+    "primo biotechnology",
+    "qilu pharmaceutical",
+]
+
+# Moyen-Orient
+MOTS_MOYEN_ORIENT = [
+    "israel",
+    "tel aviv",
+    "jerusalem",
+    "saudi",
+    "emirates",
+    "dubai",
+    "qatar",
+    "turkey",
+    "istanbul",
+    "iran",
+    "egypt",
+    "cairo",
+    "tunisian",
+    "tunisia",
+    "zagazig",
+    "rabin medical center",
+    "kasr el aini hospital",
+]
+
+# Amérique Latine
+MOTS_AMERIQUE_LATINE = [
+    "brazil",
+    "brazilian",
+    "sao paulo",
+    "são paulo",
+    "instituto do cancer do estado",
+    "instituto brasileiro de controle do cancer",
+    "rio",
+    "hospital israelita albert einstein",
+    "latin american cooperative oncology",
+    "lacog",
+    "mexico",
+    "mexican",
+    "argentina",
+    "buenos aires",
+    "chile",
+    "colombia",
+    "peru",
+    "venezuela",
+    "universidade estadual paulista",
+    "paulista",
+    "julio de mesquita",
+]
+
+# Océanie
+MOTS_OCEANIE = [
+    "australia",
+    "australian",
+    "sydney",
+    "melbourne",
+    "new zealand",
+    "auckland",
+    "university of sydney",
+    "royal north shore",
+]
+
+# Canada
+MOTS_CANADA = [
+    "canada",
+    "canadian",
+    "toronto",
+    "montreal",
+    "vancouver",
+    "quebec",
+    "ontario",
+    "alberta",
+    "british columbia",
+    "london health sciences",
+    "lawson research",
+    "mcmaster university",
+    "ottawa hospital",
+]
+
+# Pharma/Biotech multinationales (à classifier selon siège social)
+MULTINATIONALES = {
+    "clarity pharmaceuticals": "Oceania",  # Australie
+    "impact biotech": "Europe",  # Israel
+    "rarecells diagnostics": "Europe",  # France
+    "dacima consulting": "Middle East",  # Tunisie
+}
+
+# Règles dans l'ordre de priorité : la première qui a un mot-clé dans le sponsor l'emporte
+REGLES = [
+    # Vérifier d'abord les compagnies multinationales spécifiques
+    *((region, [compagnie]) for compagnie, region in MULTINATIONALES.items()),
+    ("USA", MOTS_USA + PHARMA_USA),
+    ("Canada", MOTS_CANADA),
+    ("Europe", MOTS_EUROPE + PHARMA_EUROPE),
+    ("Asia", MOTS_ASIE + PHARMA_ASIE),
+    ("Middle East", MOTS_MOYEN_ORIENT),
+    ("Latin America", MOTS_AMERIQUE_LATINE),
+    ("Oceania", MOTS_OCEANIE),
+]
+
+
+# ==========================================
+# ⚙️ AUTOMATE MULTI-MOTIFS
+# ==========================================
+class AutomateRegions:
+    """Tous les mots-clés de `regles` dans un seul automate d'Aho-Corasick.
+
+    Chaque mot-clé porte le rang de sa règle ; un sponsor reçoit la région
+    du plus petit rang parmi les mots-clés trouvés, ce qui reproduit la
+    suite de `any(...)` testés dans l'ordre.
+    """
+
+    def __init__(self, regles=REGLES, natif=True):
+        self.regions = [region for region, _ in regles] + [REGION_AUTRE]
+        self.aucun = len(regles)
+        rangs = {}
+        for rang, (_, mots) in enumerate(regles):
+            for mot in mots:
+                rangs.setdefault(mot, rang)
+
+        # natif=False : version Python même si pyahocorasick est installé (mesures)
+        if natif and ahocorasick is not None:
+            self._automate = ahocorasick.Automaton()
+            for mot, rang in rangs.items():
+                self._automate.add_word(mot, rang)
+            self._automate.make_automaton()
+            self.rang = self._rang_c
+        else:
+            self._construire(rangs)
+            self.rang = self._rang_python
+
+    def _construire(self, rangs):
+        """Trie des mots-clés + liens d'échec ; sortie = meilleur rang reconnu en chaque état"""
+        self._transitions = [{}]
+        self._sortie = [self.aucun]
+        for mot, rang in rangs.items():
+            etat = 0
+            for caractere in mot:
+                suivant = self._transitions[etat].get(caractere)
+                if suivant is None:
+                    suivant = len(self._transitions)
+                    self._transitions[etat][caractere] = suivant
+                    self._transitions.append({})
+                    self._sortie.append(self.aucun)
+                etat = suivant
+            self._sortie[etat] = min(self._sortie[etat], rang)
+
+        # Parcours en largeur : l'échec d'un état est déjà calculé quand on visite ses fils
+        self._echec = [0] * len(self._transitions)
+        file = deque(self._transitions[0].values())
+        while file:
+            etat = file.popleft()
+            for caractere, fils in self._transitions[etat].items():
+                repli = self._echec[etat]
+                while repli and caractere not in self._transitions[repli]:
+                    repli = self._echec[repli]
+                cible = self._transitions[repli].get(caractere, 0)
+                self._echec[fils] = cible
+                # Un mot-clé suffixe d'un autre est reconnu en même temps
+                self._sortie[fils] = min(self._sortie[fils], self._sortie[self._echec[fils]])
+                file.append(fils)
+
+    def _rang_python(self, texte):
+        transitions, echec, sortie = self._transitions, self._echec, self._sortie
+        meilleur = self.aucun
+        etat = 0
+        for caractere in texte:
+            while etat and caractere not in transitions[etat]:
+                etat = echec[etat]
+            etat = transitions[etat].get(caractere, 0)
+            if sortie[etat] < meilleur:
+                meilleur = sortie[etat]
+                if meilleur == 0:
+                    break
+        return meilleur
+
+    def _rang_c(self, texte):
+        return min((rang for _, rang in self._automate.iter(texte)), default=self.aucun)
+
+    def classer(self, sponsor):
+        """Région d'un sponsor (chaîne quelconque, NaN -> "Unknown")"""
+        if pd.isna(sponsor):
+            return REGION_INCONNUE
+        return self.regions[self.rang(sponsor.lower())]
+
+    def classer_serie(self, sponsors):
+        """Région de chaque sponsor d'une Series, en un passage"""
+        minuscules = sponsors.str.lower()
+        regions, rang = self.regions, self.rang
+        resultat = [REGION_INCONNUE if pd.isna(s) else regions[rang(s)] for s in minuscules]
+        return pd.Series(resultat, index=sponsors.index, name="Region")
+
+
+# ==========================================
+# 🗃️ MÉMO SPONSOR -> RÉGION
+# ==========================================
+def empreinte_regles(regles=REGLES):
+    """Empreinte des mots-clés et de leur ordre : change dès qu'une table est modifiée"""
+    return hashlib.sha256(json.dumps(regles, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class MemoRegions:
+    """Région de chaque sponsor normalisé déjà classé, conservée entre deux runs.
+
+    Le mémo est vidé à l'ouverture si l'empreinte des règles a changé :
+    une région n'est jamais servie pour d'anciennes tables de mots-clés.
+    """
+
+    def __init__(self, chemin=FICHIER_MEMO, regles=REGLES):
+        os.makedirs(os.path.dirname(chemin) or ".", exist_ok=True)
+        self.nb_ajoutes = 0
+        self._db = sqlite3.connect(chemin)
+        self._db.execute("CREATE TABLE IF NOT EXISTS regions (sponsor TEXT PRIMARY KEY, region TEXT)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (cle TEXT PRIMARY KEY, valeur TEXT)")
+
+        empreinte = empreinte_regles(regles)
+        ligne = self._db.execute("SELECT valeur FROM meta WHERE cle = 'empreinte'").fetchone()
+        self.invalide = ligne is not None and ligne[0] != empreinte
+        if ligne is None or self.invalide:
+            self._db.execute("DELETE FROM regions")
+            self._db.execute("INSERT OR REPLACE INTO meta VALUES ('empreinte', ?)", (empreinte,))
+        self._db.commit()
+
+    def connues(self):
+        """{sponsor normalisé: région} de tous les sponsors déjà classés"""
+        return dict(self._db.execute("SELECT sponsor, region FROM regions"))
+
+    def ecrire(self, regions):
+        self._db.executemany("INSERT OR REPLACE INTO regions VALUES (?, ?)", regions.items())
+        self._db.commit()
+        self.nb_ajoutes += len(regions)
+
+    def fermer(self):
+        self._db.close()
+
+
+_automate = None
+
+
+def normaliser_sponsors(sponsors):
+    """Minuscules, espaces de bord retirés : aucun mot-clé ne commence ni ne finit par une espace,
+    deux sponsors de même forme normalisée ont donc toujours la même région"""
+    return sponsors.str.strip().str.lower()
+
+
+def classer_sponsors(sponsors, memo=None):
+    """Région de chaque sponsor d'une Series.
+
+    Un seul classement par sponsor normalisé distinct (factorize), diffusé
+    ensuite aux lignes ; avec `memo`, seuls les sponsors jamais vus passent
+    par l'automate (compilé au premier appel).
+    """
+    global _automate
+    if _automate is None:
+        _automate = AutomateRegions()
+
+    codes, distincts = pd.factorize(normaliser_sponsors(sponsors))
+    connues = memo.connues() if memo is not None else {}
+    regions, nouvelles = [], {}
+    for sponsor in distincts:
+        region = connues.get(sponsor)
+        if region is None:
+            region = nouvelles[sponsor] = _automate.regions[_automate.rang(sponsor)]
+        regions.append(region)
+    if memo is not None and nouvelles:
+        memo.ecrire(nouvelles)
+
+    # Code -1 (sponsor absent) -> dernière case : "Unknown"
+    table = np.array(regions + [REGION_INCONNUE], dtype=object)
+    return pd.Series(table[codes], index=sponsors.index, name="Region")
+
+
+def classer_lineaire(sponsor):
+    """Tests `in` un par un sur les tables de REGLES (l'oracle figé est dans regions_origine.py)"""
+    if pd.isna(sponsor):
+        return REGION_INCONNUE
+    sponsor = sponsor.lower()
+    for region, mots in REGLES:
+        if any(mot in sponsor for mot in mots):
+            return region
+    return REGION_AUTRE
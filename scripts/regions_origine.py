@@ -0,0 +1,594 @@
+"""
+Copie figée de extract_country_region, la classification par région de
+3_Nettoyage.py avant scripts/regions.py (chaîne de if/elif et tests `in`).
+
+Ne pas modifier : c'est l'oracle des mesures (python scripts/benchmarks.py
+regions), qui vérifient que l'automate donne la même région que ce code,
+indépendamment des tables de regions.py.
+"""
+
+import pandas as pd
+
+
+# Dictionnaire de mapping pour identifier les pays/régions
+def extract_country_region(sponsor):
+    """Extrait le pays/région depuis le sponsor"""
+    if pd.isna(sponsor):
+        return "Unknown"
+
+    sponsor = sponsor.lower()
+
+    # USA - hôpitaux et institutions
+    usa_keywords = [
+        "united states",
+        "usa",
+        "u.s.",
+        "texas",
+        "california",
+        "new york",
+        "massachusetts",
+        "florida",
+        "ohio",
+        "pennsylvania",
+        "maryland",
+        "michigan",
+        "north carolina",
+        "washington",
+        "arizona",
+        "georgia",
+        "boston",
+        "harvard",
+        "yale",
+        "stanford",
+        "duke",
+        "johns hopkins",
+        "mayo clinic",
+        "cleveland clinic",
+        "md anderson",
+        "m.d. anderson",
+        "memorial sloan",
+        "dana-farber",
+        "national cancer institute",
+        "nci",
+        "nih",
+        "national institutes of health",
+        "wake forest",
+        "case comprehensive",
+        "city of hope",
+        "weill cornell",
+        "columbia university",
+        "vanderbilt",
+        "emory",
+        "kaiser permanente",
+        "adventhealth",
+        "moffitt cancer",
+        "abramson cancer",
+        "university of arkansas",
+        "university of colorado",
+        "precog",
+        "alliance for clinical trials",
+        "eastern cooperative oncology",
+        "swog cancer",
+        "children's oncology group",
+        "henry ford",
+        "dartmouth",
+        "utah",
+        "indiana",
+        "alabama",
+        "kentucky",
+        "tennessee",
+        "minnesota",
+        "wisconsin",
+        "iowa",
+        "nanospectra",
+        "cougar biotechnology",
+        "galvanize therapeutics",
+        "everest detection",
+        "integro theranostics",
+        "phenomapper",
+        "jonsson comprehensive",
+        "ucla",
+        "us oncology",
+        "baylor",
+        "methodist health",
+        "seagen",
+        "novian health",
+        "tigris pharmaceuticals",
+        "university of nebraska",
+        "university of illinois",
+        "va office",
+        "cmx research",
+        "aragon pharmaceuticals",
+        "exosome diagnostics",
+        "ohsu knight",
+        "roswell park",
+        "syndax pharmaceuticals",
+        "adenocyte",
+        "curium",
+        "bastyr university",
+        "tulane university",
+        "gtx",
+        "gaad medical",
+        "oncomed pharmaceuticals",
+        "mereo biopharma",
+        "georgetown university",
+        "rutgers",
+        "brigham and women",
+        "state university of new york",
+        "suny",
+        "university of california",
+        "baptist health",
+        "christian hospital",
+        "novarx",
+        "broncus technologies",
+        "menssana research",
+        "ka imaging",
+        "auris health",
+        "c. r. bard",
+        "mirati therapeutics",
+        "csa medical",
+        "university of vermont",
+        "thomas jefferson university",
+        "sharp healthcare",
+        "schiffler cancer center",
+        "university of pittsburgh",
+        "university of missouri",
+        "national center for plastic surgery",
+        "hibercell",
+        "bhr pharma",
+        "enzon pharmaceuticals",
+        "aegera therapeutics",
+    ]
+
+    # USA - Big Pharma avec siège US
+    usa_pharma = [
+        "merck sharp",
+        "msd",
+        "eli lilly",
+        "pfizer",
+        "johnson & johnson",
+        "janssen",
+        "bristol-myers",
+        "bms",
+        "amgen",
+        "celgene",
+        "abbvie",
+        "gilead",
+        "abbott",
+        "koning corporation",
+    ]
+
+    # Europe - hôpitaux et institutions
+    europe_keywords = [
+        "united kingdom",
+        "uk",
+        "england",
+        "scotland",
+        "wales",
+        "london",
+        "oxford",
+        "cambridge",
+        "manchester",
+        "glasgow",
+        "edinburgh",
+        "southampton nhs",
+        "bristol nhs",
+        "nhs foundation",
+        "france",
+        "french",
+        "paris",
+        "lyon",
+        "marseille",
+        "foch",
+        "tours",
+        "amiens",
+        "paoli-calmettes",
+        "institut de cancérologie",
+        "institut curie",
+        "centre leon berard",
+        "centre hospitalier universitaire de nice",
+        "chu nice",
+        "chu besancon",
+        "chu toulouse",
+        "hospital, toulouse",
+        "hospital, brest",
+        "unicancer",
+        "germany",
+        "german",
+        "berlin",
+        "munich",
+        "heidelberg",
+        "tuebingen",
+        "tübingen",
+        "medac gmbh",
+        "italy",
+        "italian",
+        "rome",
+        "milan",
+        "european institute of oncology",
+        "regina elena",
+        "link campus",
+        "fondazione del piemonte",
+        "fondazione piemonte",
+        "spain",
+        "spanish",
+        "madrid",
+        "barcelona",
+        "granada",
+        "pethema",
+        "grupo espanol",
+        "netherlands",
+        "dutch",
+        "amsterdam",
+        "rotterdam",
+        "radboud",
+        "maastricht university",
+        "groningen",
+        "belgium",
+        "brussels",
+        "leuven",
+        "ku leuven",
+        "universitaire ziekenhuizen",
+        "gasthuisberg",
+        "jules bordet",
+        "switzerland",
+        "swiss",
+        "zurich",
+        "geneva",
+        "sweden",
+        "stockholm",
+        "region stockholm",
+        "denmark",
+        "copenhagen",
+        "herlev",
+        "aalborg",
+        "norway",
+        "norwegian",
+        "oslo",
+        "st. olavs",
+        "trondheim",
+        "finland",
+        "helsinki",
+        "austria",
+        "vienna",
+        "otto wagner",
+        "portugal",
+        "lisbon",
+        "leiria",
+        "instituto politécnico",
+        "ireland",
+        "dublin",
+        "poland",
+        "silesia",
+        "czech",
+        "greece",
+        "trakya university",
+        "european lung cancer",
+        "montpellier",
+        "antoine lacassagne",
+        "nantes university",
+        "nantes hospital",
+        "institut bergonié",
+        "bergonie",
+        "henri becquerel",
+        "becquerel",
+        "besancon",
+        "chu besançon",
+        "technische universität",
+        "technische universitat",
+        "dresden",
+        "cliniques universitaires saint-luc",
+        "université catholique de louvain",
+        "universite catholique",
+        "cell medica",
+        "medsir",
+        "institut fuer frauengesundheit",
+        "wissenschaftliches institut bethanien",
+        "naestved hospital",
+        "næstved",
+        "tampere university",
+        "fundació institut de recerca",
+        "fundacio",
+        "sant pau",
+        "santa creu",
+        "irccs",
+        "sacro cuore",
+        "negrar",
+        "ente ospedaliero",
+        "galliera",
+        "tethis",
+        "frisius medisch centrum",
+        "bozok university",
+        "oslo university hospital",
+        "university of hull",
+        "hellenic cooperative oncology",
+        "trans tasman",
+        "grupo oncologico italia meridionale",
+        "baselşehir",
+        "hacettepe university",
+        "maltepe university",
+        "institut universitaire de cardiologie",
+        "quebec",
+        "laval",
+        "assistance publique",
+        "hopitaux de paris",
+        "hôpitaux de paris",
+        "medical university of vienna",
+        "oncology center of biochemical",
+        "sheba medical center",
+        "national institute for tuberculosis",
+        "spanish lung cancer group",
+        "institut de cancérologie de la loire",
+        "university of bristol",
+        "hospital, limoges",
+        "limoges",
+        "aarhus university hospital",
+        "aarhus",
+        "biocruces bizkaia",
+        "cantonal hospital of st. gallen",
+        "st. gallen",
+        "umeå university",
+        "umea",
+        "pantarhei oncology",
+        "maria sklodowska-curie",
+        "sklodowska",
+        "debiopharm",
+        "danish cancer society",
+        "institut rafael",
+        "region skane",
+        "skåne",
+        "istituto clinico humanitas",
+        "humanitas",
+        "ab-ct",
+        "advanced breast-ct",
+        "siemens healthcare",
+        "centre hospitalier emile roux",
+        "neutec pharma",
+        "pulsion medical",
+        "pierre fabre medicament",
+        "karolinska institutet",
+        "karolinska",
+    ]
+
+    # Europe - Big Pharma
+    europe_pharma = [
+        "novartis",
+        "roche",
+        "hoffmann-la roche",
+        "sanofi",
+        "glaxosmithkline",
+        "gsk",
+        "astrazeneca",
+        "bayer",
+        "boehringer",
+        "servier",
+        "ipsen",
+        "astellas",
+    ]
+
+    # Asie - hôpitaux et institutions
+    asia_keywords = [
+        "china",
+        "chinese",
+        "beijing",
+        "peking union",
+        "peking university",
+        "shanghai",
+        "ruijin hospital",
+        "renji hospital",
+        "chest hospital",
+        "guangzhou",
+        "guangdong",
+        "fuda cancer",
+        "tianjin medical",
+        "sichuan",
+        "fuzhou general",
+        "guang'anmen",
+        "tongji hospital",
+        "hong kong polytechnic",
+        "hong kong",
+        "fudan university",
+        "sun yat-sen",
+        "xi'an jiaotong",
+        "xian jiaotong",
+        "nanjing drum tower",
+        "hangzhou",
+        "chongqing",
+        "tang-du hospital",
+        "zhejiang",
+        "wonju severance",
+        "severance hospital",
+        "chandigarh",
+        "post graduate institute of medical education",
+        "assiut university",
+        "taipei medical university",
+        "national taipei university",
+        "seoul st. mary",
+        "bundang hospital",
+        "china medical university hospital",
+        "affiliated cancer hospital",
+        "guangzhou medical university",
+        "shanghai pulmonary hospital",
+        "beijing tongren hospital",
+        "central south university",
+        "chinese alliance against lung cancer",
+        "jiangsu hengrui medicine",
+        "innovent biologics",
+        "guangzhou fineimmune",
+        "jiangsu shengdiya",
+        "shanghai zhongshan hospital",
+        "first people's hospital of lianyungang",
+        "nantong university",
+        "air force military medical university",
+        "xiamen university",
+        "tianjin medical university second hospital",
+        "fakultas kedokteran universitas indonesia",
+        "japan",
+        "shenzhen gene health",
+        "shenzhen",
+        "swami rama cancer hospital",
+        "xijing hospital",
+        "qilu hospital of shandong university",
+        "shandong university",
+        "vardhman mahavir medical college",
+        "safdarjung hospital",
+        "olive healthcare",
+        "nippon kayaku",
+        "aryogen pharmed",
+        "japanese",
+        "tokyo",
+        "osaka",
+        "kyoto",
+        "japan clinical oncology",
+        "south korea",
+        "korea",
+        "korean",
+        "seoul",
+        "yonsei",
+        "samsung medical",
+        "asan medical",
+        "chonnam national",
+        "india",
+        "indian",
+        "mumbai",
+        "delhi",
+        "bangalore",
+        "lahore",
+        "ain shams",
+        "tata memorial",
+        "singapore",
+        "taiwan",
+        "national taiwan",
+        "chang gung",
+        "thailand",
+        "malaysia",
+        "philippines",
+        "indonesia",
+        "vietnam",
+        "pakistan",
+    ]
+
+    # Asie - Pharma
+    asia_pharma = [
+        "ethicon",
+        "rgene corporation",
+        "foresee pharmaceuticals",
+        "shanghai youhe",
+        "daiichi sankyo",
+        "takeda",
+        "chia tai tianqing",
+        "primo biotechnology",
+        "qilu pharmaceutical",
+    ]
+
+    # Moyen-Orient
+    middle_east_keywords = [
+        "israel",
+        "tel aviv",
+        "jerusalem",
+        "saudi",
+        "emirates",
+        "dubai",
+        "qatar",
+        "turkey",
+        "istanbul",
+        "iran",
+        "egypt",
+        "cairo",
+        "tunisian",
+        "tunisia",
+        "zagazig",
+        "rabin medical center",
+        "kasr el aini hospital",
+    ]
+
+    # Amérique Latine
+    latin_america_keywords = [
+        "brazil",
+        "brazilian",
+        "sao paulo",
+        "são paulo",
+        "instituto do cancer do estado",
+        "instituto brasileiro de controle do cancer",
+        "rio",
+        "hospital israelita albert einstein",
+        "latin american cooperative oncology",
+        "lacog",
+        "mexico",
+        "mexican",
+        "argentina",
+        "buenos aires",
+        "chile",
+        "colombia",
+        "peru",
+        "venezuela",
+        "universidade estadual paulista",
+        "paulista",
+        "julio de mesquita",
+    ]
+
+    # Océanie
+    oceania_keywords = [
+        "australia",
+        "australian",
+        "sydney",
+        "melbourne",
+        "new zealand",
+        "auckland",
+        "university of sydney",
+        "royal north shore",
+    ]
+
+    # Canada
+    canada_keywords = [
+        "canada",
+        "canadian",
+        "toronto",
+        "montreal",
+        "vancouver",
+        "quebec",
+        "ontario",
+        "alberta",
+        "british columbia",
+        "london health sciences",
+        "lawson research",
+        "mcmaster university",
+        "ottawa hospital",
+    ]
+
+    # Pharma/Biotech multinationales (à classifier selon siège social)
+    multinational_companies = {
+        "clarity pharmaceuticals": "Oceania",  # Australie
+        "impact biotech": "Europe",  # Israel
+        "rarecells diagnostics": "Europe",  # France
+        "dacima consulting": "Middle East",  # Tunisie
+    }
+
+    # Vérifier d'abord les compagnies multinationales spécifiques
+    for company, region in multinational_companies.items():
+        if company in sponsor:
+            return region
+
+    # Vérifier dans l'ordre
+    if any(keyword in sponsor for keyword in usa_keywords) or any(
+        keyword in sponsor for keyword in usa_pharma
+    ):
+        return "USA"
+    elif any(keyword in sponsor for keyword in canada_keywords):
+        return "Canada"
+    elif any(keyword in sponsor for keyword in europe_keywords) or any(
+        keyword in sponsor for keyword in europe_pharma
+    ):
+        return "Europe"
+    elif any(keyword in sponsor for keyword in asia_keywords) or any(
+        keyword in sponsor for keyword in asia_pharma
+    ):
+        return "Asia"
+    elif any(keyword in sponsor for keyword in middle_east_keywords):
+        return "Middle East"
+    elif any(keyword in sponsor for keyword in latin_america_keywords):
+        return "Latin America"
+    elif any(keyword in sponsor for keyword in oceania_keywords):
+        return "Oceania"
+    else:
+        return "Other"
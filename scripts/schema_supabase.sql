@@ -0,0 +1,24 @@
+-- Tables et colonnes ajoutées au schéma Supabase, à exécuter une fois dans l'éditeur SQL
+-- avant 4_Supabase.py (instructions idempotentes)
+
+-- Colonnes de détail des essais (phase, effectif, dates, conditions, interventions, pays)
+
+ALTER TABLE clinical_trials
+    ADD COLUMN IF NOT EXISTS cancers TEXT,
+    ADD COLUMN IF NOT EXISTS phase TEXT,
+    ADD COLUMN IF NOT EXISTS enrollment INTEGER,
+    ADD COLUMN IF NOT EXISTS start_date TEXT,
+    ADD COLUMN IF NOT EXISTS completion_date TEXT,
+    ADD COLUMN IF NOT EXISTS conditions TEXT,
+    ADD COLUMN IF NOT EXISTS intervention_type TEXT,
+    ADD COLUMN IF NOT EXISTS countries TEXT;
+
+-- Série annuelle des publications PubMed (2_ApiSearch.py --series, puis 3_Nettoyage.py)
+CREATE TABLE IF NOT EXISTS publications_by_year (
+    cancer TEXT,
+    year INTEGER,
+    publications INTEGER,
+    mortality_2022 DOUBLE PRECISION,
+    publications_per_1000_deaths DOUBLE PRECISION,
+    PRIMARY KEY (cancer, year)
+);
@@ -0,0 +1,87 @@
+"""
+Serveur local qui rejoue des réponses HTTP enregistrées.
+
+Sert de doublure à l'API ClinicalTrials.gov pour tester le moteur HTTP
+sans réseau :
+
+    python scripts/serveur_local.py --dossier data/enregistrements --port 8765
+    CTGOV_API_URL=http://127.0.0.1:8765/api/v2 python scripts/1_Scrapping.py --moteur http
+
+Avec --source, les requêtes inconnues sont relayées vers le vrai serveur
+et leur réponse est enregistrée pour les prochaines fois.
+"""
+
+import os
+import argparse
+import threading
+from urllib.parse import urlsplit, parse_qsl, urlencode, quote
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import requests
+
+
+def cle_requete(chemin):
+    """Nom de fichier stable pour une requête (paramètres triés)"""
+    morceaux = urlsplit(chemin)
+    params = urlencode(sorted(parse_qsl(morceaux.query, keep_blank_values=True)))
+    cle = morceaux.path + ("?" + params if params else "")
+    return quote(cle, safe="") + ".json"
+
+
+def creer_serveur(dossier, port=0, source=None):
+    """Crée le serveur (port=0 : port libre choisi par le système)"""
+    os.makedirs(dossier, exist_ok=True)
+
+    class Gestionnaire(BaseHTTPRequestHandler):
+        def do_GET(self):
+            fichier = os.path.join(dossier, cle_requete(self.path))
+
+            if not os.path.exists(fichier) and source:
+                reponse = requests.get(source.rstrip("/") + self.path, timeout=30)
+                if reponse.status_code == 200:
+                    with open(fichier, "wb") as f:
+                        f.write(reponse.content)
+
+            if not os.path.exists(fichier):
+                self.send_error(404, "Réponse non enregistrée")
+                return
+
+            with open(fichier, "rb") as f:
+                contenu = f.read()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(contenu)))
+            self.end_headers()
+            self.wfile.write(contenu)
+
+        def log_message(self, format, *args):
+            pass
+
+    return ThreadingHTTPServer(("127.0.0.1", port), Gestionnaire)
+
+
+def demarrer_en_arriere_plan(dossier, source=None):
+    """Lance le serveur dans un thread et renvoie (serveur, url_de_base)"""
+    serveur = creer_serveur(dossier, source=source)
+    threading.Thread(target=serveur.serve_forever, daemon=True).start()
+    hote, port = serveur.server_address
+    return serveur, f"http://{hote}:{port}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rejoue des réponses HTTP enregistrées")
+    parser.add_argument("--dossier", default="data/enregistrements")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--source",
+        default=None,
+        help="Serveur réel à interroger (et enregistrer) si une réponse manque, ex: https://clinicaltrials.gov",
+    )
+    args = parser.parse_args()
+
+    serveur = creer_serveur(args.dossier, args.port, args.source)
+    print(f"🎞️  Serveur local sur http://127.0.0.1:{args.port} (dossier {args.dossier})")
+    try:
+        serveur.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Serveur arrêté.")
@@ -0,0 +1,178 @@
+"""
+Doublure locale des E-utilities NCBI, pour tester le client PubMed sans réseau :
+
+    python scripts/serveur_pubmed.py --port 8766 --taux-erreur 0.05
+    PUBMED_EUTILS_URL=http://127.0.0.1:8766/entrez/eutils python scripts/2_ApiSearch.py
+
+Les nombres de résultats sont déterministes (dérivés du terme et de la
+fenêtre de dates). Le quota NCBI est appliqué comme par le vrai service :
+au-delà de 3 requêtes par seconde (10 avec api_key), réponse 429 "API rate
+limit exceeded". usehistory=y enregistre la recherche (WebEnv) ; efetch en
+renvoie les notices XML, dans la limite des 9 999 premières.
+"""
+
+import json
+import time
+import zlib
+import random
+import argparse
+import datetime
+import threading
+from xml.sax.saxutils import escape
+from collections import deque
+from urllib.parse import urlsplit, parse_qs
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+CHEMIN = "/entrez/eutils"
+LIMITE_HISTORIQUE = 9999
+MESH = ["Humans", "Female", "Male", "Middle Aged", "Aged", "Neoplasms", "Prognosis", "Immunotherapy"]
+
+
+def nombre_resultats(term):
+    """Nombre de publications simulé, stable pour un même terme"""
+    return 1000 + zlib.crc32(term.encode("utf-8")) % 50000
+
+
+def nombre_fenetre(term, mindate, maxdate):
+    """Nombre sur une fenêtre de dates : nombre annuel au prorata des jours couverts"""
+    debut = datetime.datetime.strptime(mindate, "%Y/%m/%d").date()
+    fin = datetime.datetime.strptime(maxdate, "%Y/%m/%d").date()
+    return nombre_resultats(term + mindate[:4]) * ((fin - debut).days + 1) // 365
+
+
+def notice_xml(pmid, annee, rang):
+    """Une notice PubmedArticle simulée (titre avec balise, résumé structuré, MeSH)"""
+    mesh = "".join(
+        f'<MeshHeading><DescriptorName UI="D{i:06d}">{MESH[i]}</DescriptorName></MeshHeading>'
+        for i in range(rang % 3, len(MESH), 3)
+    )
+    return (
+        f"<PubmedArticle><MedlineCitation><PMID Version=\"1\">{pmid}</PMID><Article>"
+        f"<Journal><JournalIssue><PubDate><Year>{annee}</Year></PubDate></JournalIssue>"
+        f"<Title>Journal {rang % 40}</Title></Journal>"
+        f"<ArticleTitle>Study {pmid} of <i>tumour</i> response &amp; survival</ArticleTitle>"
+        f'<Abstract><AbstractText Label="BACKGROUND">Background of {pmid}.</AbstractText>'
+        f'<AbstractText Label="RESULTS">Results {escape("p < 0.05")}.</AbstractText></Abstract>'
+        f"</Article><MeshHeadingList>{mesh}</MeshHeadingList></MedlineCitation>"
+        f"<PubmedData><PublicationStatus>ppublish</PublicationStatus></PubmedData></PubmedArticle>"
+    )
+
+
+def creer_serveur(port=0, taux_erreur=0.0):
+    """Crée le serveur (port=0 : port libre choisi par le système)"""
+    verrou = threading.Lock()
+    requetes = {}  # clé API (ou "") -> dates des requêtes de la dernière seconde
+    historique = {}  # WebEnv -> (terme, mindate, nombre)
+
+    class Gestionnaire(BaseHTTPRequestHandler):
+        def _repondre(self, code, contenu, type_contenu="application/json"):
+            if isinstance(contenu, (dict, list)):
+                contenu = json.dumps(contenu).encode("utf-8")
+            self.send_response(code)
+            self.send_header("Content-Type", type_contenu)
+            self.send_header("Content-Length", str(len(contenu)))
+            self.end_headers()
+            self.wfile.write(contenu)
+
+        def _quota_depasse(self, cle):
+            limite = 10 if cle else 3
+            maintenant = time.monotonic()
+            with verrou:
+                dates = requetes.setdefault(cle, deque())
+                while dates and maintenant - dates[0] >= 1.0:
+                    dates.popleft()
+                dates.append(maintenant)
+                return len(dates) > limite, limite
+
+        def do_GET(self):
+            morceaux = urlsplit(self.path)
+            params = {k: v[-1] for k, v in parse_qs(morceaux.query).items()}
+            serveur.nb_requetes += 1
+
+            depasse, limite = self._quota_depasse(params.get("api_key", ""))
+            if depasse:
+                serveur.nb_refus_quota += 1
+                self._repondre(429, {"error": "API rate limit exceeded", "limit": str(limite)})
+                return
+            if random.random() < taux_erreur:
+                self._repondre(503, {"error": "Service temporarily unavailable"})
+                return
+
+            if morceaux.path == f"{CHEMIN}/esearch.fcgi":
+                self._repondre(200, self.esearch(params))
+            elif morceaux.path == f"{CHEMIN}/efetch.fcgi":
+                self._repondre(200, self.efetch(params), "text/xml")
+            else:
+                self._repondre(404, {"error": f"Outil inconnu : {morceaux.path}"})
+
+        def esearch(self, params):
+            term = params.get("term", "")
+            if not term:
+                return {"esearchresult": {"ERROR": "Empty term and query_key - nothing todo"}}
+            if params.get("mindate"):
+                nombre = nombre_fenetre(term, params["mindate"], params.get("maxdate", params["mindate"]))
+            else:
+                nombre = nombre_resultats(term)
+            resultat = {
+                "count": str(nombre),
+                "retmax": "0",
+                "retstart": "0",
+                "idlist": [],
+                "querytranslation": term,
+            }
+            if params.get("usehistory") == "y":
+                webenv = f"MCID_{random.getrandbits(48):012x}"
+                with verrou:
+                    historique[webenv] = (term, params.get("mindate", ""), nombre)
+                resultat.update({"webenv": webenv, "querykey": "1"})
+            return {"header": {"type": "esearch", "version": "0.3"}, "esearchresult": resultat}
+
+        def efetch(self, params):
+            with verrou:
+                recherche = historique.get(params.get("WebEnv"))
+            if recherche is None or params.get("query_key") != "1":
+                return b"<eFetchResult><ERROR>Unable to obtain query #1</ERROR></eFetchResult>"
+            term, mindate, nombre = recherche
+            debut = int(params.get("retstart", 0))
+            if debut >= LIMITE_HISTORIQUE + 1:
+                return b"<eFetchResult><ERROR>Search Backend failed: retstart cannot be larger than 9998</ERROR></eFetchResult>"
+            fin = min(debut + int(params.get("retmax", 20)), nombre, LIMITE_HISTORIQUE)
+
+            # PMID stables par (terme, fenêtre) ; année tirée de mindate
+            base = 10_000_000 + zlib.crc32((term + mindate).encode("utf-8")) % 10_000 * 10_000
+            annee = mindate[:4] or "2024"
+            notices = "".join(notice_xml(base + rang, annee, rang) for rang in range(debut, fin))
+            return (
+                '<?xml version="1.0" ?>\n<!DOCTYPE PubmedArticleSet>\n'
+                f"<PubmedArticleSet>{notices}</PubmedArticleSet>"
+            ).encode("utf-8")
+
+        def log_message(self, format, *args):
+            pass
+
+    serveur = ThreadingHTTPServer(("127.0.0.1", port), Gestionnaire)
+    serveur.nb_requetes = 0
+    serveur.nb_refus_quota = 0
+    return serveur
+
+
+def demarrer_en_arriere_plan(taux_erreur=0.0):
+    """Lance le serveur dans un thread et renvoie (serveur, url_des_eutils)"""
+    serveur = creer_serveur(taux_erreur=taux_erreur)
+    threading.Thread(target=serveur.serve_forever, daemon=True).start()
+    hote, port = serveur.server_address
+    return serveur, f"http://{hote}:{port}{CHEMIN}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Doublure locale des E-utilities NCBI")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--taux-erreur", type=float, default=0.0, help="Part de réponses 503 aléatoires")
+    args = parser.parse_args()
+
+    serveur = creer_serveur(args.port, args.taux_erreur)
+    print(f"🧪 E-utilities locales sur http://127.0.0.1:{args.port}{CHEMIN}")
+    try:
+        serveur.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Serveur arrêté.")
@@ -0,0 +1,90 @@
+"""
+Sorties de data_clean/ en CSV et en Parquet typé :
+
+    ecrire_sortie(df, "data_clean/nci_budget_2023.csv", {"Cancer": "categorie", "Budget_2023_Million_USD": "reel"})
+    df = lire_sortie("data_clean/nci_budget_2023.csv")
+
+Le CSV reste le format d'échange (dépôt, Supabase). Le Parquet à côté
+(même nom, extension .parquet) garde le schéma : colonnes répétées (Cancer,
+Status, Phase...) en catégories, comptes en entiers, budgets et ratios en
+réels. lire_sortie le préfère au CSV quand il est présent et à jour : pas
+de nouvelle inférence des types, moins de mémoire. Sans pyarrow, seul le
+CSV est écrit et lu. Mesures : python scripts/benchmarks.py sorties.
+"""
+
+import os
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+# Types logiques des schémas -> types Arrow
+if pa is not None:
+    TYPES = {
+        "categorie": pa.dictionary(pa.int32(), pa.string()),
+        "texte": pa.string(),
+        "entier": pa.int64(),
+        "entier16": pa.int16(),
+        "reel": pa.float64(),
+    }
+
+
+def chemin_parquet(chemin_csv):
+    """data_clean/x.csv -> data_clean/x.parquet"""
+    return os.path.splitext(chemin_csv)[0] + ".parquet"
+
+
+# ==========================================
+# 💾 ÉCRITURE
+# ==========================================
+def table_typee(df, types):
+    """Table Arrow du DataFrame, colonnes listées dans `types` converties (les autres inférées)"""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for nom, type_logique in types.items():
+        if nom not in table.column_names:
+            continue
+        colonne = table[nom]
+        if colonne.null_count == len(colonne):
+            # Colonne vide (détail absent d'un ancien scraping) : aucune valeur à convertir
+            colonne = pa.nulls(len(colonne), TYPES[type_logique])
+        else:
+            # Conversion sûre : un réel non entier dans une colonne "entier" lève une erreur
+            colonne = colonne.cast(TYPES[type_logique])
+        table = table.set_column(table.column_names.index(nom), nom, colonne)
+    # Sans les métadonnées pandas : les types relus ne dépendent que du schéma Arrow
+    return table.replace_schema_metadata(None)
+
+
+def ecrire_sortie(df, chemin_csv, types, index=False):
+    """Écrit le CSV (inchangé) et, avec pyarrow, le Parquet typé à côté.
+
+    index=True : l'index (ex: Cancer d'un tableau croisé) devient une
+    colonne du Parquet, comme à la relecture du CSV.
+    """
+    df.to_csv(chemin_csv, index=index)
+    if pa is None:
+        return
+    if index:
+        df = df.reset_index()
+        df.columns = [str(nom) for nom in df.columns]
+    chemin = chemin_parquet(chemin_csv)
+    temporaire = chemin + ".tmp"
+    pq.write_table(table_typee(df, types), temporaire, compression="zstd")
+    os.replace(temporaire, chemin)
+
+
+# ==========================================
+# 📖 LECTURE
+# ==========================================
+def lire_sortie(chemin_csv, colonnes=None):
+    """DataFrame d'une sortie : Parquet typé s'il existe et n'est pas plus ancien que le CSV, sinon CSV"""
+    chemin = chemin_parquet(chemin_csv)
+    if pq is not None and os.path.exists(chemin) and (
+        not os.path.exists(chemin_csv) or os.path.getmtime(chemin) >= os.path.getmtime(chemin_csv)
+    ):
+        return pq.read_table(chemin, columns=colonnes).to_pandas()
+    return pd.read_csv(chemin_csv, usecols=colonnes)